@@ -0,0 +1,81 @@
+"""
+Benchmark: Cursor animation throughput on the in-memory RecordingCursor.
+
+Needs no display, so it runs in CI. `--latency-ms` simulates the per-call
+cost of a real backend (e.g. ~2 ms for an xdotool fork).
+
+    python -m benchmarks.cursor_animation [--latency-ms 0] [--frame-rate 120]
+"""
+
+import argparse
+import math
+import sys
+import time
+
+from cursor import create_cursor
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--frame-rate", type=int, default=120)
+    parser.add_argument("--move-speed", type=float, default=4000.0)
+    parser.add_argument("--scroll-speed", type=float, default=300.0)
+    args = parser.parse_args()
+
+    cur = create_cursor(
+        move_px_per_sec=args.move_speed,
+        frame_rate=args.frame_rate,
+        scroll_units_per_sec=args.scroll_speed,
+        backend="recording",
+    )
+    cur.latency_sec = args.latency_ms / 1000.0
+
+    t0 = time.perf_counter()
+    for x, y in ((1800, 1000), (100, 100), (960, 540)):
+        cur.move_to_with_speed(x, y)
+    move_elapsed = time.perf_counter() - t0
+    moves = cur.summary()
+    print(
+        f"move_to_with_speed: {moves['move']} set_pos in {move_elapsed:.3f} s "
+        f"({moves['move'] / move_elapsed:.0f}/s, target {args.frame_rate}/s)"
+    )
+
+    cur.clear()
+    stats = cur.scroll_with_speed(300)
+    print(
+        f"scroll_with_speed:  {stats.units} units in {stats.calls} calls, "
+        f"{stats.achieved_units_per_sec:.0f} units/s (target {stats.target_units_per_sec:.0f})"
+    )
+
+    # Short scrolls: every unit is sent, and the reported rate is the target
+    # rate quantised to the frame rate (the last batch waits for its frame).
+    frame = 1.0 / args.frame_rate
+    slot = 1.0 / args.scroll_speed
+    for units in (1, 2, 3, 5, 10):
+        cur.clear()
+        stats = cur.scroll_with_speed(-units)
+        last_batch = math.ceil((units - 1) * slot / frame - 1e-9) * frame
+        expected = units / (last_batch + slot)
+        sent = -cur.summary()["scroll_units"]
+        print(f"  {units:2d} units: {stats.achieved_units_per_sec:5.0f} units/s (frame-quantised {expected:5.0f}), {sent} sent")
+        if sent != units or abs(stats.achieved_units_per_sec - expected) > 0.15 * expected:
+            raise AssertionError(f"scroll of {units} units reported {stats} against {expected:.0f} units/s")
+
+    cur.clear()
+    cur.move_external(0, 0)
+    cur.invalidate_bounds()
+    t0 = time.perf_counter()
+    frames = 0
+    while time.perf_counter() - t0 < 1.0:
+        cur.step_towards(1900, 1000)
+        frames += 1
+    steps = cur.summary()
+    print(f"step_towards:       {steps['move']} moves from {frames} calls in 1 s")
+    print(f"shadow position:    {cur.shadow_stats()}")
+    print(f"bounds cache:       {cur.bounds_cache_stats()}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
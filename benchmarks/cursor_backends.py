@@ -0,0 +1,122 @@
+"""
+Benchmark: xdotool (LinuxCursor) vs persistent XTest connection (LinuxXTestCursor).
+
+Runs against a private Xvfb server so it works headless and never moves the
+real pointer. Requires `Xvfb`, `xdotool`, `xrandr` and `python-xlib`.
+
+    python -m benchmarks.cursor_backends [--iterations 500] [--display :99]
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import time
+
+
+def start_xvfb(display: str, width: int = 1920, height: int = 1080) -> subprocess.Popen:
+    if shutil.which("Xvfb") is None:
+        raise RuntimeError("Xvfb not found; install the xvfb package")
+
+    proc = subprocess.Popen(
+        ["Xvfb", display, "-screen", "0", f"{width}x{height}x24", "-nolisten", "tcp"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    socket_path = f"/tmp/.X11-unix/X{display.lstrip(':')}"
+    deadline = time.perf_counter() + 5.0
+    while not os.path.exists(socket_path):
+        if proc.poll() is not None or time.perf_counter() > deadline:
+            proc.kill()
+            raise RuntimeError(f"Xvfb failed to start on {display}")
+        time.sleep(0.05)
+    return proc
+
+
+def percentile(samples, p):
+    ordered = sorted(samples)
+    idx = min(len(ordered) - 1, int(round(p / 100.0 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+def time_calls(fn, iterations):
+    samples = []
+    for i in range(iterations):
+        t0 = time.perf_counter()
+        fn(i)
+        samples.append(time.perf_counter() - t0)
+    return samples
+
+
+def bench_backend(name, cur, iterations):
+    minx, miny, maxx, maxy = cur.get_virtual_bounds()
+    w = maxx - minx
+    h = maxy - miny
+
+    results = {
+        "set_pos": time_calls(lambda i: cur.set_pos(minx + (i * 7) % w, miny + (i * 13) % h), iterations),
+        "get_pos": time_calls(lambda i: cur.get_pos(), iterations),
+    }
+
+    # One frame of the head-cursor loop: read position, then move one step.
+    cur.frame_rate = 1_000_000
+    cur._last_step_time = None
+    cur.step_towards(minx, miny)
+    results["step_towards"] = time_calls(
+        lambda i: cur.step_towards(minx + (i * 7) % w, miny + (i * 13) % h), iterations
+    )
+
+    frame_budget_ms = 1000.0 / 120
+    print(f"\n{name}")
+    for op, samples in results.items():
+        mean_ms = 1000.0 * sum(samples) / len(samples)
+        p95_ms = 1000.0 * percentile(samples, 95)
+        print(
+            f"  {op:<13} mean {mean_ms:8.3f} ms   p95 {p95_ms:8.3f} ms   "
+            f"{100.0 * mean_ms / frame_budget_ms:6.1f}% of a 120 fps frame"
+        )
+    shadow = cur.shadow_stats()
+    print(f"  shadow position: {shadow['reads_saved']} backend reads saved, {shadow['backend_reads']} performed")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--display", default=":99", help="Display number for the private Xvfb server")
+    parser.add_argument("--no-xvfb", action="store_true", help="Use the current $DISPLAY instead of Xvfb")
+    args = parser.parse_args()
+
+    if not sys.platform.startswith("linux"):
+        print("This benchmark requires Linux/X11.")
+        return 1
+
+    xvfb = None
+    if not args.no_xvfb:
+        xvfb = start_xvfb(args.display)
+        os.environ["DISPLAY"] = args.display
+
+    try:
+        from cursor.linux import LinuxCursor
+        from cursor.linux_xtest import LinuxXTestCursor
+
+        print(f"DISPLAY={os.environ.get('DISPLAY')}  iterations={args.iterations}")
+        xdotool = bench_backend("xdotool (LinuxCursor)", LinuxCursor(), args.iterations)
+        xtest_cur = LinuxXTestCursor()
+        xtest = bench_backend("XTest (LinuxXTestCursor)", xtest_cur, args.iterations)
+        xtest_cur.close()
+
+        print("\nspeed-up (xdotool mean / XTest mean)")
+        for op in xdotool:
+            speedup = sum(xdotool[op]) / max(1e-12, sum(xtest[op]))
+            print(f"  {op:<13} {speedup:8.1f}x")
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+            xvfb.wait()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+"""
+Benchmark: FaceMesh every frame vs optical flow between inferences.
+
+First checks the rigid fit behind flow frames: the first frame's FaceMesh
+landmarks are rotated in 3D and projected, and the yaw recovered from the
+flow points is compared with the true yaw (and with what keeping the stale
+z would give). Then runs the tracker with `flow_interval` 1 to 4 on the same
+frames and reports how many frames flow carried, process CPU and wall time
+per frame, and the largest angle difference from running FaceMesh on every
+frame. For the synthetic face the angles are also compared with the drawn
+pose.
+
+    python -m benchmarks.flow_tracking [--source synthetic] [--frames 300]
+    python -m benchmarks.flow_tracking --source session.mp4
+"""
+
+import argparse
+import math
+import sys
+import time
+
+import numpy as np
+
+from head_track import HeadPoseTracker, SyntheticFaceSource, open_source
+from head_track.flow import FLOW_LANDMARKS, rigid_fit
+from head_track.geometry import direction_to_angles, forward_vector
+from head_track.pnp import AXIS_LANDMARKS
+
+
+def axis_yaw(landmarks):
+    return direction_to_angles(*forward_vector(*landmarks[AXIS_LANDMARKS].tolist()))[0]
+
+
+def check_rigid_fit(landmarks):
+    landmarks = landmarks.astype(float)
+    tracked = landmarks[FLOW_LANDMARKS]
+    center = tracked.mean(axis=0)
+    print("rigid fit on rotated FaceMesh landmarks (yaw):")
+    for turn in (5.0, 10.0, 20.0):
+        a = math.radians(turn)
+        rot = np.array([[math.cos(a), 0.0, -math.sin(a)], [0.0, 1.0, 0.0], [math.sin(a), 0.0, math.cos(a)]])
+        turned = (landmarks - center) @ rot.T + center
+        scale, rotation, shift, error = rigid_fit(tracked, turned[FLOW_LANDMARKS, :2])
+        moved = landmarks.copy()
+        moved[AXIS_LANDMARKS] = scale * (landmarks[AXIS_LANDMARKS] - center) @ rotation.T
+        moved[AXIS_LANDMARKS, :2] += shift
+        stale_z = np.column_stack([turned[:, :2], landmarks[:, 2]])
+        print(
+            f"  turn {turn:4.1f} deg: true {axis_yaw(turned):6.1f}  fitted {axis_yaw(moved):6.1f}  "
+            f"stale z {axis_yaw(stale_z):6.1f}  fit error {error:.3f} px"
+        )
+
+
+def run(spec, frames, flow_interval):
+    source = open_source(spec, realtime=False)
+    if isinstance(source, SyntheticFaceSource):
+        source.frames = frames
+    tracker = HeadPoseTracker(flow_interval=flow_interval)
+    tracker.start(source)
+    angles = []
+    first_landmarks = None
+    cpu0, wall0 = time.process_time(), time.perf_counter()
+    while len(angles) < frames:
+        _pos, frame, ang = tracker.next_position(1920, 1080)
+        if frame.shape[:2] == (1, 1):
+            break
+        if first_landmarks is None and tracker.landmarks is not None:
+            first_landmarks = tracker.landmarks.copy()
+        angles.append(ang if ang is not None else (np.nan, np.nan))
+    cpu, wall = time.process_time() - cpu0, time.perf_counter() - wall0
+    tracker.stop()
+    return np.array(angles), cpu, wall, tracker.flow_stats(), source, first_landmarks
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--source", default="synthetic", help="Video file, image directory or 'synthetic'")
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--max-interval", type=int, default=4)
+    args = parser.parse_args()
+
+    reference = None
+    for interval in range(1, args.max_interval + 1):
+        angles, cpu, wall, stats, source, landmarks = run(args.source, args.frames, interval)
+        if not len(angles):
+            print("No frames read.")
+            return 1
+        count = len(angles)
+        if reference is None:
+            if landmarks is None:
+                print("No face found.")
+                return 1
+            check_rigid_fit(landmarks)
+            print(f"\n{count} frames")
+            reference = angles
+        diff = np.nanmax(np.abs(angles - reference[:count]), axis=0)
+        line = (
+            f"flow_interval {interval}: inferences {stats['inferences']:4d}  flow frames {stats['flow_frames']:4d}  "
+            f"redetections {stats['redetections']:3d}  cpu {1000.0 * cpu / count:5.2f} ms/frame  "
+            f"wall {1000.0 * wall / count:5.2f} ms/frame  max |d yaw| {diff[0]:4.2f}  max |d pitch| {diff[1]:4.2f} deg"
+        )
+        if isinstance(source, SyntheticFaceSource):
+            found = ~np.isnan(angles[:, 0])
+            truth = np.array([source.pose_at(i) for i in range(count)])[found]
+            # Tracker yaw grows as the head turns towards image left.
+            measured = angles[found] * (-1.0, 1.0)
+            corr = [np.corrcoef(truth[:, k], measured[:, k])[0, 1] for k in (0, 1)]
+            line += f"  vs drawn r {corr[0]:.3f}/{corr[1]:.3f}"
+        print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+"""
+Benchmark: per-frame allocation and throughput of the capture -> flip ->
+BGR-to-RGB pipeline, allocating new arrays vs reusing buffers via `dst`.
+
+Allocation is measured with tracemalloc (NumPy and OpenCV's Python bindings
+report their array allocations to it): for every frame the traced peak is
+reset, and the growth above the starting level is the memory the frame
+allocated transiently. A steady-state value near zero means no churn.
+
+    python -m benchmarks.frame_buffers --video session.mp4 [--frames 300]
+    python -m benchmarks.frame_buffers --camera 0
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+
+import cv2
+import numpy as np
+
+from head_track import HeadPoseTracker
+
+
+def run_pipeline(source, frames, reuse):
+    cap = cv2.VideoCapture(source)
+    if not cap.isOpened():
+        raise RuntimeError(f"Could not open video source {source!r}")
+    raw = flipped = rgb = None
+    per_frame = []
+    count = 0
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    while count < frames:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        if reuse:
+            ok, raw = cap.read(raw)
+            if not ok:
+                break
+            flipped = cv2.flip(raw, 1, dst=flipped)
+            rgb = cv2.cvtColor(flipped, cv2.COLOR_BGR2RGB, dst=rgb)
+        else:
+            ok, raw = cap.read()
+            if not ok:
+                break
+            flipped = cv2.flip(raw, 1)
+            rgb = cv2.cvtColor(flipped, cv2.COLOR_BGR2RGB)
+        _, peak = tracemalloc.get_traced_memory()
+        per_frame.append(peak - before)
+        count += 1
+    elapsed = time.perf_counter() - t0
+    tracemalloc.stop()
+    cap.release()
+    return count, elapsed, np.array(per_frame, dtype=float)
+
+
+def run_tracker(source, frames, reuse):
+    cap = cv2.VideoCapture(source)
+    tracker = HeadPoseTracker(reuse_buffers=reuse)
+    processed = 0
+    while processed < frames:
+        ok, frame = cap.read()
+        if not ok:
+            break
+        tracker.process_frame(frame, 1920, 1080)
+        processed += 1
+    cap.release()
+    return tracker.buffer_stats()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--video", help="Video file to read frames from")
+    parser.add_argument("--camera", type=int, default=0, help="Camera index when --video is not given")
+    parser.add_argument("--frames", type=int, default=300)
+    args = parser.parse_args()
+    source = args.video if args.video else args.camera
+
+    for name, reuse in (("allocate", False), ("reuse dst", True)):
+        count, elapsed, allocated = run_pipeline(source, args.frames, reuse)
+        if count == 0:
+            print("No frames read.")
+            return 1
+        # Skip the first frames: buffers are created on first use.
+        steady = allocated[min(2, count - 1):]
+        print(
+            f"{name:<10} {count} frames  {count / elapsed:8.1f} fps  "
+            f"steady alloc/frame mean {steady.mean() / 1024:9.1f} KiB  max {steady.max() / 1024:9.1f} KiB  "
+            f"=> {steady.mean() * count / elapsed / 2**20:8.1f} MiB/s"
+        )
+
+    stats = run_tracker(source, min(args.frames, 60), True)
+    print(
+        f"tracker reuse_buffers: {stats['buffers']} buffers, {stats['bytes'] / 1024:.0f} KiB, "
+        f"{stats['allocations']} allocations, {stats['reuses']} reuses"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
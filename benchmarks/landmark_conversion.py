@@ -0,0 +1,87 @@
+"""
+Benchmark: per-frame cost of turning a FaceMesh result into landmark arrays.
+
+Compares the previous per-consumer conversions (a float64 array built from
+per-landmark tuples for the pose, plus a list of (x, y) tuples for wink
+detection) with a single fill of the shared float32 `LandmarkArray`, and
+checks that both give the same pixel coordinates.
+
+    python -m benchmarks.landmark_conversion --video session.mp4
+    python -m benchmarks.landmark_conversion --camera 0
+"""
+
+import argparse
+import sys
+import timeit
+
+import cv2
+import mediapipe as mp
+import numpy as np
+
+from head_track import LandmarkArray
+
+
+def first_face(source, max_frames=100):
+    cap = cv2.VideoCapture(source)
+    if not cap.isOpened():
+        raise RuntimeError(f"Could not open video source {source!r}")
+    face_mesh = mp.solutions.face_mesh.FaceMesh(max_num_faces=1, refine_landmarks=True)
+    try:
+        for _ in range(max_frames):
+            ok, frame = cap.read()
+            if not ok:
+                break
+            results = face_mesh.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+            if results.multi_face_landmarks:
+                h, w = frame.shape[:2]
+                return results.multi_face_landmarks[0], w, h
+    finally:
+        cap.release()
+        face_mesh.close()
+    return None, 0, 0
+
+
+def per_consumer(landmark_list, w, h):
+    pts = np.array([(p.x, p.y, p.z) for p in landmark_list.landmark], dtype=float)
+    pts *= (w, h, w)
+    wink = [(lm.x, lm.y) for lm in landmark_list.landmark]
+    return pts, wink
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--video", help="Video file to read frames from")
+    parser.add_argument("--camera", type=int, default=0, help="Camera index when --video is not given")
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    landmark_list, w, h = first_face(args.video if args.video else args.camera)
+    if landmark_list is None:
+        print("No face found.")
+        return 1
+    print(f"{len(landmark_list.landmark)} landmarks at {w}x{h}")
+
+    shared = LandmarkArray()
+    cases = {
+        "per-consumer lists": lambda: per_consumer(landmark_list, w, h),
+        "shared LandmarkArray": lambda: shared.from_landmark_list(landmark_list, 0, 0, w, h),
+    }
+    baseline = None
+    for name, fn in cases.items():
+        fn()
+        usec = 1e6 * timeit.timeit(fn, number=args.repeat) / args.repeat
+        line = f"{name:<22} {usec:8.1f} us/frame"
+        if baseline is None:
+            baseline = usec
+        else:
+            line += f"  speed-up {baseline / usec:5.1f}x"
+        print(line)
+
+    reference, _ = per_consumer(landmark_list, w, h)
+    pixels = shared.from_landmark_list(landmark_list, 0, 0, w, h)
+    print(f"max |difference| {np.abs(pixels - reference).max():.2e} px (float32 vs float64)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
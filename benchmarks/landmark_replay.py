@@ -0,0 +1,127 @@
+"""
+Benchmark: record a session once, then replay its landmarks into the pose
+stage without camera or FaceMesh.
+
+The session comes from a video file, an image directory or the synthetic
+face (default). Replay runs two ways on the memory-mapped recording:
+frame by frame through `HeadPoseTracker.process_landmarks` (the same
+filter and angle code as live tracking; its angles must match the recorded
+ones exactly) and as one `pose_batch` call over the mapped key points.
+The session is recorded with prediction on, and a replay fed the recorded
+latencies must give the same predictions as the live run.
+
+    python -m benchmarks.landmark_replay [--source synthetic] [--frames 300] [--repeat 200]
+    python -m benchmarks.landmark_replay --source session.mp4 --output session.lmk
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from head_track import HeadPoseTracker, LandmarkReplay, SyntheticFaceSource, open_source
+from head_track.geometry import pose_batch
+from head_track.pnp import AXIS_LANDMARKS
+
+SCREEN_W, SCREEN_H = 1920, 1080
+
+
+def prediction_angles(tracker):
+    p = tracker.prediction
+    return (p.yaw, p.pitch) if p is not None else (np.nan, np.nan)
+
+
+def record(source, path, frames):
+    tracker = HeadPoseTracker(record_path=path, predict=True)
+    tracker.start(source)
+    predictions = []
+    t0 = time.perf_counter()
+    while len(predictions) < frames:
+        _pos, frame, _angles = tracker.next_position(SCREEN_W, SCREEN_H)
+        if frame.shape[:2] == (1, 1):
+            break
+        predictions.append(prediction_angles(tracker))
+    elapsed = time.perf_counter() - t0
+    tracker.stop()
+    return np.array(predictions, dtype=float).reshape(-1, 2), elapsed
+
+
+def replay_frames(replay, repeat):
+    tracker = HeadPoseTracker()
+    angles = np.full((len(replay), 2), np.nan)
+    w, h = replay.frame_width, replay.frame_height
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        tracker._filter.reset()
+        for i, (t, landmarks, latency) in enumerate(replay):
+            _pos, ang = tracker.process_landmarks(landmarks, t, w, h, SCREEN_W, SCREEN_H, latency)
+            if ang is not None:
+                angles[i] = ang
+    return angles, (time.perf_counter() - t0) / (repeat * len(replay))
+
+
+def replay_predictions(replay):
+    tracker = HeadPoseTracker(predict=True)
+    predictions = np.full((len(replay), 2), np.nan)
+    w, h = replay.frame_width, replay.frame_height
+    for i, (t, landmarks, latency) in enumerate(replay):
+        tracker.process_landmarks(landmarks, t, w, h, SCREEN_W, SCREEN_H, latency)
+        predictions[i] = prediction_angles(tracker)
+    return predictions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--source", default="synthetic", help="Video file, image directory or 'synthetic'")
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=200, help="Replay passes to time")
+    parser.add_argument("--output", help="Keep the recording at this path")
+    args = parser.parse_args()
+
+    source = open_source(args.source, realtime=False)
+    if isinstance(source, SyntheticFaceSource):
+        source.frames = args.frames
+    path = args.output or os.path.join(tempfile.mkdtemp(), "session.lmk")
+    live_predictions, elapsed = record(source, path, args.frames)
+    count = len(live_predictions)
+    if count == 0:
+        print("No frames read.")
+        return 1
+    replay = LandmarkReplay(path)
+    size = os.path.getsize(path)
+    print(f"recorded {count} frames live in {elapsed:.2f} s ({count / elapsed:.0f} fps), {size / 1024 / 1024:.1f} MiB, {size / count:.0f} B/frame")
+
+    angles, sec = replay_frames(replay, args.repeat)
+    recorded = np.array(replay.angles, dtype=float)
+    face = replay.face.astype(bool)
+    frame_err = np.nanmax(np.abs(angles[face] - recorded[face])) if face.any() else 0.0
+    print(f"replay, pose stage per frame: {1e6 * sec:7.2f} us/frame  {1.0 / sec:12,.0f} fps  max |d angle| vs recorded {frame_err:.1e} deg")
+
+    t0 = time.perf_counter()
+    for _ in range(args.repeat):
+        yaw, pitch = pose_batch(replay.key_points(AXIS_LANDMARKS)[face])
+    sec = (time.perf_counter() - t0) / (args.repeat * face.sum())
+    batch_err = np.abs(np.column_stack([yaw, pitch]) - recorded[face]).max()
+    print(f"replay, batch geometry:       {1e6 * sec:7.2f} us/frame  {1.0 / sec:12,.0f} fps  max |d angle| vs recorded {batch_err:.1e} deg")
+
+    predictions = replay_predictions(replay)
+    latency = replay.latency[face]
+    same_missing = np.array_equal(np.isnan(predictions), np.isnan(live_predictions))
+    predict_err = np.nanmax(np.abs(predictions - live_predictions)) if same_missing and face.any() else np.inf
+    print(
+        f"replay, predictions:          recorded latency {1000.0 * np.mean(latency):5.1f} ms mean  "
+        f"max |d prediction| vs live {predict_err:.1e} deg"
+    )
+
+    ok = frame_err < 1e-3 and predict_err < 1e-3
+    print("replay matches recording" if ok else "MISMATCH")
+    if not args.output:
+        os.remove(path)
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
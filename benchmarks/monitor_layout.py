@@ -0,0 +1,111 @@
+"""
+Benchmark: MonitorLayout lookups vs a linear scan, with an equivalence check.
+
+Builds random layouts (side by side with gaps, stacked, and overlapping
+mirrored outputs), checks `monitor_at` and `clamp` against a brute-force
+`contains` scan over random points in and around each layout, then times
+`monitor_at` against the scan on a wide layout.
+
+    python -m benchmarks.monitor_layout [--layouts 500] [--points 200] [--seed 1]
+"""
+
+import argparse
+import random
+import sys
+import time
+
+from cursor.geometry import Monitor, MonitorLayout
+
+
+def brute_monitor_at(monitors, x, y):
+    return [m for m in monitors if m.contains(x, y)]
+
+
+def brute_clamp(monitors, x, y):
+    if any(m.contains(x, y) for m in monitors):
+        return x, y
+    return min((m.clamp(x, y) for m in monitors), key=lambda p: (p[0] - x) ** 2 + (p[1] - y) ** 2)
+
+
+def random_layout(rng, kind):
+    count = rng.randint(1, 6)
+    monitors = []
+    if kind == "row":
+        # Side by side, with random horizontal gaps and vertical offsets.
+        x = rng.randint(-2000, 0)
+        for i in range(count):
+            w, h = rng.choice([(1920, 1080), (1280, 1024), (2560, 1440), (800, 600)])
+            monitors.append(Monitor(f"m{i}", x, rng.randint(-300, 300), w, h))
+            x += w + rng.choice([0, 0, rng.randint(1, 400)])
+    elif kind == "grid":
+        # Stacked columns, with gaps both ways.
+        for i in range(count):
+            w, h = rng.choice([(1920, 1080), (1280, 1024), (800, 600)])
+            col, row = i % 3, i // 3
+            monitors.append(Monitor(f"m{i}", col * 2000 + rng.randint(0, 200), row * 1200 + rng.randint(0, 200), w, h))
+    else:
+        # Arbitrary rectangles, free to overlap (mirrored or misconfigured outputs).
+        for i in range(count):
+            monitors.append(
+                Monitor(f"m{i}", rng.randint(-1500, 3000), rng.randint(-1000, 2000), rng.randint(1, 2000), rng.randint(1, 1500))
+            )
+    return monitors
+
+
+def check(layouts, points, seed):
+    rng = random.Random(seed)
+    checked = 0
+    for n in range(layouts):
+        kind = ("row", "grid", "overlap")[n % 3]
+        monitors = random_layout(rng, kind)
+        layout = MonitorLayout(monitors)
+        minx, miny, maxx, maxy = layout.bounds
+        for _ in range(points):
+            x = rng.randint(minx - 200, maxx + 200)
+            y = rng.randint(miny - 200, maxy + 200)
+            expected = brute_monitor_at(monitors, x, y)
+            found = layout.monitor_at(x, y)
+            if (found is None) != (not expected) or (found is not None and found not in expected):
+                raise AssertionError(f"monitor_at({x}, {y}) = {found} on {kind} layout {monitors}, expected one of {expected}")
+            cx, cy = layout.clamp(x, y)
+            bx, by = brute_clamp(monitors, x, y)
+            if (cx - x) ** 2 + (cy - y) ** 2 != (bx - x) ** 2 + (by - y) ** 2 or not brute_monitor_at(monitors, cx, cy):
+                raise AssertionError(f"clamp({x}, {y}) = {(cx, cy)} on {kind} layout {monitors}, expected {(bx, by)}")
+            checked += 1
+    return checked
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--layouts", type=int, default=500)
+    parser.add_argument("--points", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--lookups", type=int, default=200_000)
+    args = parser.parse_args()
+
+    checked = check(args.layouts, args.points, args.seed)
+    print(f"equivalence: {checked} points on {args.layouts} layouts match a brute-force contains scan")
+
+    # A wide desktop with gaps, where the scan has to visit most monitors.
+    rng = random.Random(args.seed)
+    monitors = [Monitor(f"m{i}", i * 2000, (i % 2) * 100, 1920, 1080) for i in range(16)]
+    layout = MonitorLayout(monitors)
+    minx, miny, maxx, maxy = layout.bounds
+    pts = [(rng.randint(minx, maxx), rng.randint(miny, maxy)) for _ in range(args.lookups)]
+
+    t0 = time.perf_counter()
+    for x, y in pts:
+        layout.monitor_at(x, y)
+    indexed = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for x, y in pts:
+        next((m for m in monitors if m.contains(x, y)), None)
+    scan = time.perf_counter() - t0
+    print(f"{len(monitors)} monitors, {args.lookups} lookups")
+    print(f"  monitor_at   {1e6 * indexed / args.lookups:6.2f} us per lookup")
+    print(f"  linear scan  {1e6 * scan / args.lookups:6.2f} us per lookup  ({scan / indexed:.1f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
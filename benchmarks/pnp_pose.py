@@ -0,0 +1,127 @@
+"""
+Benchmark: per-frame cost and jitter of the two-axis head pose vs the
+solvePnP estimator.
+
+FaceMesh runs once per frame of a video (or camera) to collect landmarks;
+both estimators then process the same landmarks without smoothing. Jitter is
+the RMS second difference of yaw/pitch between consecutive frames (deg),
+which is dominated by landmark noise when the head moves smoothly.
+
+For the synthetic face the angles are also compared with the drawn pose.
+
+    python -m benchmarks.pnp_pose --video session.mp4 [--frames 300]
+    python -m benchmarks.pnp_pose --camera 0
+    python -m benchmarks.pnp_pose --synthetic
+"""
+
+import argparse
+import sys
+import time
+
+import cv2
+import mediapipe as mp
+import numpy as np
+
+from head_track import CameraSource, CaptureProfile, LandmarkArray, SyntheticFaceSource, VideoFileSource
+from head_track.geometry import direction_to_angles, forward_vector
+from head_track.pnp import AXIS_LANDMARKS, PnPPoseEstimator
+
+
+def collect_landmarks(source, count):
+    """Return the landmarks of the frames with a face, their frame numbers and the frame size."""
+    source.open()
+    face_mesh = mp.solutions.face_mesh.FaceMesh(max_num_faces=1, refine_landmarks=True)
+    landmarks = LandmarkArray()
+    frames, numbers = [], []
+    size = (0, 0)
+    try:
+        for number in range(count):
+            ok, frame = source.read()
+            if not ok:
+                break
+            h, w = frame.shape[:2]
+            size = (w, h)
+            results = face_mesh.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+            if results.multi_face_landmarks:
+                frames.append(landmarks.from_landmark_list(results.multi_face_landmarks[0], 0, 0, w, h).copy())
+                numbers.append(number)
+    finally:
+        source.release()
+        face_mesh.close()
+    return np.array(frames), numbers, size
+
+
+def jitter(angles):
+    return np.sqrt(np.mean(np.diff(angles, n=2, axis=0) ** 2, axis=0))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--video", help="Video file to read frames from")
+    parser.add_argument("--camera", type=int, default=0, help="Camera index when --video is not given")
+    parser.add_argument("--synthetic", action="store_true", help="Use the synthetic face instead of a video")
+    parser.add_argument("--frames", type=int, default=300)
+    args = parser.parse_args()
+
+    if args.synthetic:
+        source = SyntheticFaceSource(realtime=False)
+    elif args.video:
+        source = VideoFileSource(args.video, realtime=False)
+    else:
+        source = CameraSource(CaptureProfile(device=args.camera))
+    frames, numbers, (w, h) = collect_landmarks(source, args.frames)
+    estimator = PnPPoseEstimator()
+    if len(frames) < 3:
+        print("Not enough frames with a face.")
+        return 1
+    print(f"{len(frames)} frames with a face at {w}x{h}")
+
+    axes, axes_times = [], []
+    for points in frames:
+        t0 = time.perf_counter()
+        left, right, top, bottom = points[AXIS_LANDMARKS].tolist()
+        axes.append(direction_to_angles(*forward_vector(left, right, top, bottom)))
+        axes_times.append(time.perf_counter() - t0)
+
+    pnp, pnp_times, matched = [], [], []
+    for i, points in enumerate(frames):
+        selected = points[estimator.point_indices]
+        t0 = time.perf_counter()
+        direction = estimator.update(selected, w, h)
+        elapsed = time.perf_counter() - t0
+        if direction is not None:
+            pnp.append(direction_to_angles(*direction))
+            pnp_times.append(elapsed)
+            matched.append(i)
+
+    axes = np.array(axes)[matched]
+    pnp = np.array(pnp)
+    for name, angles, times in (("two-axis", axes, axes_times), ("solvePnP", pnp, pnp_times)):
+        yaw_j, pitch_j = jitter(angles)
+        print(
+            f"{name:<9} {1e6 * np.median(times):8.1f} us/frame (median)  "
+            f"jitter yaw {yaw_j:.3f} deg  pitch {pitch_j:.3f} deg"
+        )
+    if args.synthetic:
+        truth = np.array([source.pose_at(numbers[i]) for i in matched])
+        for name, angles in (("two-axis", axes), ("solvePnP", pnp)):
+            # Tracker yaw grows as the head turns towards image left.
+            measured = angles * (-1.0, 1.0)
+            fits = [np.polyfit(truth[:, k], measured[:, k], 1) for k in (0, 1)]
+            rms = [np.sqrt(np.mean((np.polyval(fits[k], truth[:, k]) - measured[:, k]) ** 2)) for k in (0, 1)]
+            print(
+                f"{name:<9} vs drawn pose: gain yaw {fits[0][0]:.2f}  pitch {fits[1][0]:.2f}  "
+                f"rms error after the linear fit yaw {rms[0]:.2f}  pitch {rms[1]:.2f} deg"
+            )
+    diff = pnp - axes
+    stats = estimator.stats()
+    print(
+        f"mean difference yaw {diff[:, 0].mean():+.2f} deg  pitch {diff[:, 1].mean():+.2f} deg; "
+        f"{stats['warm_starts']}/{stats['solves']} warm-started, {stats['failures']} failed, "
+        f"reprojection {stats['last_reprojection_px']:.2f} px"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
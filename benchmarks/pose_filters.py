@@ -0,0 +1,150 @@
+"""
+Harness: lag vs jitter of the head-direction smoothing filters.
+
+Each filter runs over the same key points and is scored on the yaw/pitch it
+produces:
+  - lag:    delay (ms) that best aligns the output with the reference
+            trajectory during motion
+  - jitter: RMS frame-to-frame change (deg) while the head is still
+  - error:  RMS difference from the reference (deg), after compensating lag
+  - cost:   time per filter update
+
+By default the key points come from a synthetic session (still periods,
+slow and fast turns) with known ground truth. With `--keypoints` a recorded
+(F, 5, 3) array of left/right/top/bottom/front points is used instead; the
+unfiltered angles are then the reference and jitter is measured over the
+whole recording.
+
+    python -m benchmarks.pose_filters [--fps 30] [--seconds 60]
+    python -m benchmarks.pose_filters --keypoints session_keypoints.npy --fps 30
+"""
+
+import argparse
+import math
+import sys
+import time
+
+import numpy as np
+
+from head_track.filters import EmaFilter, KalmanFilter, MovingAverageFilter, OneEuroFilter
+from head_track.geometry import direction_to_angles, forward_vector
+
+FACE_MODEL = np.array([
+    [-70.0, 0.0, 20.0],
+    [70.0, 0.0, 20.0],
+    [0.0, -110.0, 10.0],
+    [0.0, 90.0, 10.0],
+    [0.0, 0.0, -50.0],
+])
+
+FILTERS = {
+    "none": lambda: None,
+    "moving avg (8)": lambda: MovingAverageFilter(8),
+    "moving avg (4)": lambda: MovingAverageFilter(4),
+    "ema (0.3)": lambda: EmaFilter(0.3),
+    "ema (0.5)": lambda: EmaFilter(0.5),
+    "one euro": lambda: OneEuroFilter(min_cutoff=1.0, beta=0.5),
+    "one euro (fast)": lambda: OneEuroFilter(min_cutoff=1.5, beta=2.0),
+    "kalman": lambda: KalmanFilter(process_noise=1.0, measurement_noise=3e-4),
+    "kalman (smooth)": lambda: KalmanFilter(process_noise=0.2, measurement_noise=3e-4),
+}
+
+
+def synthetic_session(fps, seconds, noise_px, seed=0):
+    """Return (key_points, true yaw/pitch offsets in degrees, still mask)."""
+    rng = np.random.default_rng(seed)
+    frames = int(fps * seconds)
+    t = np.arange(frames) / fps
+    yaw = np.zeros(frames)
+    pitch = np.zeros(frames)
+    # Alternate 2 s still periods with turns of random size and speed.
+    period = int(4 * fps)
+    for start in range(period // 2, frames, period):
+        n = min(period // 2, frames - start)
+        target_yaw = rng.uniform(-20, 20)
+        target_pitch = rng.uniform(-10, 10)
+        ramp = 0.5 - 0.5 * np.cos(np.linspace(0.0, math.pi, n))
+        yaw[start:start + n] = yaw[start - 1] + (target_yaw - yaw[start - 1]) * ramp
+        pitch[start:start + n] = pitch[start - 1] + (target_pitch - pitch[start - 1]) * ramp
+        yaw[start + n:] = yaw[start + n - 1]
+        pitch[start + n:] = pitch[start + n - 1]
+    still = (np.abs(np.gradient(yaw)) + np.abs(np.gradient(pitch))) < 1e-9
+
+    points = np.empty((frames, 5, 3))
+    for i, (y, p) in enumerate(zip(np.radians(yaw), np.radians(pitch))):
+        ry = np.array([[math.cos(y), 0, math.sin(y)], [0, 1, 0], [-math.sin(y), 0, math.cos(y)]])
+        rx = np.array([[1, 0, 0], [0, math.cos(p), -math.sin(p)], [0, math.sin(p), math.cos(p)]])
+        points[i] = FACE_MODEL @ (ry @ rx).T + (320.0, 240.0, 0.0)
+    points += rng.normal(0.0, noise_px, points.shape)
+    return points, t, still
+
+
+def run_filter(filt, points, t):
+    angles = np.empty((len(points), 2))
+    t0 = time.perf_counter()
+    for i, key_points in enumerate(points):
+        left, right, top, bottom, _front = key_points.tolist()
+        direction = forward_vector(left, right, top, bottom)
+        if filt is not None:
+            direction = filt.update(direction, t[i])
+        angles[i] = direction_to_angles(*direction)
+    cost = (time.perf_counter() - t0) / len(points)
+    return angles, cost
+
+
+def best_lag(out, ref, moving, max_lag):
+    """Return the lag in frames minimizing RMS(out[t] - ref[t - lag]) over moving frames, and that RMS."""
+    best = (0, float("inf"))
+    idx = np.nonzero(moving)[0]
+    idx = idx[idx >= max_lag]
+    if idx.size == 0:
+        return best
+    for lag in range(max_lag + 1):
+        rms = math.sqrt(np.mean((out[idx] - ref[idx - lag]) ** 2))
+        if rms < best[1]:
+            best = (lag, rms)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--keypoints", help="Recorded (F, 5, 3) key points saved with numpy.save")
+    parser.add_argument("--fps", type=float, default=30.0)
+    parser.add_argument("--seconds", type=float, default=60.0)
+    parser.add_argument("--noise", type=float, default=0.6, help="Synthetic landmark noise (px, std)")
+    args = parser.parse_args()
+
+    if args.keypoints:
+        points = np.load(args.keypoints)
+        t = np.arange(len(points)) / args.fps
+        # No ground truth: align over all frames, jitter from second differences.
+        still = None
+        reference, _ = run_filter(None, points, t)
+        source = f"{args.keypoints} ({len(points)} frames, reference = unfiltered)"
+    else:
+        points, t, still = synthetic_session(args.fps, args.seconds, args.noise)
+        clean, _, _ = synthetic_session(args.fps, args.seconds, 0.0)
+        reference, _ = run_filter(None, clean, t)
+        source = f"synthetic ({len(points)} frames at {args.fps:g} fps, noise {args.noise} px)"
+
+    print(source)
+    print(f"{'filter':<16} {'lag ms':>7} {'jitter deg':>11} {'error deg':>10} {'cost us':>8}")
+    frame_ms = 1000.0 / args.fps
+    max_lag = int(args.fps)
+    for name, make in FILTERS.items():
+        angles, cost = run_filter(make(), points, t)
+        moving = np.ones(len(points), dtype=bool) if still is None else ~still
+        lags = [best_lag(angles[:, k], reference[:, k], moving, max_lag) for k in range(2)]
+        lag_frames = 0.5 * (lags[0][0] + lags[1][0])
+        error = math.sqrt(0.5 * (lags[0][1] ** 2 + lags[1][1] ** 2))
+        if still is None:
+            steps = np.diff(angles, n=2, axis=0)
+        else:
+            steps = np.diff(angles, axis=0)[still[1:] & still[:-1]]
+        jitter = math.sqrt(np.mean(steps ** 2)) if steps.size else float("nan")
+        print(f"{name:<16} {lag_frames * frame_ms:7.1f} {jitter:11.4f} {error:10.3f} {1e6 * cost:8.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
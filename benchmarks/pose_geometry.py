@@ -0,0 +1,151 @@
+"""
+Benchmark: head pose geometry, previous per-frame NumPy code vs the scalar
+kernel in head_track.geometry vs the vectorized batch function.
+
+Key points come from a deterministic synthetic head (a random walk in yaw
+and pitch, projected to pixels with noise). All three paths must agree.
+
+    python -m benchmarks.pose_geometry [--frames 20000] [--smooth-len 8]
+"""
+
+import argparse
+import math
+import sys
+import time
+from collections import deque
+
+import numpy as np
+
+from head_track.geometry import (
+    direction_to_angles,
+    forward_vector,
+    map_to_screen,
+    mean_direction,
+    pose_batch,
+    screen_batch,
+)
+
+SCREEN_W, SCREEN_H = 1920, 1080
+YAW_SPAN, PITCH_SPAN = 20.0, 10.0
+
+# Left, right, top, bottom, front in head coordinates (pixels at 640x480).
+FACE_MODEL = np.array([
+    [-70.0, 0.0, 20.0],
+    [70.0, 0.0, 20.0],
+    [0.0, -110.0, 10.0],
+    [0.0, 90.0, 10.0],
+    [0.0, 0.0, -50.0],
+])
+
+
+def synthetic_key_points(frames, seed=0):
+    rng = np.random.default_rng(seed)
+    yaw = np.cumsum(rng.normal(0.0, 0.4, frames)).clip(-25, 25)
+    pitch = np.cumsum(rng.normal(0.0, 0.3, frames)).clip(-15, 15)
+    out = np.empty((frames, 5, 3))
+    for i, (y, p) in enumerate(zip(np.radians(yaw), np.radians(pitch))):
+        ry = np.array([[math.cos(y), 0, math.sin(y)], [0, 1, 0], [-math.sin(y), 0, math.cos(y)]])
+        rx = np.array([[1, 0, 0], [0, math.cos(p), -math.sin(p)], [0, math.sin(p), math.cos(p)]])
+        out[i] = FACE_MODEL @ (ry @ rx).T + (320.0, 240.0, 0.0)
+    out += rng.normal(0.0, 0.5, out.shape)
+    return out
+
+
+def reference_angles(avg_dir):
+    """The tracker's previous `_compute_angles`, without calibration."""
+    ref_fwd = np.array([0.0, 0.0, -1.0])
+    xz = np.array([avg_dir[0], 0.0, avg_dir[2]])
+    xz /= (np.linalg.norm(xz) + 1e-9)
+    yaw = math.degrees(math.acos(np.clip(np.dot(ref_fwd, xz), -1.0, 1.0)))
+    if avg_dir[0] < 0:
+        yaw = -yaw
+
+    yz = np.array([0.0, avg_dir[1], avg_dir[2]])
+    yz /= (np.linalg.norm(yz) + 1e-9)
+    pitch = math.degrees(math.acos(np.clip(np.dot(ref_fwd, yz), -1.0, 1.0)))
+    if avg_dir[1] > 0:
+        pitch = -pitch
+
+    if yaw < 0:
+        yaw = abs(yaw)
+    elif yaw < 180:
+        yaw = 360 - yaw
+    if pitch < 0:
+        pitch = 360 + pitch
+    return yaw, pitch
+
+
+def run_reference(points, smooth_len):
+    """The tracker's previous per-frame NumPy pipeline."""
+    ray_dirs = deque(maxlen=smooth_len)
+    out = np.empty((len(points), 4))
+    for i, key_points in enumerate(points):
+        left, right, top, bottom, front = key_points
+        right_axis = right - left
+        right_axis /= (np.linalg.norm(right_axis) + 1e-9)
+        up_axis = top - bottom
+        up_axis /= (np.linalg.norm(up_axis) + 1e-9)
+        fwd = np.cross(right_axis, up_axis)
+        fwd /= (np.linalg.norm(fwd) + 1e-9)
+        fwd = -fwd
+        ray_dirs.append(fwd)
+        avg_dir = np.mean(ray_dirs, axis=0)
+        avg_dir /= (np.linalg.norm(avg_dir) + 1e-9)
+        yaw, pitch = reference_angles(avg_dir)
+        sx = int(((yaw - (180.0 - YAW_SPAN)) / (2.0 * YAW_SPAN)) * SCREEN_W)
+        sy = int(((180.0 + PITCH_SPAN - pitch) / (2.0 * PITCH_SPAN)) * SCREEN_H)
+        out[i] = yaw, pitch, max(0, min(SCREEN_W - 1, sx)), max(0, min(SCREEN_H - 1, sy))
+    return out
+
+
+def run_kernel(points, smooth_len):
+    ray_dirs = deque(maxlen=smooth_len)
+    out = np.empty((len(points), 4))
+    for i, key_points in enumerate(points):
+        left, right, top, bottom, _front = key_points.tolist()
+        ray_dirs.append(forward_vector(left, right, top, bottom))
+        yaw, pitch = direction_to_angles(*mean_direction(ray_dirs))
+        out[i] = (yaw, pitch) + map_to_screen(yaw, pitch, YAW_SPAN, PITCH_SPAN, SCREEN_W, SCREEN_H)
+    return out
+
+
+def run_batch(points, smooth_len):
+    yaw, pitch = pose_batch(points, smooth_len)
+    sx, sy = screen_batch(yaw, pitch, YAW_SPAN, PITCH_SPAN, SCREEN_W, SCREEN_H)
+    return np.column_stack([yaw, pitch, sx, sy])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=20000)
+    parser.add_argument("--smooth-len", type=int, default=8)
+    args = parser.parse_args()
+
+    points = synthetic_key_points(args.frames)
+    results = {}
+    baseline = None
+    for name, fn in (("numpy per frame", run_reference), ("scalar kernel", run_kernel), ("batch", run_batch)):
+        t0 = time.perf_counter()
+        results[name] = fn(points, args.smooth_len)
+        usec = 1e6 * (time.perf_counter() - t0) / args.frames
+        line = f"{name:<16} {usec:8.2f} us/frame"
+        if baseline is None:
+            baseline = usec
+        else:
+            line += f"  speed-up {baseline / usec:7.1f}x"
+        print(line)
+
+    reference = results["numpy per frame"]
+    ok = True
+    for name in ("scalar kernel", "batch"):
+        diff = results[name] - reference
+        angle_err = np.abs(diff[:, :2]).max()
+        pixel_err = np.abs(diff[:, 2:]).max()
+        print(f"{name:<16} max |d angle| {angle_err:.2e} deg  max |d screen| {pixel_err:.0f} px")
+        ok = ok and angle_err < 1e-6 and pixel_err <= 1
+    print("equivalent" if ok else "MISMATCH")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""
+Benchmark: per-frame FaceMesh inference time, full frame vs ROI crop.
+
+Frames are read up front from a video file (or a camera), then each mode
+processes the same frames with a fresh tracker.
+
+    python -m benchmarks.roi_inference --video session.mp4 [--frames 300]
+    python -m benchmarks.roi_inference --camera 0
+"""
+
+import argparse
+import sys
+import time
+
+import cv2
+import numpy as np
+
+from head_track import HeadPoseTracker
+
+
+def load_frames(source, count):
+    cap = cv2.VideoCapture(source)
+    if not cap.isOpened():
+        raise RuntimeError(f"Could not open video source {source!r}")
+    frames = []
+    while len(frames) < count:
+        ok, frame = cap.read()
+        if not ok:
+            break
+        frames.append(frame)
+    cap.release()
+    return frames
+
+
+def run_mode(frames, **tracker_kwargs):
+    tracker = HeadPoseTracker(**tracker_kwargs)
+    times = []
+    angles = []
+    for frame in frames:
+        t0 = time.perf_counter()
+        _, _, ang = tracker.process_frame(frame, 1920, 1080)
+        times.append(time.perf_counter() - t0)
+        angles.append(ang)
+    return np.array(times), angles, tracker
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--video", help="Video file to read frames from")
+    parser.add_argument("--camera", type=int, default=0, help="Camera index when --video is not given")
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--roi-size", type=int, default=256, help="Longest side of the downscaled crop")
+    parser.add_argument("--roi-padding", type=float, default=0.25)
+    args = parser.parse_args()
+
+    frames = load_frames(args.video if args.video else args.camera, args.frames)
+    if not frames:
+        print("No frames read.")
+        return 1
+    h, w = frames[0].shape[:2]
+    print(f"{len(frames)} frames at {w}x{h}")
+
+    modes = {
+        "full frame": dict(roi=False),
+        "roi crop": dict(roi=True, roi_padding=args.roi_padding),
+        f"roi crop @ {args.roi_size}px": dict(roi=True, roi_padding=args.roi_padding, roi_size=args.roi_size),
+    }
+    baseline = None
+    reference_angles = None
+    for name, kwargs in modes.items():
+        times, angles, tracker = run_mode(frames, **kwargs)
+        # Skip the first frames: the ROI modes start with a full-frame search.
+        steady = times[min(5, len(times) - 1):]
+        mean_ms = 1000.0 * steady.mean()
+        detected = sum(a is not None for a in angles)
+        line = (
+            f"{name:<20} mean {mean_ms:7.2f} ms  p95 {1000.0 * np.percentile(steady, 95):7.2f} ms  "
+            f"faces {detected}/{len(frames)}  fallbacks {tracker.roi_fallbacks}"
+        )
+        if baseline is None:
+            baseline, reference_angles = mean_ms, angles
+        else:
+            diffs = [
+                max(abs(a[0] - r[0]), abs(a[1] - r[1]))
+                for a, r in zip(angles, reference_angles)
+                if a is not None and r is not None
+            ]
+            max_diff = max(diffs) if diffs else float("nan")
+            line += f"  speed-up {baseline / mean_ms:4.2f}x  max |d angle| {max_diff:.2f} deg"
+        print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
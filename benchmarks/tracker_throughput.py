@@ -0,0 +1,79 @@
+"""
+Benchmark: end-to-end HeadPoseTracker throughput on an offline frame source.
+
+Runs `next_position` over a video file, a directory of images or the
+deterministic synthetic face (the default, no camera needed), either as fast
+as the tracker can go or paced at the source's frame rate. For the synthetic
+face the tracked yaw/pitch are also compared with the drawn pose
+(correlation and gain; the offset is what calibration absorbs).
+
+    python -m benchmarks.tracker_throughput [--source synthetic] [--frames 300]
+    python -m benchmarks.tracker_throughput --source session.mp4 --paced
+    python -m benchmarks.tracker_throughput --source frames/ --preset fast
+    python -m benchmarks.tracker_throughput --timing
+"""
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from head_track import HeadPoseTracker, SyntheticFaceSource, open_source
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--source", default="synthetic", help="Video file, image directory or 'synthetic'")
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--paced", action="store_true", help="Deliver frames at the source frame rate")
+    parser.add_argument("--preset", default=None, help="Inference preset (see head_track.presets)")
+    parser.add_argument("--timing", action="store_true", help="Also report per-stage times from the tracker's StageTimer")
+    args = parser.parse_args()
+
+    source = open_source(args.source, realtime=args.paced)
+    if isinstance(source, SyntheticFaceSource):
+        source.frames = args.frames
+    tracker = HeadPoseTracker(preset=args.preset, timing=args.timing)
+    settings = tracker.start(source)
+    print(f"Source: {settings.backend} {settings.width}x{settings.height} @ {settings.fps:g} fps, {'paced' if args.paced else 'unpaced'}")
+
+    times = []
+    angles = []
+    t_start = time.perf_counter()
+    for _ in range(args.frames):
+        t0 = time.perf_counter()
+        _pos, frame, ang = tracker.next_position(1920, 1080)
+        times.append(time.perf_counter() - t0)
+        if frame.shape[:2] == (1, 1):
+            times.pop()
+            break
+        angles.append(ang)
+    elapsed = time.perf_counter() - t_start
+    tracker.stop()
+
+    if not times:
+        print("No frames read.")
+        return 1
+    ms = 1000.0 * np.array(times)
+    found = sum(a is not None for a in angles)
+    print(f"frames {len(times)}  face found {found}  wall {elapsed:.2f} s  throughput {len(times) / elapsed:.1f} fps")
+    print(f"per frame: mean {ms.mean():.2f} ms  p50 {np.percentile(ms, 50):.2f}  p95 {np.percentile(ms, 95):.2f}")
+    if args.timing:
+        for stage, s in tracker.timing_stats()["stages"].items():
+            print(f"  {stage:<10} n {s['count']:4d}  mean {s['mean_ms']:6.2f}  p50 {s['p50_ms']:6.2f}  p95 {s['p95_ms']:6.2f}  p99 {s['p99_ms']:6.2f} ms")
+
+    if isinstance(source, SyntheticFaceSource) and found:
+        truth = np.array([source.pose_at(i) for i, a in enumerate(angles) if a is not None])
+        measured = np.array([a for a in angles if a is not None])
+        # Tracker yaw grows as the head turns towards image left, pitch as it tilts up.
+        measured[:, 0] *= -1.0
+        for axis, name in enumerate(("yaw", "pitch")):
+            corr = np.corrcoef(truth[:, axis], measured[:, axis])[0, 1]
+            gain = np.polyfit(truth[:, axis], measured[:, axis], 1)[0]
+            print(f"vs drawn {name}: correlation {corr:.3f}  gain {gain:.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,2 +1,3 @@
 from cursor.base import Cursor
-from cursor.factory import create_cursor
\ No newline at end of file
+from cursor.factory import create_cursor
+from cursor.recording import RecordingCursor
\ No newline at end of file
@@ -1,9 +1,28 @@
 import math
 import time
 from abc import ABC, abstractmethod
-from typing import Tuple
+from typing import Any, Dict, NamedTuple, Optional, Tuple
 
-from cursor.constants import DEFAULT_MOVE_PX_PER_SEC, DEFAULT_FRAME_RATE, DEFAULT_SCROLL_UNITS_PER_SEC
+from cursor.constants import (
+    DEFAULT_MOVE_PX_PER_SEC,
+    DEFAULT_FRAME_RATE,
+    DEFAULT_SCROLL_UNITS_PER_SEC,
+    DEFAULT_BOUNDS_TTL_SEC,
+    DEFAULT_SHADOW_RESYNC_SEC,
+    SHADOW_DIVERGENCE_TOLERANCE_PX,
+)
+from cursor.geometry import GeometryCache, MonitorLayout
+from tracing import traced
+
+
+class ScrollStats(NamedTuple):
+    """Outcome of one `scroll_with_speed` call."""
+
+    units: int
+    calls: int
+    elapsed_sec: float
+    achieved_units_per_sec: float
+    target_units_per_sec: float
 
 
 class Cursor(ABC):
@@ -11,12 +30,24 @@ class Cursor(ABC):
     Abstract cursor interface + shared animation logic.
 
     Subclasses must implement:
-      - get_pos
-      - set_pos
+      - _read_pos
+      - _write_pos
       - get_virtual_bounds
       - left_click
       - right_click
       - scroll
+
+    Subclasses that know the per-output geometry should override
+    `get_monitor_layout`. Subclasses that can be notified of screen changes
+    may override `_screen_changed` so the cached layout is refreshed
+    immediately instead of waiting for the TTL to expire.
+
+    The animation helpers work from a shadow (dead-reckoned) position that is
+    updated by every `set_pos` and only resynced with the real pointer every
+    `shadow_resync_sec` seconds, so the hot loop rarely reads the backend.
+
+    While `tracing` is on, `set_pos`, `move_to_with_speed`, `step_towards`
+    and `scroll_with_speed` calls are recorded as spans.
     """
 
     def __init__(
@@ -24,10 +55,28 @@ class Cursor(ABC):
         move_px_per_sec: float = DEFAULT_MOVE_PX_PER_SEC,
         frame_rate: int = DEFAULT_FRAME_RATE,
         scroll_units_per_sec: float = DEFAULT_SCROLL_UNITS_PER_SEC,
+        bounds_ttl_sec: float = DEFAULT_BOUNDS_TTL_SEC,
+        shadow_resync_sec: float = DEFAULT_SHADOW_RESYNC_SEC,
     ) -> None:
         self.move_px_per_sec = float(move_px_per_sec)
         self.frame_rate = int(frame_rate)
         self.scroll_units_per_sec = float(scroll_units_per_sec)
+        self._layout_cache = GeometryCache(self.get_monitor_layout, bounds_ttl_sec)
+
+        self.shadow_resync_sec = float(shadow_resync_sec)
+        self._shadow_pos: Optional[Tuple[int, int]] = None
+        self._shadow_synced_at = 0.0
+        # Set after an external move; forces resyncs until the pointer settles.
+        self._shadow_unsettled = False
+        self._shadow_stats = {
+            "backend_reads": 0,
+            "reads_saved": 0,
+            "external_moves": 0,
+            "divergence_samples": 0,
+            "divergence_total_px": 0.0,
+            "divergence_max_px": 0.0,
+        }
+        self.last_scroll_stats: Optional[ScrollStats] = None
 
     def update_config(
         self,
@@ -41,14 +90,61 @@ class Cursor(ABC):
         self.scroll_units_per_sec = float(scroll_units_per_sec)
 
     @abstractmethod
-    def get_pos(self) -> Tuple[int, int]:
-        """Return the current cursor position as (x, y)."""
+    def _read_pos(self) -> Tuple[int, int]:
+        """Read the real cursor position from the backend as (x, y)."""
         raise NotImplementedError
 
     @abstractmethod
+    def _write_pos(self, x: int, y: int) -> None:
+        """Move the real cursor to absolute coordinates (x, y)."""
+        raise NotImplementedError
+
+    def get_pos(self) -> Tuple[int, int]:
+        """Return the current cursor position as (x, y), read from the backend."""
+        pos = self._read_pos()
+        self._shadow_stats["backend_reads"] += 1
+
+        if self._shadow_pos is not None:
+            divergence = math.hypot(pos[0] - self._shadow_pos[0], pos[1] - self._shadow_pos[1])
+            stats = self._shadow_stats
+            stats["divergence_samples"] += 1
+            stats["divergence_total_px"] += divergence
+            stats["divergence_max_px"] = max(stats["divergence_max_px"], divergence)
+            self._shadow_unsettled = divergence > SHADOW_DIVERGENCE_TOLERANCE_PX
+            if self._shadow_unsettled:
+                stats["external_moves"] += 1
+
+        self._shadow_pos = pos
+        self._shadow_synced_at = time.perf_counter()
+        return pos
+
+    @traced("Cursor.set_pos", cat="cursor")
     def set_pos(self, x: int, y: int) -> None:
         """Set the cursor position to absolute coordinates (x, y)."""
-        raise NotImplementedError
+        x, y = int(x), int(y)
+        self._write_pos(x, y)
+        self._shadow_pos = (x, y)
+
+    def tracked_pos(self) -> Tuple[int, int]:
+        """
+        Return the shadow cursor position, resyncing with the backend when the
+        resync interval has elapsed or the last resync found an external move.
+        """
+        if (
+            self._shadow_pos is None
+            or self._shadow_unsettled
+            or time.perf_counter() - self._shadow_synced_at >= self.shadow_resync_sec
+        ):
+            return self.get_pos()
+        self._shadow_stats["reads_saved"] += 1
+        return self._shadow_pos
+
+    def shadow_stats(self) -> Dict[str, Any]:
+        """Return backend-read savings and shadow/real divergence statistics."""
+        stats = dict(self._shadow_stats)
+        samples = stats["divergence_samples"]
+        stats["divergence_mean_px"] = stats["divergence_total_px"] / samples if samples else 0.0
+        return stats
 
     @abstractmethod
     def get_virtual_bounds(self) -> Tuple[int, int, int, int]:
@@ -70,22 +166,57 @@ class Cursor(ABC):
 
     @abstractmethod
     def scroll(self, delta: int) -> None:
-        """Scroll the mouse wheel. Positive delta scrolls up, negative scrolls down."""
+        """
+        Scroll the mouse wheel by `delta` notches in a single backend call.
+        Positive delta scrolls up, negative scrolls down.
+        """
         raise NotImplementedError
 
+    def get_monitor_layout(self) -> MonitorLayout:
+        """
+        Query the backend for the per-monitor layout.
+        Defaults to a single rectangle covering the virtual bounds.
+        """
+        return MonitorLayout.from_bounds(self.get_virtual_bounds())
+
+    def _screen_changed(self) -> bool:
+        """Return True if the screen layout changed since the last call."""
+        return False
+
+    def cached_monitor_layout(self) -> MonitorLayout:
+        """
+        Return the monitor layout from the in-memory cache.
+
+        The backend is only queried on a cache miss: the first call, after a
+        screen-change notification, or once the bounds TTL has expired.
+        """
+        if self._screen_changed():
+            self._layout_cache.invalidate()
+        return self._layout_cache.get()
+
+    def cached_virtual_bounds(self) -> Tuple[int, int, int, int]:
+        """Return the virtual desktop bounds from the cached monitor layout."""
+        return self.cached_monitor_layout().bounds
+
+    def invalidate_bounds(self) -> None:
+        """Force the next cached geometry lookup to query the backend."""
+        self._layout_cache.invalidate()
+
+    def bounds_cache_stats(self) -> Dict[str, int]:
+        """Return hit/miss/invalidation counters of the geometry cache."""
+        return self._layout_cache.stats()
+
     def clamp_target(self, x: int, y: int) -> Tuple[int, int]:
-        """Clamp (x, y) to the virtual desktop bounds."""
-        minx, miny, maxx, maxy = self.get_virtual_bounds()
-        x = max(minx, min(x, maxx))
-        y = max(miny, min(y, maxy))
-        return x, y
+        """Clamp (x, y) to the nearest point on any monitor."""
+        return self.cached_monitor_layout().clamp(x, y)
 
+    @traced("Cursor.move_to_with_speed", cat="cursor")
     def move_to_with_speed(self, target_x: int, target_y: int) -> None:
         """
         Smoothly move the cursor to (target_x, target_y) using the configured
         move_px_per_sec and frame rate.
         """
-        cx, cy = self.get_pos()
+        cx, cy = self.tracked_pos()
         target_x, target_y = self.clamp_target(int(target_x), int(target_y))
 
         dx = target_x - cx
@@ -114,6 +245,7 @@ class Cursor(ABC):
 
         self.set_pos(target_x, target_y)
     
+    @traced("Cursor.step_towards", cat="cursor")
     def step_towards(self, target_x: int, target_y: int) -> None:
         """
         Non-blocking: Moves the cursor one 'step' towards the target.
@@ -136,7 +268,8 @@ class Cursor(ABC):
 
         self._last_step_time = now
 
-        cx, cy = self.get_pos()
+        target_x, target_y = self.clamp_target(int(target_x), int(target_y))
+        cx, cy = self.tracked_pos()
         
         dx = target_x - cx
         dy = target_y - cy
@@ -152,39 +285,59 @@ class Cursor(ABC):
             ny = cy + (dy * ratio)
             self.set_pos(int(nx), int(ny))
         
-    def scroll_with_speed(self, delta: int) -> None:
+    @traced("Cursor.scroll_with_speed", cat="cursor")
+    def scroll_with_speed(self, delta: int) -> ScrollStats:
         """
         Scroll the mouse wheel with the configured scroll speed.
-        Uses an accumulator to handle sub-unit scrolling smoothly.
+
+        The first unit is sent at once and unit k is due k /
+        scroll_units_per_sec seconds later. Every frame, all units that are
+        due are sent in one batched `scroll` call, so a slow backend catches
+        up instead of falling behind schedule.
+
+        `elapsed_sec` runs from just before the first `scroll` call to the
+        last batch. The achieved rate counts every unit, each taking one
+        1 / scroll_units_per_sec slot: units / (elapsed_sec + one slot), which
+        equals the target rate when every unit goes out on time. Batches
+        only go out once per frame, so a scroll shorter than a few frames
+        is quantised to the frame rate: at 300 units/s and 60 fps, 2 units
+        take one frame and report about 100 units/s.
         """
-        if delta == 0:
-            return
+        target_rate = max(1e-6, self.scroll_units_per_sec)
+        total = abs(delta)
+        if total == 0:
+            self.last_scroll_stats = ScrollStats(0, 0, 0.0, 0.0, target_rate)
+            return self.last_scroll_stats
 
-        total_duration = abs(delta) / max(1e-6, self.scroll_units_per_sec)
-        steps = max(1, int(self.frame_rate * total_duration))
-        per_step_scroll = delta / steps
-        accumulator = 0.0
+        sign = 1 if delta > 0 else -1
+        frame_interval = 1.0 / max(1, self.frame_rate)
         start_time = time.perf_counter()
+        self.scroll(sign)
+        emitted = 1
+        calls = 1
+        last_batch = start_time
+        next_frame = start_time
 
-        for i in range(1, steps + 1):
-            # Add the fractional amount to our "bucket"
-            accumulator += per_step_scroll
-            
-            # Check if we have enough in the bucket to actually scroll (>= 1 or <= -1)
-            scroll_amount = int(accumulator)
-            
-            if scroll_amount != 0:
-                self.scroll(scroll_amount)
-                accumulator -= scroll_amount
-
-            target_elapsed = (i / steps) * total_duration
-            now = time.perf_counter()
-            sleep_time = (start_time + target_elapsed) - now
-            
+        while emitted < total:
+            next_frame += frame_interval
+            sleep_time = next_frame - time.perf_counter()
             if sleep_time > 0:
                 time.sleep(sleep_time)
-        
-        # Handles cases where rounding errors left 1 tick behind
-        remaining = int(accumulator + 0.5) if delta > 0 else int(accumulator - 0.5)
-        if remaining != 0:
-            self.scroll(remaining)
+
+            now = time.perf_counter()
+            due = min(total, int((now - start_time) * target_rate) + 1)
+            if due > emitted:
+                self.scroll(sign * (due - emitted))
+                emitted = due
+                calls += 1
+                last_batch = now
+
+        elapsed = last_batch - start_time
+        self.last_scroll_stats = ScrollStats(
+            units=total,
+            calls=calls,
+            elapsed_sec=elapsed,
+            achieved_units_per_sec=total / (elapsed + 1.0 / target_rate),
+            target_units_per_sec=target_rate,
+        )
+        return self.last_scroll_stats
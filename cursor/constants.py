@@ -1,4 +1,7 @@
 # Tweakable speed settings (shared across implementations)
 DEFAULT_MOVE_PX_PER_SEC = 1000.0       # pixels per second (Movement)
 DEFAULT_FRAME_RATE = 120               # animation updates per second
-DEFAULT_SCROLL_UNITS_PER_SEC = 300.0   # scroll units/notches per second
\ No newline at end of file
+DEFAULT_SCROLL_UNITS_PER_SEC = 300.0   # scroll units/notches per second
+DEFAULT_BOUNDS_TTL_SEC = 5.0           # seconds before cached screen bounds are re-queried
+DEFAULT_SHADOW_RESYNC_SEC = 0.25       # seconds between real pointer reads in animations
+SHADOW_DIVERGENCE_TOLERANCE_PX = 2.0   # shadow/real distance treated as an external move
\ No newline at end of file
@@ -1,40 +1,57 @@
+import os
 import sys
-import importlib
-from typing import Type
+from typing import Optional
 from cursor.base import Cursor
 from cursor.constants import (
     DEFAULT_MOVE_PX_PER_SEC,
     DEFAULT_FRAME_RATE,
     DEFAULT_SCROLL_UNITS_PER_SEC,
 )
-
-_PLATFORM_IMPLS: dict[str, tuple[str, str]] = {
-    "win": ("cursor.windows", "WindowsCursor"),
-    "darwin": ("cursor.macos", "MacOSCursor"),
-    "linux": ("cursor.linux", "LinuxCursor"),
-}
-
-
-def _load_impl_for_platform() -> Type[Cursor]:
-    plat = sys.platform
-    for prefix, (module_name, class_name) in _PLATFORM_IMPLS.items():
-        if plat.startswith(prefix):
-            module = importlib.import_module(module_name)
-            return getattr(module, class_name)
-    raise RuntimeError(f"No cursor implementation available for OS: {plat!r}")
+from cursor import registry
 
 
 def create_cursor(
     move_px_per_sec: float = DEFAULT_MOVE_PX_PER_SEC,
     frame_rate: int = DEFAULT_FRAME_RATE,
     scroll_units_per_sec: float = DEFAULT_SCROLL_UNITS_PER_SEC,
+    backend: Optional[str] = None,
+    probe: bool = True,
 ) -> Cursor:
     """
     Factory function to create a platform-specific Cursor instance.
+
+    `backend` names a registered implementation (see `cursor.registry`), e.g.
+    "recording" for a headless in-memory cursor. When omitted, the
+    EYECURSOR_CURSOR_BACKEND environment variable is consulted; if that is
+    unset too, the fastest usable backend for this OS is picked by a short
+    probe whose result is cached on disk. With `probe=False` the registered
+    backends are tried in order of preference instead.
     """
-    impl_cls = _load_impl_for_platform()
-    return impl_cls(
+    config = dict(
         move_px_per_sec=move_px_per_sec,
         frame_rate=frame_rate,
         scroll_units_per_sec=scroll_units_per_sec,
     )
+
+    if backend is None:
+        backend = os.environ.get(registry.BACKEND_ENV_VAR) or None
+    if backend is not None:
+        return registry.load_backend(backend)(**config)
+
+    if probe:
+        name = registry.select_backend()
+        try:
+            return registry.load_backend(name)(**config)
+        except Exception:
+            # The cached choice went stale (e.g. dependency removed); probe again.
+            registry.clear_cache()
+            name = registry.select_backend(use_cache=False)
+            return registry.load_backend(name)(**config)
+
+    last_error: Exception = RuntimeError(f"No cursor implementation available for OS: {sys.platform!r}")
+    for spec in registry.backends_for_platform():
+        try:
+            return registry.load_backend(spec.name)(**config)
+        except Exception as e:
+            last_error = e
+    raise last_error
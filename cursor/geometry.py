@@ -0,0 +1,150 @@
+import threading
+import time
+from bisect import bisect_right
+from typing import Callable, Dict, Generic, List, NamedTuple, Optional, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class GeometryCache(Generic[T]):
+    """
+    Caches an expensive screen-geometry query (e.g. the monitor layout).
+
+    The cached value is reloaded on the next `get()` after `invalidate()` is
+    called (typically from a screen-change notification) or once `ttl_sec`
+    has elapsed. A `ttl_sec` of 0 or less disables expiry.
+    """
+
+    def __init__(self, loader: Callable[[], T], ttl_sec: float) -> None:
+        self._loader = loader
+        self.ttl_sec = float(ttl_sec)
+        self._value: Optional[T] = None
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self) -> T:
+        with self._lock:
+            now = time.monotonic()
+            expired = self.ttl_sec > 0 and now - self._loaded_at >= self.ttl_sec
+            if self._value is None or expired:
+                self.misses += 1
+                self._value = self._loader()
+                self._loaded_at = now
+            else:
+                self.hits += 1
+            return self._value
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._value = None
+            self.invalidations += 1
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+        }
+
+
+class Monitor(NamedTuple):
+    """One output rectangle in virtual desktop coordinates."""
+
+    name: str
+    x: int
+    y: int
+    width: int
+    height: int
+
+    @property
+    def maxx(self) -> int:
+        return self.x + self.width - 1
+
+    @property
+    def maxy(self) -> int:
+        return self.y + self.height - 1
+
+    def contains(self, x: int, y: int) -> bool:
+        return self.x <= x <= self.maxx and self.y <= y <= self.maxy
+
+    def clamp(self, x: int, y: int) -> Tuple[int, int]:
+        return max(self.x, min(x, self.maxx)), max(self.y, min(y, self.maxy))
+
+
+class MonitorLayout:
+    """
+    Immutable index over the monitors of a virtual desktop.
+
+    The desktop is cut into vertical slabs at every monitor edge; each slab
+    keeps the monitors that span it sorted by top edge. A point lookup is two
+    binary searches, so `monitor_at` is O(log n). `clamp` maps points that fall
+    into gaps between monitors (or outside the desktop) to the nearest pixel
+    of any monitor.
+    """
+
+    def __init__(self, monitors: Sequence[Monitor]) -> None:
+        if not monitors:
+            raise ValueError("MonitorLayout needs at least one monitor")
+        self.monitors: Tuple[Monitor, ...] = tuple(monitors)
+        self.bounds: Tuple[int, int, int, int] = (
+            min(m.x for m in self.monitors),
+            min(m.y for m in self.monitors),
+            max(m.maxx for m in self.monitors),
+            max(m.maxy for m in self.monitors),
+        )
+
+        edges = sorted({m.x for m in self.monitors} | {m.maxx + 1 for m in self.monitors})
+        self._slab_x: List[int] = edges[:-1]
+        self._slab_tops: List[List[int]] = []
+        self._slab_monitors: List[List[Monitor]] = []
+        self._overlapping = False
+        for left in self._slab_x:
+            spanning = sorted(
+                (m for m in self.monitors if m.x <= left <= m.maxx),
+                key=lambda m: (m.y, m.maxy),
+            )
+            if any(a.maxy >= b.y for a, b in zip(spanning, spanning[1:])):
+                self._overlapping = True
+            self._slab_tops.append([m.y for m in spanning])
+            self._slab_monitors.append(spanning)
+
+    @classmethod
+    def from_bounds(cls, bounds: Tuple[int, int, int, int], name: str = "virtual") -> "MonitorLayout":
+        """Build a single-monitor layout from (minx, miny, maxx, maxy)."""
+        minx, miny, maxx, maxy = bounds
+        return cls([Monitor(name, minx, miny, maxx - minx + 1, maxy - miny + 1)])
+
+    def monitor_at(self, x: int, y: int) -> Optional[Monitor]:
+        """Return the monitor containing (x, y), or None if it is in a gap."""
+        si = bisect_right(self._slab_x, x) - 1
+        if si < 0 or x > self.bounds[2]:
+            return None
+        mi = bisect_right(self._slab_tops[si], y) - 1
+        if mi < 0:
+            # Above every monitor of the slab, or a slab in a horizontal gap.
+            return None
+        # Disjoint monitors: only the last one starting above y can contain it.
+        # Mirrored/overlapping outputs may hide a match further down the slab.
+        lowest = 0 if self._overlapping else mi
+        for i in range(mi, lowest - 1, -1):
+            monitor = self._slab_monitors[si][i]
+            if monitor.contains(x, y):
+                return monitor
+        return None
+
+    def clamp(self, x: int, y: int) -> Tuple[int, int]:
+        """Return the nearest point to (x, y) that lies on a monitor."""
+        if self.monitor_at(x, y) is not None:
+            return x, y
+
+        best = (x, y)
+        best_dist = None
+        for monitor in self.monitors:
+            cx, cy = monitor.clamp(x, y)
+            dist = (cx - x) ** 2 + (cy - y) ** 2
+            if best_dist is None or dist < best_dist:
+                best, best_dist = (cx, cy), dist
+        return best
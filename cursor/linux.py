@@ -1,9 +1,13 @@
+import re
 import subprocess
 from typing import Tuple
 from cursor.base import Cursor
+from cursor.geometry import Monitor, MonitorLayout
+
+_XRANDR_GEOMETRY = re.compile(r'(\d+)x(\d+)\+(-?\d+)\+(-?\d+)')
 
 class LinuxCursor(Cursor):
-    def get_pos(self) -> Tuple[int, int]:
+    def _read_pos(self) -> Tuple[int, int]:
         output = subprocess.check_output(['xdotool', 'getmouselocation', '--shell']).decode()
         pos = {}
         for line in output.strip().split('\n'):
@@ -12,20 +16,24 @@ class LinuxCursor(Cursor):
                 pos[key] = int(value)
         return pos['X'], pos['Y']
 
-    def set_pos(self, x: int, y: int) -> None:
+    def _write_pos(self, x: int, y: int) -> None:
         subprocess.call(['xdotool', 'mousemove', str(int(x)), str(int(y))])
 
     def get_virtual_bounds(self) -> Tuple[int, int, int, int]:
+        return self.get_monitor_layout().bounds
+
+    def get_monitor_layout(self) -> MonitorLayout:
         output = subprocess.check_output(['xrandr']).decode()
+        monitors = []
         for line in output.splitlines():
             if ' connected ' in line:
-                parts = line.split()
-                for part in parts:
-                    if '+' in part and 'x' in part:
-                        res = part.split('+')[0]
-                        width, height = map(int, res.split('x'))
-                        return 0, 0, width - 1, height - 1
-        raise RuntimeError('Could not determine screen size')
+                match = _XRANDR_GEOMETRY.search(line)
+                if match:
+                    width, height, x, y = map(int, match.groups())
+                    monitors.append(Monitor(line.split()[0], x, y, width, height))
+        if not monitors:
+            raise RuntimeError('Could not determine screen size')
+        return MonitorLayout(monitors)
 
     def left_click(self) -> None:
         subprocess.call(['xdotool', 'click', '1'])
@@ -34,6 +42,7 @@ class LinuxCursor(Cursor):
         subprocess.call(['xdotool', 'click', '3'])
 
     def scroll(self, delta: int) -> None:
+        if delta == 0:
+            return
         button = '4' if delta > 0 else '5'
-        for _ in range(abs(delta)):
-            subprocess.call(['xdotool', 'click', button])
+        subprocess.call(['xdotool', 'click', '--repeat', str(abs(delta)), '--delay', '0', button])
@@ -0,0 +1,96 @@
+from typing import Optional, Tuple
+
+from Xlib import X
+from Xlib.display import Display
+from Xlib.ext import randr, xtest
+
+from cursor.base import Cursor
+from cursor.geometry import Monitor, MonitorLayout
+
+
+class LinuxXTestCursor(Cursor):
+    """
+    Linux cursor backed by a single persistent X display connection.
+
+    Pointer motion, clicks and scrolling are injected with the XTest extension,
+    so no process is spawned per call (unlike the xdotool-based LinuxCursor).
+    Screen-change events from RandR invalidate the cached virtual bounds.
+    """
+
+    def __init__(self, *args, display_name: Optional[str] = None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._display = Display(display_name)
+        if not self._display.has_extension("XTEST"):
+            self._display.close()
+            raise RuntimeError("X server does not support the XTEST extension")
+        self._root = self._display.screen().root
+        self._has_randr = self._display.has_extension("RANDR")
+        if self._has_randr:
+            # Only RandR events are selected on this connection, so any event
+            # we receive signals a screen or output change.
+            self._root.xrandr_select_input(
+                randr.RRScreenChangeNotifyMask
+                | randr.RRCrtcChangeNotifyMask
+                | randr.RROutputChangeNotifyMask
+            )
+
+    def close(self) -> None:
+        """Close the X display connection."""
+        if self._display is not None:
+            self._display.close()
+            self._display = None
+
+    def _read_pos(self) -> Tuple[int, int]:
+        pointer = self._root.query_pointer()
+        return pointer.root_x, pointer.root_y
+
+    def _write_pos(self, x: int, y: int) -> None:
+        xtest.fake_input(self._display, X.MotionNotify, x=int(x), y=int(y))
+        self._display.flush()
+
+    def get_virtual_bounds(self) -> Tuple[int, int, int, int]:
+        # The root window tracks RandR resizes; the connection setup data does not.
+        geom = self._root.get_geometry()
+        return 0, 0, geom.width - 1, geom.height - 1
+
+    def get_monitor_layout(self) -> MonitorLayout:
+        if not self._has_randr:
+            return super().get_monitor_layout()
+
+        resources = self._root.xrandr_get_screen_resources_current()
+        monitors = []
+        for crtc in resources.crtcs:
+            info = self._display.xrandr_get_crtc_info(crtc, resources.config_timestamp)
+            # CRTCs without a mode are not driving any output.
+            if info.mode and info.width and info.height:
+                monitors.append(Monitor(f"crtc-{crtc}", info.x, info.y, info.width, info.height))
+        if not monitors:
+            return super().get_monitor_layout()
+        return MonitorLayout(monitors)
+
+    def _screen_changed(self) -> bool:
+        if not self._has_randr:
+            return False
+        changed = False
+        while self._display.pending_events():
+            self._display.next_event()
+            changed = True
+        return changed
+
+    def _click(self, button: int, repeat: int = 1) -> None:
+        for _ in range(repeat):
+            xtest.fake_input(self._display, X.ButtonPress, button)
+            xtest.fake_input(self._display, X.ButtonRelease, button)
+        self._display.flush()
+
+    def left_click(self) -> None:
+        self._click(1)
+
+    def right_click(self) -> None:
+        self._click(3)
+
+    def scroll(self, delta: int) -> None:
+        if delta == 0:
+            return
+        button = 4 if delta > 0 else 5
+        self._click(button, repeat=abs(delta))
@@ -1,5 +1,6 @@
 from typing import Tuple
 from cursor.base import Cursor
+from cursor.geometry import Monitor, MonitorLayout
 
 from Quartz import (
     CGEventCreateMouseEvent,
@@ -14,29 +15,67 @@ from Quartz import (
     CGEventCreate,
     CGEventGetLocation,
     CGEventCreateScrollWheelEvent,
+    CGDisplayRegisterReconfigurationCallback,
+    CGDisplayRemoveReconfigurationCallback,
+    CGGetActiveDisplayList,
+    kCGScrollEventUnitLine,
 )
 
+_MAX_DISPLAYS = 32
+
 
-# Currently only supports single display setups.
 class MacOSCursor(Cursor):
-    def get_pos(self) -> Tuple[int, int]:
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._screen_dirty = False
+        # Delivered on the run loop of the registering thread (the Tk main loop).
+        # The same callable must be passed to unregister it in `close()`.
+        self._reconfigure_callback = self._on_reconfigure
+        CGDisplayRegisterReconfigurationCallback(self._reconfigure_callback, None)
+
+    def close(self) -> None:
+        """Unregister the display reconfiguration callback."""
+        if self._reconfigure_callback is not None:
+            CGDisplayRemoveReconfigurationCallback(self._reconfigure_callback, None)
+            self._reconfigure_callback = None
+
+    def _on_reconfigure(self, display, flags, user_info) -> None:
+        self._screen_dirty = True
+
+    def _screen_changed(self) -> bool:
+        changed = self._screen_dirty
+        self._screen_dirty = False
+        return changed
+
+    def _read_pos(self) -> Tuple[int, int]:
         event = CGEventCreate(None)
         location = CGEventGetLocation(event)
         return int(location.x), int(location.y)
 
-    def set_pos(self, x: int, y: int) -> None:
+    def _write_pos(self, x: int, y: int) -> None:
         event = CGEventCreateMouseEvent(
             None, kCGEventMouseMoved, (int(x), int(y)), 0
         )
         CGEventPost(0, event)
 
     def get_virtual_bounds(self) -> Tuple[int, int, int, int]:
-        bounds = CGDisplayBounds(CGMainDisplayID())
-        minx = int(bounds.origin.x)
-        miny = int(bounds.origin.y)
-        maxx = int(bounds.origin.x + bounds.size.width - 1)
-        maxy = int(bounds.origin.y + bounds.size.height - 1)
-        return minx, miny, maxx, maxy
+        return self.get_monitor_layout().bounds
+
+    def get_monitor_layout(self) -> MonitorLayout:
+        err, display_ids, count = CGGetActiveDisplayList(_MAX_DISPLAYS, None, None)
+        if err or not count:
+            display_ids, count = [CGMainDisplayID()], 1
+        monitors = []
+        for display_id in display_ids[:count]:
+            bounds = CGDisplayBounds(display_id)
+            monitors.append(Monitor(
+                str(display_id),
+                int(bounds.origin.x),
+                int(bounds.origin.y),
+                int(bounds.size.width),
+                int(bounds.size.height),
+            ))
+        return MonitorLayout(monitors)
 
     def left_click(self) -> None:
         event_down = CGEventCreateMouseEvent(None, kCGEventLeftMouseDown, self.get_pos(), 0)
@@ -51,5 +90,6 @@ class MacOSCursor(Cursor):
         CGEventPost(0, event_up)
 
     def scroll(self, delta: int) -> None:
-        event = CGEventCreateScrollWheelEvent(None, 0, 1, delta)
+        # Line units: one unit per wheel notch, as on the other backends.
+        event = CGEventCreateScrollWheelEvent(None, kCGScrollEventUnitLine, 1, int(delta))
         CGEventPost(0, event)
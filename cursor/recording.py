@@ -0,0 +1,129 @@
+import os
+import time
+from array import array
+from typing import Dict, Iterator, Optional, Tuple
+
+from cursor.base import Cursor
+
+EVENT_MOVE = 0
+EVENT_LEFT_CLICK = 1
+EVENT_RIGHT_CLICK = 2
+EVENT_SCROLL = 3
+
+EVENT_NAMES = {
+    EVENT_MOVE: "move",
+    EVENT_LEFT_CLICK: "left_click",
+    EVENT_RIGHT_CLICK: "right_click",
+    EVENT_SCROLL: "scroll",
+}
+
+# Default simulated per-call backend latency for headless runs, in milliseconds.
+LATENCY_ENV_VAR = "EYECURSOR_RECORDING_LATENCY_MS"
+
+
+class RecordingCursor(Cursor):
+    """
+    In-memory cursor that talks to no display.
+
+    Every set_pos, click and scroll is appended with a `perf_counter`
+    timestamp to parallel typed arrays (8 + 1 + 4 + 4 bytes per event), so
+    animation throughput can be measured headless. Each backend call can
+    sleep for `latency_sec` to simulate a slow real backend.
+
+    Event layout: move -> (x, y); click -> pointer (x, y); scroll -> (delta, 0).
+    """
+
+    def __init__(
+        self,
+        *args,
+        bounds: Tuple[int, int, int, int] = (0, 0, 1919, 1079),
+        latency_sec: Optional[float] = None,
+        **kwargs,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self._bounds = tuple(int(v) for v in bounds)
+        if latency_sec is None:
+            latency_sec = float(os.environ.get(LATENCY_ENV_VAR, "0")) / 1000.0
+        self.latency_sec = float(latency_sec)
+
+        minx, miny, maxx, maxy = self._bounds
+        self._pos = ((minx + maxx) // 2, (miny + maxy) // 2)
+        self._times = array("d")
+        self._kinds = array("B")
+        self._xs = array("i")
+        self._ys = array("i")
+        self.backend_calls = 0
+
+    def _backend_call(self) -> None:
+        self.backend_calls += 1
+        if self.latency_sec > 0:
+            time.sleep(self.latency_sec)
+
+    def _record(self, kind: int, a: int, b: int) -> None:
+        self._times.append(time.perf_counter())
+        self._kinds.append(kind)
+        self._xs.append(a)
+        self._ys.append(b)
+
+    def _read_pos(self) -> Tuple[int, int]:
+        self._backend_call()
+        return self._pos
+
+    def _write_pos(self, x: int, y: int) -> None:
+        self._backend_call()
+        # Like a real pointer, the position cannot leave the desktop.
+        minx, miny, maxx, maxy = self._bounds
+        self._pos = (max(minx, min(int(x), maxx)), max(miny, min(int(y), maxy)))
+        self._record(EVENT_MOVE, self._pos[0], self._pos[1])
+
+    def get_virtual_bounds(self) -> Tuple[int, int, int, int]:
+        self._backend_call()
+        return self._bounds
+
+    def left_click(self) -> None:
+        self._backend_call()
+        self._record(EVENT_LEFT_CLICK, self._pos[0], self._pos[1])
+
+    def right_click(self) -> None:
+        self._backend_call()
+        self._record(EVENT_RIGHT_CLICK, self._pos[0], self._pos[1])
+
+    def scroll(self, delta: int) -> None:
+        self._backend_call()
+        self._record(EVENT_SCROLL, int(delta), 0)
+
+    def move_external(self, x: int, y: int) -> None:
+        """Move the simulated pointer without recording, like a user moving the mouse."""
+        self._pos = (int(x), int(y))
+
+    def __len__(self) -> int:
+        return len(self._kinds)
+
+    def clear(self) -> None:
+        """Drop all recorded events and reset the backend call counter."""
+        del self._times[:], self._kinds[:], self._xs[:], self._ys[:]
+        self.backend_calls = 0
+
+    def events(self) -> Iterator[Tuple[float, int, int, int]]:
+        """Iterate recorded events as (timestamp, kind, a, b)."""
+        return zip(self._times, self._kinds, self._xs, self._ys)
+
+    def arrays(self) -> Tuple[array, array, array, array]:
+        """Return the raw (timestamps, kinds, a, b) arrays without copying."""
+        return self._times, self._kinds, self._xs, self._ys
+
+    def summary(self) -> Dict[str, float]:
+        """Return event counts per kind, total duration and event rate."""
+        counts = {name: 0 for name in EVENT_NAMES.values()}
+        for kind in self._kinds:
+            counts[EVENT_NAMES[kind]] += 1
+        duration = self._times[-1] - self._times[0] if len(self._times) > 1 else 0.0
+        scrolled = sum(a for kind, a in zip(self._kinds, self._xs) if kind == EVENT_SCROLL)
+        return {
+            **counts,
+            "events": len(self),
+            "backend_calls": self.backend_calls,
+            "scroll_units": scrolled,
+            "duration_sec": duration,
+            "events_per_sec": len(self) / duration if duration > 0 else 0.0,
+        }
@@ -0,0 +1,175 @@
+import importlib
+import json
+import os
+import sys
+import time
+from typing import Dict, List, NamedTuple, Optional, Type
+
+from cursor.base import Cursor
+
+# set_pos/get_pos pairs timed per backend when probing.
+PROBE_ITERATIONS = 20
+
+# Overrides backend selection in create_cursor(), e.g. "recording" for headless runs.
+BACKEND_ENV_VAR = "EYECURSOR_CURSOR_BACKEND"
+
+CACHE_FILE = os.path.join(
+    os.environ.get("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")),
+    "eyecursor",
+    "cursor_backend.json",
+)
+
+
+class BackendSpec(NamedTuple):
+    """A registered cursor implementation."""
+
+    name: str
+    platform: str      # sys.platform prefix; "" matches every platform
+    module: str
+    class_name: str
+    auto: bool = True  # considered by automatic selection
+
+
+class ProbeResult(NamedTuple):
+    name: str
+    usable: bool
+    seconds_per_op: Optional[float] = None
+    error: Optional[str] = None
+
+
+_REGISTRY: Dict[str, BackendSpec] = {}
+
+
+def register_backend(name: str, platform: str, module: str, class_name: str, auto: bool = True) -> None:
+    """
+    Register a Cursor implementation under `name`.
+    Registration order is the preference order when probing is skipped.
+    """
+    _REGISTRY[name] = BackendSpec(name, platform, module, class_name, auto)
+
+
+def backends_for_platform(plat: Optional[str] = None, auto_only: bool = True) -> List[BackendSpec]:
+    """Return the registered backends that target `plat` (default: this OS)."""
+    plat = sys.platform if plat is None else plat
+    return [
+        spec for spec in _REGISTRY.values()
+        if plat.startswith(spec.platform) and (spec.auto or not auto_only)
+    ]
+
+
+def load_backend(name: str) -> Type[Cursor]:
+    """Import and return the Cursor class registered as `name`."""
+    try:
+        spec = _REGISTRY[name]
+    except KeyError:
+        known = ", ".join(sorted(_REGISTRY)) or "none"
+        raise RuntimeError(f"Unknown cursor backend {name!r} (registered: {known})") from None
+    module = importlib.import_module(spec.module)
+    return getattr(module, spec.class_name)
+
+
+def _close(cur: Cursor) -> None:
+    close = getattr(cur, "close", None)
+    if close is not None:
+        close()
+
+
+def probe_backend(name: str, iterations: int = PROBE_ITERATIONS) -> ProbeResult:
+    """
+    Check that backend `name` can be imported and instantiated, then time a
+    short burst of set_pos/get_pos pairs at the current pointer position.
+    """
+    try:
+        cur = load_backend(name)()
+    except Exception as e:
+        return ProbeResult(name, False, error=f"{type(e).__name__}: {e}")
+
+    try:
+        x, y = cur.get_pos()
+        start = time.perf_counter()
+        for _ in range(iterations):
+            cur.set_pos(x, y)
+            cur.get_pos()
+        elapsed = time.perf_counter() - start
+    except Exception as e:
+        return ProbeResult(name, False, error=f"{type(e).__name__}: {e}")
+    finally:
+        _close(cur)
+
+    return ProbeResult(name, True, seconds_per_op=elapsed / (2 * max(1, iterations)))
+
+
+def probe_backends(plat: Optional[str] = None) -> List[ProbeResult]:
+    """Probe every automatically selectable backend for `plat`."""
+    return [probe_backend(spec.name) for spec in backends_for_platform(plat)]
+
+
+def _cache_key() -> str:
+    # A different display server may make a different backend the fastest.
+    session = os.environ.get("WAYLAND_DISPLAY") or os.environ.get("DISPLAY") or ""
+    candidates = ",".join(spec.name for spec in backends_for_platform())
+    return f"{sys.platform}|{session}|{candidates}"
+
+
+def _read_cache() -> Optional[str]:
+    try:
+        with open(CACHE_FILE, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if data.get("key") != _cache_key():
+        return None
+    return data.get("backend")
+
+
+def _write_cache(name: str, results: List[ProbeResult]) -> None:
+    data = {
+        "key": _cache_key(),
+        "backend": name,
+        "probed_at": time.time(),
+        "results": [r._asdict() for r in results],
+    }
+    try:
+        os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+        with open(CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+    except OSError:
+        pass
+
+
+def clear_cache() -> None:
+    """Forget the cached backend choice so the next selection probes again."""
+    try:
+        os.remove(CACHE_FILE)
+    except OSError:
+        pass
+
+
+def select_backend(use_cache: bool = True) -> str:
+    """
+    Return the name of the fastest usable backend for this OS.
+
+    The choice is read from the on-disk cache when possible; otherwise every
+    candidate is probed and the result is cached for later launches.
+    """
+    if use_cache:
+        cached = _read_cache()
+        if cached is not None:
+            return cached
+
+    results = probe_backends()
+    usable = [r for r in results if r.usable]
+    if not usable:
+        details = "; ".join(f"{r.name}: {r.error}" for r in results) or "none registered"
+        raise RuntimeError(f"No usable cursor backend for OS {sys.platform!r} ({details})")
+
+    best = min(usable, key=lambda r: r.seconds_per_op)
+    _write_cache(best.name, results)
+    return best.name
+
+
+register_backend("xtest", "linux", "cursor.linux_xtest", "LinuxXTestCursor")
+register_backend("xdotool", "linux", "cursor.linux", "LinuxCursor")
+register_backend("quartz", "darwin", "cursor.macos", "MacOSCursor")
+register_backend("win32", "win", "cursor.windows", "WindowsCursor")
+register_backend("recording", "", "cursor.recording", "RecordingCursor", auto=False)
@@ -1,7 +1,9 @@
 import ctypes
+from ctypes import wintypes
 from typing import Tuple
 
 from cursor.base import Cursor
+from cursor.geometry import Monitor, MonitorLayout
 
 user32 = ctypes.windll.user32
 
@@ -10,18 +12,26 @@ SM_YVIRTUALSCREEN = 77
 SM_CXVIRTUALSCREEN = 78
 SM_CYVIRTUALSCREEN = 79
 
+MOUSEEVENTF_WHEEL = 0x0800
+WHEEL_DELTA = 120  # one wheel notch
+
 
 class POINT(ctypes.Structure):
     _fields_ = [("x", ctypes.c_long), ("y", ctypes.c_long)]
 
 
+MONITORENUMPROC = ctypes.WINFUNCTYPE(
+    wintypes.BOOL, wintypes.HMONITOR, wintypes.HDC, ctypes.POINTER(wintypes.RECT), wintypes.LPARAM
+)
+
+
 class WindowsCursor(Cursor):
-    def get_pos(self) -> Tuple[int, int]:
+    def _read_pos(self) -> Tuple[int, int]:
         pt = POINT()
         user32.GetCursorPos(ctypes.byref(pt))
         return pt.x, pt.y
 
-    def set_pos(self, x: int, y: int) -> None:
+    def _write_pos(self, x: int, y: int) -> None:
         user32.SetCursorPos(int(x), int(y))
 
     def get_virtual_bounds(self) -> Tuple[int, int, int, int]:
@@ -33,6 +43,19 @@ class WindowsCursor(Cursor):
         maxy = miny + h - 1
         return minx, miny, maxx, maxy
 
+    def get_monitor_layout(self) -> MonitorLayout:
+        monitors = []
+
+        def on_monitor(hmonitor, hdc, rect_ptr, lparam):
+            r = rect_ptr.contents
+            monitors.append(Monitor(str(hmonitor), r.left, r.top, r.right - r.left, r.bottom - r.top))
+            return True
+
+        user32.EnumDisplayMonitors(None, None, MONITORENUMPROC(on_monitor), 0)
+        if not monitors:
+            return super().get_monitor_layout()
+        return MonitorLayout(monitors)
+
     def left_click(self) -> None:
         user32.mouse_event(0x0002, 0, 0, 0, 0) 
         user32.mouse_event(0x0004, 0, 0, 0, 0)  
@@ -42,4 +65,4 @@ class WindowsCursor(Cursor):
         user32.mouse_event(0x0010, 0, 0, 0, 0)
 
     def scroll(self, delta: int) -> None:
-        user32.mouse_event(0x0800, 0, 0, delta, 0)
+        user32.mouse_event(MOUSEEVENTF_WHEEL, 0, 0, int(delta) * WHEEL_DELTA, 0)
@@ -1,8 +1,10 @@
+import argparse
 import sys
 import threading
 import tkinter as tk
 import queue
 
+import tracing
 from cursor import create_cursor
 from ui import SettingsWindow
 
@@ -78,7 +80,12 @@ def run_cli_loop(cur, stop_queue):
                     parts = raw.split()
                     delta = int(parts[1])
                     print(f"Scrolling {'up' if delta > 0 else 'down'} by {delta}...")
-                    cur.scroll_with_speed(delta)
+                    stats = cur.scroll_with_speed(delta)
+                    print(
+                        f"Scrolled {stats.units} units in {stats.calls} backend calls: "
+                        f"{stats.achieved_units_per_sec:.0f} units/s "
+                        f"(configured {stats.target_units_per_sec:.0f})"
+                    )
                 except (IndexError, ValueError):
                     print("Invalid scroll command. Use 'scroll <delta>' where delta is an integer.")
                 continue
@@ -92,6 +99,12 @@ def run_cli_loop(cur, stop_queue):
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Move, click and scroll the cursor from the command line.")
+    tracing.add_profile_argument(parser)
+    args = parser.parse_args()
+    if args.profile:
+        tracing.start(args.profile)
+
     cur = create_cursor()
     msg_queue = queue.Queue()
 
@@ -105,17 +118,18 @@ def main():
 
     # Define Main Thread Polling
     def check_queue():
-        try:
-            msg = msg_queue.get_nowait()
-            if msg == "QUIT":
-                root.quit()
-                sys.exit(0)
-        except queue.Empty:
-            pass
-        root.after(100, check_queue)
+        with tracing.span("check_queue", cat="ui"):
+            try:
+                msg = msg_queue.get_nowait()
+                if msg == "QUIT":
+                    root.quit()
+                    sys.exit(0)
+            except queue.Empty:
+                pass
+            root.after(100, check_queue)
 
     # Start Background Thread (CLI)
-    t = threading.Thread(target=run_cli_loop, args=(cur, msg_queue), daemon=True)
+    t = threading.Thread(target=run_cli_loop, args=(cur, msg_queue), name="cli", daemon=True)
     t.start()
 
     # Start App
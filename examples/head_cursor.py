@@ -1,34 +1,52 @@
 """
 Linux-only demo: control the mouse cursor with head pose.
 
-Requires webcam, OpenCV, and MediaPipe. Press 'q' to quit, 'c' to calibrate.
+Requires webcam, OpenCV, and MediaPipe. Press 'q' to quit, 'c' to calibrate,
+'t' to show per-stage timings.
 """
 
+import argparse
 import sys
 import threading
 import queue
 
+import tracing
 from cursor import create_cursor
 from ui.settings import SettingsWindow
-from head_track import HeadPoseTracker
+from head_track import CaptureProfile, HeadPoseTracker
+from head_track.timing import draw_overlay
+
+# MJPG lets most USB webcams deliver 30 fps at 640x480; a one-frame driver
+# buffer keeps queued frames from adding latency.
+CAMERA_PROFILE = CaptureProfile(device=0, api_preference="V4L2", width=640, height=480, fps=30, fourcc="MJPG", buffer_size=1)
 
 
 def run_tracking_loop(cur, tracker, stop_queue):
     import cv2
     
-    minx, miny, maxx, maxy = cur.get_virtual_bounds()
-    screen_w = maxx - minx + 1
-    screen_h = maxy - miny + 1
-
-    tracker.start()
-    print("Head-Cursor demo running. Press 'q' to quit, 'c' to calibrate.")
+    settings = tracker.start(CAMERA_PROFILE)
+    print(
+        f"Camera: {settings.width}x{settings.height} @ {settings.fps:g} fps, "
+        f"{settings.fourcc or '?'} via {settings.backend}, buffer {settings.buffer_size}"
+    )
+    print("Head-Cursor demo running. Press 'q' to quit, 'c' to calibrate, 't' for timings.")
+    show_timing = False
 
     while True:
         if not stop_queue.empty():
             if stop_queue.get() == "QUIT":
                 break
 
+        # Cheap in-memory lookup; refreshed by the cursor on monitor hot-plug.
+        minx, miny, maxx, maxy = cur.cached_virtual_bounds()
+        screen_w = maxx - minx + 1
+        screen_h = maxy - miny + 1
+
         pos, frame, angles = tracker.next_position(screen_w, screen_h)
+        # Aim where the head will be by the time the cursor moves. Frames the
+        # tracker did not infer (still head, repeated frame) have no prediction.
+        if pos is not None and tracker.prediction is not None:
+            pos = tracker.prediction.pos
 
         if pos is not None:
             raw_tx, raw_ty = pos
@@ -39,36 +57,64 @@ def run_tracking_loop(cur, tracker, stop_queue):
 
         cv2.putText(
             frame,
-            "Press 'c' to calibrate center, 'q' to quit",
+            "Press 'c' to calibrate center, 't' for timings, 'q' to quit",
             (10, 30),
             cv2.FONT_HERSHEY_SIMPLEX,
             0.6,
             (0, 255, 0),
             2,
         )
-
+        if show_timing and tracker.timer is not None:
+            draw_overlay(frame, tracker.timer.overlay_lines())
         cv2.imshow("Head Cursor (Linux)", frame)
         
         key = cv2.waitKey(1) & 0xFF
         if key in (27, ord('q')):
             stop_queue.put("QUIT")
             break
+        if key == ord('t'):
+            show_timing = not show_timing
         if key == ord('c'):
             if angles is not None:
                 yaw, pitch = angles
                 tracker.calibrate_center(yaw, pitch)
 
+    latency = tracker.capture_latency()
+    if latency["mean_latency_ms"] is not None:
+        print(f"Capture-to-read latency: mean {latency['mean_latency_ms']:.1f} ms, max {latency['max_latency_ms']:.1f} ms")
     tracker.stop()
     cv2.destroyAllWindows()
 
 
 def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    tracing.add_profile_argument(parser)
+    args = parser.parse_args()
+
     if not sys.platform.startswith("linux"):
         print("This demo currently supports Linux only.")
         return 1
 
+    # Started first so the tracker and cursor record from their first call.
+    # The FaceMesh worker process is not traced; its round trip shows up as
+    # the tracker's "inference" span.
+    if args.profile:
+        tracing.start(args.profile)
     cur = create_cursor()
-    tracker = HeadPoseTracker(yaw_span=20.0, pitch_span=10.0, smooth_len=8)
+    # FaceMesh runs in its own process so inference does not stall the Tk loop.
+    # Prediction covers the measured tracking latency plus one cursor frame.
+    # Head tracking does not use iris landmarks, so skip refining them.
+    tracker = HeadPoseTracker(
+        yaw_span=20.0,
+        pitch_span=10.0,
+        smooth_len=8,
+        adaptive=True,
+        inference_process=True,
+        predict=True,
+        predict_extra_sec=1.0 / cur.frame_rate,
+        preset="balanced",
+        timing=True,
+    )
     msg_queue = queue.Queue()
 
     try:
@@ -78,18 +124,20 @@ def main():
         return 1
 
     def check_queue():
-        try:
-            msg = msg_queue.get_nowait()
-            if msg == "QUIT":
-                root.quit()
-                sys.exit(0)
-        except queue.Empty:
-            pass
-        root.after(100, check_queue)
+        with tracing.span("check_queue", cat="ui"):
+            try:
+                msg = msg_queue.get_nowait()
+                if msg == "QUIT":
+                    root.quit()
+                    sys.exit(0)
+            except queue.Empty:
+                pass
+            root.after(100, check_queue)
 
     t = threading.Thread(
         target=run_tracking_loop, 
         args=(cur, tracker, msg_queue), 
+        name="tracking",
         daemon=True
     )
     t.start()
@@ -4,31 +4,41 @@ Linux-only demo: control the mouse cursor with winks.
 Requires webcam, OpenCV, and MediaPipe. Press 'q' to quit.
 """
 
+import argparse
 import sys
 
+import tracing
 from cursor import create_cursor
+from head_track import LandmarkArray
 import cv2
 import mediapipe as mp
-
-def detect_wink(landmarks, left_eye_indices, right_eye_indices):
-    def eye_aspect_ratio(eye):
-        vertical_1 = ((eye[1][0] - eye[5][0])**2 + (eye[1][1] - eye[5][1])**2)**0.5
-        vertical_2 = ((eye[2][0] - eye[4][0])**2 + (eye[2][1] - eye[4][1])**2)**0.5
-        horizontal = ((eye[0][0] - eye[3][0])**2 + (eye[0][1] - eye[3][1])**2)**0.5
+import numpy as np
+
+def detect_wink(landmarks, frame_w, frame_h, left_eye_indices, right_eye_indices):
+    """
+    Return the eye aspect ratios (left, right) from an (N, 3) pixel landmark
+    array. Points are normalized by the frame size first so the ratios match
+    FaceMesh's normalized coordinates the thresholds were tuned on.
+    """
+    def eye_aspect_ratio(indices):
+        eye = landmarks[indices, :2] / (frame_w, frame_h)
+        vertical_1 = np.linalg.norm(eye[1] - eye[5])
+        vertical_2 = np.linalg.norm(eye[2] - eye[4])
+        horizontal = np.linalg.norm(eye[0] - eye[3])
         return (vertical_1 + vertical_2) / (2.0 * horizontal)
 
-    left_eye = [landmarks[i] for i in left_eye_indices]
-    right_eye = [landmarks[i] for i in right_eye_indices]
-
-    left_ear = eye_aspect_ratio(left_eye)
-    right_ear = eye_aspect_ratio(right_eye)
-
-    return left_ear, right_ear
+    return eye_aspect_ratio(left_eye_indices), eye_aspect_ratio(right_eye_indices)
 
 def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    tracing.add_profile_argument(parser)
+    args = parser.parse_args()
+
     if not sys.platform.startswith("linux"):
         print("This demo currently supports Linux only.")
         return 1
+    if args.profile:
+        tracing.start(args.profile)
 
     cur = create_cursor()
     mp_face_mesh = mp.solutions.face_mesh
@@ -40,19 +50,27 @@ def main():
     LEFT_EYE_INDICES = [362, 385, 387, 263, 373, 380]
     RIGHT_EYE_INDICES = [33, 160, 158, 133, 153, 144]
 
+    # Reused across frames: OpenCV writes into a passed array of the right shape.
+    raw_frame = frame = rgb_frame = None
+    landmarks = LandmarkArray()
+
     while cap.isOpened():
-        ret, frame = cap.read()
+        with tracing.span("read", cat="tracker"):
+            ret, raw_frame = cap.read(raw_frame)
         if not ret:
             break
 
-        frame = cv2.flip(frame, 1)
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = face_mesh.process(rgb_frame)
+        with tracing.span("convert", cat="tracker"):
+            frame = cv2.flip(raw_frame, 1, dst=frame)
+            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=rgb_frame)
+        with tracing.span("inference", cat="tracker"):
+            results = face_mesh.process(rgb_frame)
 
         if results.multi_face_landmarks:
+            h, w = frame.shape[:2]
             for face_landmarks in results.multi_face_landmarks:
-                landmarks = [(lm.x, lm.y) for lm in face_landmarks.landmark]
-                left_ear, right_ear = detect_wink(landmarks, LEFT_EYE_INDICES, RIGHT_EYE_INDICES)
+                pixels = landmarks.from_landmark_list(face_landmarks, 0, 0, w, h)
+                left_ear, right_ear = detect_wink(pixels, w, h, LEFT_EYE_INDICES, RIGHT_EYE_INDICES)
 
                 if left_ear < 0.2 and right_ear > 0.3:  # Left wink detected
                     cur.right_click()
@@ -1 +1,7 @@
-from .tracker import HeadPoseTracker
\ No newline at end of file
+from .capture import CameraSource, CaptureProfile, CaptureSettings, FrameSource
+from .landmarks import LandmarkArray
+from .prediction import PosePrediction
+from .presets import InferencePreset
+from .recording import LandmarkRecorder, LandmarkReplay
+from .sources import ImageDirectorySource, SyntheticFaceSource, VideoFileSource, open_source
+from .tracker import HeadPoseTracker
@@ -0,0 +1,40 @@
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+
+class BufferPool:
+    """
+    Named scratch arrays for OpenCV `dst` arguments.
+
+    `get()` hands back the same array for a name as long as the requested
+    shape and dtype match, so per-frame conversions write into existing
+    memory instead of allocating. A disabled pool returns None, which OpenCV
+    treats as "allocate a new output".
+    """
+
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled = bool(enabled)
+        self._buffers: Dict[str, np.ndarray] = {}
+        self.allocations = 0
+        self.reuses = 0
+
+    def get(self, name: str, shape: Tuple[int, ...], dtype=np.uint8) -> Optional[np.ndarray]:
+        if not self.enabled:
+            return None
+        buf = self._buffers.get(name)
+        if buf is None or buf.shape != shape or buf.dtype != dtype:
+            buf = np.empty(shape, dtype=dtype)
+            self._buffers[name] = buf
+            self.allocations += 1
+        else:
+            self.reuses += 1
+        return buf
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "buffers": len(self._buffers),
+            "bytes": sum(b.nbytes for b in self._buffers.values()),
+            "allocations": self.allocations,
+            "reuses": self.reuses,
+        }
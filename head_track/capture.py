@@ -0,0 +1,345 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Dict, NamedTuple, Optional, Tuple, Union
+
+import cv2
+import numpy as np
+
+# Driver timestamps further than this from the monotonic clock are treated as
+# not being monotonic-clock stamps (e.g. a video file position).
+MAX_PLAUSIBLE_LATENCY_MS = 5000.0
+LATENCY_WINDOW = 120
+
+
+class CaptureProfile(NamedTuple):
+    """
+    Requested camera configuration. `None` fields keep the driver default.
+
+    `api_preference` is an OpenCV `CAP_*` constant or its name without the
+    prefix (e.g. "V4L2"); `fourcc` is a four-character code such as "MJPG".
+    """
+
+    device: Union[int, str] = 0
+    api_preference: Union[int, str] = cv2.CAP_ANY
+    width: Optional[int] = None
+    height: Optional[int] = None
+    fps: Optional[float] = None
+    fourcc: Optional[str] = None
+    buffer_size: Optional[int] = None
+
+
+class CaptureSettings(NamedTuple):
+    """Settings the driver actually negotiated for an opened capture."""
+
+    backend: str
+    width: int
+    height: int
+    fps: float
+    fourcc: str
+    buffer_size: int
+
+
+def _resolve_api(api: Union[int, str]) -> int:
+    if isinstance(api, int):
+        return api
+    name = api.upper()
+    value = getattr(cv2, name if name.startswith("CAP_") else "CAP_" + name, None)
+    if not isinstance(value, int):
+        raise RuntimeError(f"Unknown OpenCV capture API {api!r}")
+    return value
+
+
+def _decode_fourcc(value: float) -> str:
+    code = int(value)
+    return "".join(chr((code >> (8 * i)) & 0xFF) for i in range(4)).strip("\x00")
+
+
+def open_capture(profile: CaptureProfile) -> Tuple[cv2.VideoCapture, CaptureSettings]:
+    """
+    Open `profile.device` and apply the requested settings.
+
+    The pixel format is set first because V4L2 drivers only offer some
+    resolutions and frame rates for a given format. Returns the capture and
+    the settings read back from the driver, which may differ from the request.
+    """
+    cap = cv2.VideoCapture(profile.device, _resolve_api(profile.api_preference))
+    if not cap.isOpened():
+        raise RuntimeError(f"Could not open camera {profile.device!r}")
+
+    if profile.fourcc is not None:
+        if len(profile.fourcc) != 4:
+            cap.release()
+            raise RuntimeError(f"FOURCC must be four characters, got {profile.fourcc!r}")
+        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*profile.fourcc))
+    if profile.width is not None:
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, profile.width)
+    if profile.height is not None:
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, profile.height)
+    if profile.fps is not None:
+        cap.set(cv2.CAP_PROP_FPS, profile.fps)
+    if profile.buffer_size is not None:
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, profile.buffer_size)
+
+    try:
+        backend = cap.getBackendName()
+    except cv2.error:
+        backend = "unknown"
+    settings = CaptureSettings(
+        backend=backend,
+        width=int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+        height=int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+        fps=float(cap.get(cv2.CAP_PROP_FPS)),
+        fourcc=_decode_fourcc(cap.get(cv2.CAP_PROP_FOURCC)),
+        buffer_size=int(cap.get(cv2.CAP_PROP_BUFFERSIZE)),
+    )
+    return cap, settings
+
+
+def driver_timestamp_ms(cap: cv2.VideoCapture) -> Optional[float]:
+    """
+    Return the capture timestamp of the last grabbed frame on the monotonic
+    clock in milliseconds, or None if the backend does not provide one.
+
+    V4L2 reports buffer timestamps from CLOCK_MONOTONIC through
+    CAP_PROP_POS_MSEC; other backends report 0 or a stream position.
+    """
+    stamp = cap.get(cv2.CAP_PROP_POS_MSEC)
+    if stamp <= 0:
+        return None
+    age = 1000.0 * time.monotonic() - stamp
+    if 0.0 <= age <= MAX_PLAUSIBLE_LATENCY_MS:
+        return stamp
+    return None
+
+
+class FrameSource(ABC):
+    """
+    Where the tracker gets its BGR frames from.
+
+    Subclasses must implement:
+      - open: start producing frames and return their `CaptureSettings`;
+        opening again after `release` starts over
+      - read: return `(ok, frame)` for the next frame, written into `out`
+        when it has the right shape and the source can
+      - timestamp_ms: capture time of the last frame on the monotonic clock
+        in milliseconds, or None if unknown
+      - release: free the underlying device or file
+
+    `realtime` is True when frames arrive at the pace they were captured, so
+    the age of a timestamp is a real latency. `position_ms` identifies the
+    last frame within the stream; a repeated frame repeats it.
+    """
+
+    realtime = True
+
+    @abstractmethod
+    def open(self) -> CaptureSettings:
+        pass
+
+    @abstractmethod
+    def read(self, out: Optional[np.ndarray] = None) -> Tuple[bool, Optional[np.ndarray]]:
+        pass
+
+    @abstractmethod
+    def timestamp_ms(self) -> Optional[float]:
+        pass
+
+    @abstractmethod
+    def release(self) -> None:
+        pass
+
+    def position_ms(self) -> Optional[float]:
+        return self.timestamp_ms()
+
+
+class CameraSource(FrameSource):
+    """A live camera opened with `open_capture(profile)`."""
+
+    def __init__(self, profile: Optional[CaptureProfile] = None) -> None:
+        self.profile = profile if profile is not None else CaptureProfile()
+        self._cap: Optional[cv2.VideoCapture] = None
+
+    def open(self) -> CaptureSettings:
+        self._cap, settings = open_capture(self.profile)
+        return settings
+
+    def read(self, out: Optional[np.ndarray] = None) -> Tuple[bool, Optional[np.ndarray]]:
+        return self._cap.read(out)
+
+    def timestamp_ms(self) -> Optional[float]:
+        return driver_timestamp_ms(self._cap)
+
+    def position_ms(self) -> Optional[float]:
+        # The raw property identifies the frame even when it is not a
+        # monotonic-clock timestamp.
+        return self._cap.get(cv2.CAP_PROP_POS_MSEC)
+
+    def release(self) -> None:
+        if self._cap is not None:
+            self._cap.release()
+            self._cap = None
+
+
+class CaptureLatency:
+    """
+    Rolling capture-to-read latency and read blocking time.
+
+    Latency is the age of a frame (from its driver timestamp) when the
+    tracker receives it, so it includes driver queueing. Blocking time is how
+    long the read call waited for that frame.
+    """
+
+    def __init__(self, window: int = LATENCY_WINDOW) -> None:
+        self._latency_ms: deque[float] = deque(maxlen=window)
+        self._block_ms: deque[float] = deque(maxlen=window)
+        self.samples = 0
+        self.last_latency_ms: Optional[float] = None
+
+    def record(self, capture_ms: Optional[float], block_sec: float) -> None:
+        self.samples += 1
+        self._block_ms.append(1000.0 * block_sec)
+        if capture_ms is None:
+            self.last_latency_ms = None
+            return
+        self.last_latency_ms = 1000.0 * time.monotonic() - capture_ms
+        self._latency_ms.append(self.last_latency_ms)
+
+    def stats(self) -> Dict[str, Optional[float]]:
+        lat = self._latency_ms
+        block = self._block_ms
+        return {
+            "samples": self.samples,
+            "timestamped": len(lat),
+            "last_latency_ms": self.last_latency_ms,
+            "mean_latency_ms": sum(lat) / len(lat) if lat else None,
+            "max_latency_ms": max(lat) if lat else None,
+            "mean_block_ms": sum(block) / len(block) if block else None,
+        }
+
+
+class FrameGrabber:
+    """
+    Background thread that continuously reads an opened `FrameSource` into a
+    small ring buffer so the consumer always gets the newest frame.
+
+    Frames that are overwritten before being read, or that are older than the
+    frame handed out by `read()`, are counted as dropped. Each frame keeps its
+    capture timestamp (source stamp, or arrival time without one), available
+    as `last_capture_ms` after `read()`.
+
+    With `reuse_buffers=True` the camera is read into a fixed set of
+    `slots + 2` arrays (ring, frame being written, frame handed out) that are
+    recycled; a frame returned by `read()` is only valid until the next call.
+
+    `stop(release_source=True)` also releases the source, but never while
+    the thread may still be inside `source.read()`: if the thread outlives
+    the join timeout, it releases the source itself on its way out.
+    """
+
+    def __init__(self, source: FrameSource, slots: int = 1, reuse_buffers: bool = False) -> None:
+        if slots < 1:
+            raise ValueError("FrameGrabber needs at least one slot")
+        self._source = source
+        self._ring: deque[Tuple[np.ndarray, float]] = deque(maxlen=int(slots))
+        self.reuse_buffers = bool(reuse_buffers)
+        # Recycled frame arrays; None entries are filled by the first reads.
+        self._free: list = [None] * (int(slots) + 2) if self.reuse_buffers else []
+        self._handed_out: Optional[np.ndarray] = None
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self._failed = False
+        self._exited = False
+        self._release_on_exit = False
+        self.last_capture_ms: Optional[float] = None
+
+        self.captured = 0
+        self.dropped = 0
+        self.processed = 0
+
+    def start(self) -> None:
+        self._running = True
+        self._exited = False
+        self._thread = threading.Thread(target=self._run, name="FrameGrabber", daemon=True)
+        self._thread.start()
+
+    def stop(self, release_source: bool = False, timeout: float = 2.0) -> None:
+        with self._cond:
+            self._running = False
+            # Once the thread has exited nobody reads the source any more;
+            # until then the release is left to the thread.
+            release_now = release_source and (self._thread is None or self._exited)
+            self._release_on_exit = release_source and not release_now
+            self._cond.notify_all()
+        if release_now:
+            self._source.release()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        try:
+            self._read_loop()
+        finally:
+            with self._cond:
+                self._exited = True
+                release = self._release_on_exit
+            if release:
+                self._source.release()
+
+    def _read_loop(self) -> None:
+        while self._running:
+            buf = None
+            if self.reuse_buffers:
+                with self._cond:
+                    buf = self._free.pop() if self._free else None
+            ok, frame = self._source.read(buf)
+            stamp = self._source.timestamp_ms() if ok else None
+            if stamp is None:
+                stamp = 1000.0 * time.monotonic()
+            with self._cond:
+                if not ok:
+                    self._failed = True
+                    self._cond.notify_all()
+                    return
+                self.captured += 1
+                if len(self._ring) == self._ring.maxlen:
+                    self.dropped += 1
+                    self._recycle(self._ring.popleft()[0])
+                self._ring.append((frame, stamp))
+                self._cond.notify_all()
+
+    def read(self, timeout: float = 1.0) -> Tuple[bool, Optional[np.ndarray]]:
+        """
+        Return `(ok, frame)` with the newest frame not yet handed out,
+        waiting up to `timeout` seconds for one to arrive.
+        """
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._ring or self._failed or not self._running, timeout):
+                return False, None
+            if not self._ring:
+                return False, None
+            frame, self.last_capture_ms = self._ring.pop()
+            self.dropped += len(self._ring)
+            for stale, _ in self._ring:
+                self._recycle(stale)
+            self._ring.clear()
+            self._recycle(self._handed_out)
+            self._handed_out = frame if self.reuse_buffers else None
+            self.processed += 1
+            return True, frame
+
+    def _recycle(self, frame: Optional[np.ndarray]) -> None:
+        """Return a frame array to the free list. Caller holds the lock."""
+        if self.reuse_buffers and frame is not None:
+            self._free.append(frame)
+
+    def stats(self) -> Dict[str, int]:
+        with self._cond:
+            return {
+                "captured": self.captured,
+                "dropped": self.dropped,
+                "processed": self.processed,
+            }
@@ -0,0 +1,37 @@
+import zlib
+from typing import Optional
+
+import numpy as np
+
+
+class FrameDeduplicator:
+    """
+    Detects frames that were already delivered, so their pose can be reused.
+
+    A frame is a repeat if its capture timestamp equals the previous one
+    (when the backend provides timestamps) or, without timestamps, if a CRC32
+    of every `stride`-th pixel in each direction matches the previous frame.
+    """
+
+    def __init__(self, stride: int = 16) -> None:
+        self.stride = max(1, int(stride))
+        self._last_timestamp: Optional[float] = None
+        self._last_checksum: Optional[int] = None
+        self.checked = 0
+        self.repeats = 0
+
+    def checksum(self, frame: np.ndarray) -> int:
+        return zlib.crc32(np.ascontiguousarray(frame[:: self.stride, :: self.stride]))
+
+    def is_repeat(self, frame: np.ndarray, timestamp: Optional[float] = None) -> bool:
+        self.checked += 1
+        if timestamp is not None and timestamp > 0:
+            repeat = timestamp == self._last_timestamp
+            self._last_timestamp = timestamp
+        else:
+            value = self.checksum(frame)
+            repeat = value == self._last_checksum
+            self._last_checksum = value
+        if repeat:
+            self.repeats += 1
+        return repeat
@@ -0,0 +1,109 @@
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+# Mirror pairs (subject's right, subject's left) and midline points among
+# the landmarks `PnPPoseEstimator` fits.
+MIRROR_PAIRS: List[Tuple[int, int]] = [
+    (33, 263), (133, 362), (234, 454), (127, 356), (93, 323),
+    (98, 327), (48, 278), (205, 425), (116, 345),
+]
+MIDLINE: List[int] = [1, 4, 5, 6, 9, 10, 151, 152, 168, 195, 197]
+
+# Canonical rigid face for PnPPoseEstimator, in FaceMesh image axes (x right,
+# y down, z away from the camera), units of the 234-454 cheek width. It is
+# the symmetric mean shape `symmetric_mean_shape` built from FaceMesh output
+# for about 550 frames (a real face and the synthetic face, yaw up to 20
+# deg and pitch up to 10 deg either way). Its x axis points along the
+# mirror pairs, and y lies along 10-152 (forehead to chin), so a head
+# facing the camera gives the two-axis method's straight-ahead direction.
+CANONICAL_FACE_MODEL: Dict[int, Tuple[float, float, float]] = {
+    1: (0.0000, 0.1100, -0.2864),
+    4: (0.0000, 0.0645, -0.2973),
+    5: (0.0000, 0.0100, -0.2755),
+    6: (0.0000, -0.1147, -0.1509),
+    9: (0.0000, -0.2784, -0.1167),
+    10: (0.0000, -0.4810, -0.0574),
+    33: (-0.3049, -0.1182, 0.0330),
+    48: (-0.1331, 0.1044, -0.1766),
+    93: (-0.4948, 0.1520, 0.3924),
+    98: (-0.1234, 0.1502, -0.1247),
+    116: (-0.4556, 0.0063, 0.1107),
+    127: (-0.5032, -0.0468, 0.3743),
+    133: (-0.1235, -0.1053, -0.0054),
+    151: (0.0000, -0.3821, -0.0900),
+    152: (0.0000, 0.6604, -0.0574),
+    168: (0.0000, -0.1648, -0.1159),
+    195: (0.0000, -0.0323, -0.2321),
+    197: (0.0000, -0.0715, -0.1899),
+    205: (-0.2939, 0.1443, -0.0666),
+    234: (-0.5000, 0.0530, 0.3978),
+    263: (0.3049, -0.1182, 0.0330),
+    278: (0.1331, 0.1044, -0.1766),
+    323: (0.4948, 0.1520, 0.3924),
+    327: (0.1234, 0.1502, -0.1247),
+    345: (0.4556, 0.0063, 0.1107),
+    356: (0.5032, -0.0468, 0.3743),
+    362: (0.1235, -0.1053, -0.0054),
+    425: (0.2939, 0.1443, -0.0666),
+    454: (0.5000, 0.0530, 0.3978),
+}
+
+
+def canonical_model(indices: Sequence[int]) -> np.ndarray:
+    """Return the (len(indices), 3) canonical points for FaceMesh landmark ids `indices`."""
+    missing = [i for i in indices if i not in CANONICAL_FACE_MODEL]
+    if missing:
+        raise RuntimeError(f"No canonical model points for landmarks {missing}")
+    return np.array([CANONICAL_FACE_MODEL[i] for i in indices], dtype=float)
+
+
+def _kabsch(source: np.ndarray, target: np.ndarray) -> np.ndarray:
+    """Rotation (no reflection) that best maps centred `source` onto centred `target`."""
+    u, _, vt = np.linalg.svd(source.T @ target)
+    d = np.sign(np.linalg.det(u @ vt))
+    return u @ np.diag([1.0, 1.0, d]) @ vt
+
+
+def symmetric_mean_shape(frames: np.ndarray, iterations: int = 10) -> Dict[int, Tuple[float, float, float]]:
+    """
+    Build a canonical model from FaceMesh landmark frames ((F, N, 3) pixels).
+
+    Every frame is aligned to the running mean by a rotation and scale
+    (generalised Procrustes), so each frame's own pose drops out, and the
+    mean is then expressed in mirror-symmetric axes: x from the mean
+    right-minus-left pair offset, y from 10 to 152 made orthogonal to x.
+    Pairs are averaged with their mirror image and midline points get
+    x = 0.
+    """
+    ids = [i for pair in MIRROR_PAIRS for i in pair] + MIDLINE
+    shapes = np.asarray(frames, dtype=float)[:, ids]
+    shapes = shapes - shapes.mean(axis=1, keepdims=True)
+    shapes /= np.sqrt((shapes ** 2).sum(axis=(1, 2), keepdims=True))
+    mean = shapes[0]
+    for _ in range(iterations):
+        aligned = np.array([s @ _kabsch(s, mean) for s in shapes])
+        mean = aligned.mean(axis=0)
+        mean /= np.sqrt((mean ** 2).sum())
+
+    row = {landmark: k for k, landmark in enumerate(ids)}
+    x_axis = np.mean([mean[row[b]] - mean[row[a]] for a, b in MIRROR_PAIRS], axis=0)
+    x_axis /= np.linalg.norm(x_axis)
+    y_axis = mean[row[152]] - mean[row[10]]
+    y_axis -= x_axis * (y_axis @ x_axis)
+    y_axis /= np.linalg.norm(y_axis)
+    axes = np.vstack([x_axis, y_axis, np.cross(x_axis, y_axis)])
+    local = (mean - mean.mean(axis=0)) @ axes.T
+    local /= np.linalg.norm(local[row[454]] - local[row[234]])
+
+    model: Dict[int, Tuple[float, float, float]] = {}
+    for a, b in MIRROR_PAIRS:
+        pa, pb = local[row[a]], local[row[b]]
+        x = (pb[0] - pa[0]) / 2.0
+        y, z = (pa[1] + pb[1]) / 2.0, (pa[2] + pb[2]) / 2.0
+        model[a] = (-x, y, z)
+        model[b] = (x, y, z)
+    for landmark in MIDLINE:
+        p = local[row[landmark]]
+        model[landmark] = (0.0, float(p[1]), float(p[2]))
+    return {k: (round(float(x), 4), round(float(y), 4), round(float(z), 4)) for k, (x, y, z) in sorted(model.items())}
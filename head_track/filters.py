@@ -0,0 +1,205 @@
+import math
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Any, Dict, Optional, Tuple, Type, Union
+
+from .geometry import EPS
+
+Vec3 = Tuple[float, float, float]
+
+
+def _normalize(x: float, y: float, z: float) -> Vec3:
+    n = math.sqrt(x * x + y * y + z * z) + EPS
+    return x / n, y / n, z / n
+
+
+class DirectionFilter(ABC):
+    """
+    Smooths the per-frame head direction (a unit 3-vector).
+
+    Subclasses must implement:
+      - update: take the raw direction and its timestamp (seconds), return
+        the smoothed unit direction; constant time per call
+      - reset: forget all history
+    """
+
+    @abstractmethod
+    def update(self, direction: Vec3, t: float) -> Vec3:
+        pass
+
+    @abstractmethod
+    def reset(self) -> None:
+        pass
+
+
+class MovingAverageFilter(DirectionFilter):
+    """
+    Mean of the last `window` directions, kept as running sums.
+
+    Same output as averaging the window every frame (the tracker's original
+    smoothing), with a lag of about half the window. The sums are rebuilt
+    from the window every `window * 64` frames to stop rounding drift.
+    """
+
+    def __init__(self, window: int = 8) -> None:
+        self.window = max(1, int(window))
+        self._dirs: deque[Vec3] = deque(maxlen=self.window)
+        self._sum = [0.0, 0.0, 0.0]
+        self._updates = 0
+
+    def reset(self) -> None:
+        self._dirs.clear()
+        self._sum = [0.0, 0.0, 0.0]
+        self._updates = 0
+
+    def update(self, direction: Vec3, t: float) -> Vec3:
+        s = self._sum
+        if len(self._dirs) == self.window:
+            ox, oy, oz = self._dirs[0]
+            s[0] -= ox
+            s[1] -= oy
+            s[2] -= oz
+        self._dirs.append(direction)
+        s[0] += direction[0]
+        s[1] += direction[1]
+        s[2] += direction[2]
+        self._updates += 1
+        if self._updates % (self.window * 64) == 0:
+            self._sum = s = [math.fsum(d[i] for d in self._dirs) for i in range(3)]
+        count = len(self._dirs)
+        return _normalize(s[0] / count, s[1] / count, s[2] / count)
+
+
+class EmaFilter(DirectionFilter):
+    """Exponential moving average: `out += alpha * (raw - out)`."""
+
+    def __init__(self, alpha: float = 0.3) -> None:
+        if not 0.0 < alpha <= 1.0:
+            raise ValueError("EmaFilter alpha must be in (0, 1]")
+        self.alpha = float(alpha)
+        self._state: Optional[Vec3] = None
+
+    def reset(self) -> None:
+        self._state = None
+
+    def update(self, direction: Vec3, t: float) -> Vec3:
+        if self._state is None:
+            self._state = direction
+        else:
+            a = self.alpha
+            sx, sy, sz = self._state
+            self._state = (sx + a * (direction[0] - sx), sy + a * (direction[1] - sy), sz + a * (direction[2] - sz))
+        return _normalize(*self._state)
+
+
+class OneEuroFilter(DirectionFilter):
+    """
+    One Euro filter (Casiez et al., CHI 2012) on each component.
+
+    A low-pass whose cutoff rises with speed: `min_cutoff` (Hz) sets the
+    smoothing when the head is still, `beta` how quickly the cutoff opens up
+    during motion, `d_cutoff` the smoothing of the speed estimate.
+    """
+
+    def __init__(self, min_cutoff: float = 1.0, beta: float = 0.5, d_cutoff: float = 1.0) -> None:
+        self.min_cutoff = float(min_cutoff)
+        self.beta = float(beta)
+        self.d_cutoff = float(d_cutoff)
+        self.reset()
+
+    def reset(self) -> None:
+        self._t: Optional[float] = None
+        self._x = [0.0, 0.0, 0.0]
+        self._dx = [0.0, 0.0, 0.0]
+
+    @staticmethod
+    def _alpha(cutoff: float, dt: float) -> float:
+        tau = 1.0 / (2.0 * math.pi * cutoff)
+        return 1.0 / (1.0 + tau / dt)
+
+    def update(self, direction: Vec3, t: float) -> Vec3:
+        if self._t is None:
+            self._t = t
+            self._x = list(direction)
+            self._dx = [0.0, 0.0, 0.0]
+            return _normalize(*direction)
+        dt = max(t - self._t, 1e-6)
+        self._t = t
+        a_d = self._alpha(self.d_cutoff, dt)
+        for i in range(3):
+            prev = self._x[i]
+            dx = self._dx[i] + a_d * ((direction[i] - prev) / dt - self._dx[i])
+            self._dx[i] = dx
+            a = self._alpha(self.min_cutoff + self.beta * abs(dx), dt)
+            self._x[i] = prev + a * (direction[i] - prev)
+        return _normalize(*self._x)
+
+
+class KalmanFilter(DirectionFilter):
+    """
+    Constant-velocity Kalman filter, one independent position/velocity
+    model per component.
+
+    `process_noise` is the acceleration variance (units/s^2 squared) the
+    model allows; `measurement_noise` the variance of a raw direction
+    component. Lower process noise smooths more and lags more.
+    """
+
+    def __init__(self, process_noise: float = 1.0, measurement_noise: float = 3e-4) -> None:
+        self.process_noise = float(process_noise)
+        self.measurement_noise = float(measurement_noise)
+        self.reset()
+
+    def reset(self) -> None:
+        self._t: Optional[float] = None
+        # Per component: position, velocity and the symmetric 2x2 covariance.
+        self._x = [0.0] * 3
+        self._v = [0.0] * 3
+        self._p = [(1.0, 0.0, 1.0)] * 3
+
+    def update(self, direction: Vec3, t: float) -> Vec3:
+        if self._t is None:
+            self._t = t
+            self._x = list(direction)
+            self._v = [0.0] * 3
+            self._p = [(self.measurement_noise, 0.0, 1.0)] * 3
+            return _normalize(*direction)
+        dt = max(t - self._t, 1e-6)
+        self._t = t
+        q = self.process_noise
+        r = self.measurement_noise
+        for i in range(3):
+            p00, p01, p11 = self._p[i]
+            # Predict.
+            x = self._x[i] + dt * self._v[i]
+            v = self._v[i]
+            p00 = p00 + dt * (2.0 * p01 + dt * p11) + q * dt ** 4 / 4.0
+            p01 = p01 + dt * p11 + q * dt ** 3 / 2.0
+            p11 = p11 + q * dt * dt
+            # Correct with the measured component.
+            s = p00 + r
+            k0 = p00 / s
+            k1 = p01 / s
+            residual = direction[i] - x
+            self._x[i] = x + k0 * residual
+            self._v[i] = v + k1 * residual
+            self._p[i] = ((1.0 - k0) * p00, (1.0 - k0) * p01, p11 - k1 * p01)
+        return _normalize(*self._x)
+
+
+FILTERS: Dict[str, Type[DirectionFilter]] = {
+    "moving_average": MovingAverageFilter,
+    "ema": EmaFilter,
+    "one_euro": OneEuroFilter,
+    "kalman": KalmanFilter,
+}
+
+
+def create_filter(smoothing: Union[str, DirectionFilter], **kwargs: Any) -> DirectionFilter:
+    """Return `smoothing` if it is already a filter, else build the named one from `FILTERS`."""
+    if isinstance(smoothing, DirectionFilter):
+        return smoothing
+    cls = FILTERS.get(smoothing)
+    if cls is None:
+        raise RuntimeError(f"Unknown smoothing filter {smoothing!r}. Available: {', '.join(FILTERS)}")
+    return cls(**kwargs)
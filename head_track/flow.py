@@ -0,0 +1,142 @@
+from typing import List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+# FaceMesh landmarks with image texture that stay rigid with the skull:
+# eye corners, nose bridge, tip and nostrils. The silhouette points the
+# two-axis method uses (234/454) sit on the face outline, where flow slides
+# along the edge, and lips/brows move with expressions.
+FLOW_LANDMARKS: List[int] = [
+    33, 133, 362, 263,
+    1, 4, 5, 6, 168, 195, 197,
+    98, 327, 48, 278, 64, 294,
+]
+
+
+def rigid_fit(reference: np.ndarray, xy: np.ndarray) -> Tuple[float, np.ndarray, np.ndarray, float]:
+    """
+    Fit `xy` ((K, 2) pixels) as a scaled rotation of `reference` ((K, 3)
+    pixel landmarks, z scaled like x) under the weak-perspective projection
+    FaceMesh landmarks follow: xy ~ scale * R[:2] @ (p - mean) + shift.
+
+    Returns (scale, R, shift, rms error in pixels), where R is the 3x3
+    rotation from the reference pose to the observed one. Needs points that
+    are not coplanar (the nose tip against the eye corners).
+    """
+    center = reference.mean(axis=0)
+    a = reference - center
+    shift = xy.mean(axis=0)
+    b = xy - shift
+    m = np.linalg.lstsq(a, b, rcond=None)[0].T
+    # Nearest pair of orthonormal rows to the 2x3 linear fit.
+    u, s, vt = np.linalg.svd(m, full_matrices=False)
+    rows = u @ vt
+    rotation = np.vstack([rows, np.cross(rows[0], rows[1])])
+    scale = float(s.mean())
+    residual = scale * (a @ rows.T) - b
+    error = float(np.sqrt(np.mean(np.sum(residual * residual, axis=1))))
+    return scale, rotation, shift, error
+
+
+class LandmarkFlow:
+    """
+    Carries the head pose from frame to frame between FaceMesh runs.
+
+    `reset()` takes the FaceMesh landmarks of the inference frame: the
+    textured `FLOW_LANDMARKS` points, which are followed with pyramidal
+    Lucas-Kanade optical flow, and the key points the pose stage needs,
+    which are carried. Each `track()` fits a rigid motion (`rigid_fit`)
+    from the tracked points' 3D positions at the inference frame to their
+    2D positions now, and applies it to the key points, so their depth
+    turns with the head and the pose changes on flow frames.
+
+    Each point is checked forward-backward (flowed to the new frame and
+    back); points lost or with a round-trip error above `max_error` pixels
+    are dropped. `track()` returns None, signalling that FaceMesh should
+    run, once fewer than `min_points` remain or the rigid fit is off by more
+    than `max_error` pixels RMS.
+    """
+
+    def __init__(self, max_error: float = 2.0, min_points: int = 8, win_size: int = 21, max_level: int = 3) -> None:
+        self.max_error = float(max_error)
+        self.min_points = max(4, int(min_points))
+        self._lk_params = dict(
+            winSize=(win_size, win_size),
+            maxLevel=max_level,
+            criteria=(cv2.TERM_CRITERIA_EPS | cv2.TERM_CRITERIA_COUNT, 20, 0.03),
+        )
+        self._prev_gray: Optional[np.ndarray] = None
+        self._reference: Optional[np.ndarray] = None
+        self._xy: Optional[np.ndarray] = None
+        self._carried: Optional[np.ndarray] = None
+        self.last_error = 0.0
+        self.last_fit_error = 0.0
+
+    @property
+    def active(self) -> bool:
+        return self._reference is not None
+
+    def reset(self, gray: np.ndarray, tracked: np.ndarray, carried: np.ndarray) -> None:
+        """
+        Start from `gray` with the (T, 3) pixel landmarks to follow and the
+        (K, 3) pixel key points to carry, both from the same FaceMesh run.
+        """
+        self._prev_gray = gray
+        self._reference = np.array(tracked, dtype=np.float64)
+        self._xy = np.ascontiguousarray(self._reference[:, None, :2], dtype=np.float32)
+        self._carried = np.array(carried, dtype=np.float64)
+        self.last_error = self.last_fit_error = 0.0
+
+    def clear(self) -> None:
+        self._prev_gray = None
+        self._reference = None
+        self._xy = None
+        self._carried = None
+
+    def track(self, gray: np.ndarray) -> Optional[np.ndarray]:
+        """Return the key points moved to `gray` as (K, 3) pixels, or None if tracking was lost."""
+        if self._reference is None:
+            return None
+
+        prev_xy = self._xy
+        next_xy, status, _ = cv2.calcOpticalFlowPyrLK(self._prev_gray, gray, prev_xy, None, **self._lk_params)
+        if next_xy is None:
+            self.clear()
+            return None
+        back_xy, back_status, _ = cv2.calcOpticalFlowPyrLK(gray, self._prev_gray, next_xy, None, **self._lk_params)
+        if back_xy is None:
+            self.clear()
+            return None
+
+        h, w = gray.shape[:2]
+        xy = next_xy.reshape(-1, 2)
+        errors = np.linalg.norm((back_xy - prev_xy).reshape(-1, 2), axis=1)
+        keep = (
+            (status.ravel() == 1)
+            & (back_status.ravel() == 1)
+            & (errors <= self.max_error)
+            & (xy[:, 0] >= 0) & (xy[:, 0] < w) & (xy[:, 1] >= 0) & (xy[:, 1] < h)
+        )
+        if int(keep.sum()) < self.min_points:
+            self.clear()
+            return None
+        self.last_error = float(errors[keep].max())
+
+        scale, rotation, shift, fit_error = rigid_fit(self._reference[keep], xy[keep].astype(np.float64))
+        self.last_fit_error = fit_error
+        if fit_error > self.max_error:
+            self.clear()
+            return None
+
+        if not keep.all():
+            self._reference = self._reference[keep]
+            next_xy = next_xy[keep]
+        self._xy = next_xy
+        self._prev_gray = gray
+
+        center = self._reference.mean(axis=0)
+        moved = scale * (self._carried - center) @ rotation.T
+        moved[:, :2] += shift
+        moved[:, 2] += center[2]
+        return moved
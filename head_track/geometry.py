@@ -0,0 +1,144 @@
+import math
+from typing import Iterable, Sequence, Tuple
+
+import numpy as np
+
+EPS = 1e-9
+
+# The scalar functions below work on plain floats: a frame costs a few dozen
+# float operations instead of a chain of small NumPy calls that each allocate
+# a temporary 3-vector. `pose_batch`/`screen_batch` do the same for many
+# recorded frames at once. Straight ahead is (180, 180) degrees before
+# calibration offsets are added.
+
+Vec3 = Tuple[float, float, float]
+
+
+def forward_vector(left: Sequence[float], right: Sequence[float], top: Sequence[float], bottom: Sequence[float]) -> Vec3:
+    """Return the unit facing direction from the face's left/right/top/bottom landmarks."""
+    ax = right[0] - left[0]
+    ay = right[1] - left[1]
+    az = right[2] - left[2]
+    n = math.sqrt(ax * ax + ay * ay + az * az) + EPS
+    ax /= n
+    ay /= n
+    az /= n
+
+    ux = top[0] - bottom[0]
+    uy = top[1] - bottom[1]
+    uz = top[2] - bottom[2]
+    n = math.sqrt(ux * ux + uy * uy + uz * uz) + EPS
+    ux /= n
+    uy /= n
+    uz /= n
+
+    fx = ay * uz - az * uy
+    fy = az * ux - ax * uz
+    fz = ax * uy - ay * ux
+    n = math.sqrt(fx * fx + fy * fy + fz * fz) + EPS
+    return -fx / n, -fy / n, -fz / n
+
+
+def mean_direction(directions: Iterable[Vec3]) -> Vec3:
+    """Return the normalized mean of a window of unit directions."""
+    sx = sy = sz = 0.0
+    count = 0
+    for x, y, z in directions:
+        sx += x
+        sy += y
+        sz += z
+        count += 1
+    sx /= count
+    sy /= count
+    sz /= count
+    n = math.sqrt(sx * sx + sy * sy + sz * sz) + EPS
+    return sx / n, sy / n, sz / n
+
+
+def _clip_unit(value: float) -> float:
+    return -1.0 if value < -1.0 else 1.0 if value > 1.0 else value
+
+
+def direction_to_angles(dx: float, dy: float, dz: float) -> Tuple[float, float]:
+    """Return uncalibrated (yaw, pitch) in degrees for a facing direction."""
+    # Angle between the reference forward (0, 0, -1) and the direction
+    # projected onto the xz (yaw) and yz (pitch) planes.
+    yaw = math.degrees(math.acos(_clip_unit(-dz / (math.sqrt(dx * dx + dz * dz) + EPS))))
+    if dx < 0:
+        yaw = -yaw
+    pitch = math.degrees(math.acos(_clip_unit(-dz / (math.sqrt(dy * dy + dz * dz) + EPS))))
+    if dy > 0:
+        pitch = -pitch
+
+    if yaw < 0:
+        yaw = abs(yaw)
+    elif yaw < 180:
+        yaw = 360 - yaw
+    if pitch < 0:
+        pitch = 360 + pitch
+    return yaw, pitch
+
+
+def map_to_screen(yaw: float, pitch: float, yaw_span: float, pitch_span: float, screen_w: int, screen_h: int) -> Tuple[int, int]:
+    """Map calibrated angles to pixel coordinates, clamped to the screen."""
+    sx = int(((yaw - (180.0 - yaw_span)) / (2.0 * yaw_span)) * screen_w)
+    sy = int(((180.0 + pitch_span - pitch) / (2.0 * pitch_span)) * screen_h)
+    sx = max(0, min(screen_w - 1, sx))
+    sy = max(0, min(screen_h - 1, sy))
+    return sx, sy
+
+
+def _normalize_rows(v: np.ndarray) -> np.ndarray:
+    v /= np.linalg.norm(v, axis=1, keepdims=True) + EPS
+    return v
+
+
+def pose_batch(
+    key_points: np.ndarray,
+    smooth_len: int = 8,
+    calib_yaw: float = 0.0,
+    calib_pitch: float = 0.0,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute calibrated (yaw, pitch) arrays for F frames of key points.
+
+    `key_points` is (F, >=4, 3) in left/right/top/bottom order, one row per
+    frame with a detected face. Smoothing matches the tracker: each frame
+    uses the mean direction of the last `smooth_len` frames (fewer at the
+    start).
+    """
+    pts = np.asarray(key_points, dtype=float)
+    count = pts.shape[0]
+    right_axis = _normalize_rows(pts[:, 1] - pts[:, 0])
+    up_axis = _normalize_rows(pts[:, 2] - pts[:, 3])
+    fwd = -_normalize_rows(np.cross(right_axis, up_axis))
+
+    sums = np.zeros((count + 1, 3))
+    np.cumsum(fwd, axis=0, out=sums[1:])
+    end = np.arange(1, count + 1)
+    start = np.maximum(0, end - max(1, int(smooth_len)))
+    avg = _normalize_rows((sums[end] - sums[start]) / (end - start)[:, None])
+
+    dx, dy, dz = avg[:, 0], avg[:, 1], avg[:, 2]
+    yaw = np.degrees(np.arccos(np.clip(-dz / (np.sqrt(dx * dx + dz * dz) + EPS), -1.0, 1.0)))
+    yaw = np.where(dx < 0, -yaw, yaw)
+    pitch = np.degrees(np.arccos(np.clip(-dz / (np.sqrt(dy * dy + dz * dz) + EPS), -1.0, 1.0)))
+    pitch = np.where(dy > 0, -pitch, pitch)
+
+    yaw = np.where(yaw < 0, np.abs(yaw), np.where(yaw < 180, 360 - yaw, yaw))
+    pitch = np.where(pitch < 0, 360 + pitch, pitch)
+    return yaw + calib_yaw, pitch + calib_pitch
+
+
+def screen_batch(
+    yaw: np.ndarray,
+    pitch: np.ndarray,
+    yaw_span: float,
+    pitch_span: float,
+    screen_w: int,
+    screen_h: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorized `map_to_screen`."""
+    sx = (((np.asarray(yaw) - (180.0 - yaw_span)) / (2.0 * yaw_span)) * screen_w).astype(np.int64)
+    sy = (((180.0 + pitch_span - np.asarray(pitch)) / (2.0 * pitch_span)) * screen_h).astype(np.int64)
+    return np.clip(sx, 0, screen_w - 1), np.clip(sy, 0, screen_h - 1)
@@ -0,0 +1,92 @@
+from typing import Optional
+
+import numpy as np
+
+# A FaceMesh NormalizedLandmarkList serializes each landmark as a 17-byte
+# record: field tag 0x0A, length 15, then x, y and z as tagged 4-byte floats.
+_RECORD_BYTES = 17
+_XYZ_OFFSET = 3
+_XYZ_STRIDE = 5
+_RECORD_TAGS = ((0, 0x0A), (1, 0x0F), (2, 0x0D), (7, 0x15), (12, 0x1D))
+
+
+def _serialized_xyz(landmark_list, count: int) -> Optional[np.ndarray]:
+    """
+    Return a strided (count, 3) float32 view of x/y/z inside the serialized
+    protobuf, or None if the records are not in the fixed 17-byte layout
+    (e.g. visibility or presence fields are set).
+    """
+    raw = landmark_list.SerializeToString()
+    if len(raw) != count * _RECORD_BYTES:
+        return None
+    records = np.frombuffer(raw, dtype=np.uint8).reshape(count, _RECORD_BYTES)
+    for col, tag in _RECORD_TAGS:
+        if not (records[:, col] == tag).all():
+            return None
+    return np.ndarray(
+        (count, 3),
+        dtype="<f4",
+        buffer=raw,
+        offset=_XYZ_OFFSET,
+        strides=(_RECORD_BYTES, _XYZ_STRIDE),
+    )
+
+
+def normalized_landmarks(landmark_list, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Copy the landmarks of a FaceMesh `NormalizedLandmarkList` into an (N, 3)
+    float32 array (`out` when it has the right shape).
+
+    Reads x/y/z straight from the serialized message instead of touching
+    every landmark object from Python, falling back to attribute access if
+    the message layout is unexpected.
+    """
+    count = len(landmark_list.landmark)
+    if out is None or out.shape != (count, 3) or out.dtype != np.float32:
+        out = np.empty((count, 3), dtype=np.float32)
+    xyz = _serialized_xyz(landmark_list, count)
+    if xyz is not None:
+        np.copyto(out, xyz)
+    else:
+        out[:] = [(p.x, p.y, p.z) for p in landmark_list.landmark]
+    return out
+
+
+class LandmarkArray:
+    """
+    One preallocated (N, 3) float32 array of landmarks in full-frame pixels,
+    refilled once per frame and shared by every consumer.
+
+    Consumers should index into `pixels` (e.g. `pixels[EYE_INDICES]`) rather
+    than keep it: the next fill overwrites it.
+    """
+
+    def __init__(self, count: int = 478) -> None:
+        self.pixels = np.zeros((count, 3), dtype=np.float32)
+
+    def _fit(self, count: int) -> np.ndarray:
+        if self.pixels.shape[0] != count:
+            self.pixels = np.zeros((count, 3), dtype=np.float32)
+        return self.pixels
+
+    def from_landmark_list(self, landmark_list, x0: int, y0: int, crop_w: int, crop_h: int) -> np.ndarray:
+        """Fill from a FaceMesh result normalized to a (crop_w, crop_h) crop at (x0, y0)."""
+        pixels = self._fit(len(landmark_list.landmark))
+        normalized_landmarks(landmark_list, out=pixels)
+        return self._to_pixels(pixels, x0, y0, crop_w, crop_h)
+
+    def from_normalized(self, normalized: np.ndarray, x0: int, y0: int, crop_w: int, crop_h: int) -> np.ndarray:
+        """Fill from an (N, 3) normalized array, e.g. one returned by `FaceMeshWorker`."""
+        pixels = self._fit(normalized.shape[0])
+        np.copyto(pixels, normalized)
+        return self._to_pixels(pixels, x0, y0, crop_w, crop_h)
+
+    @staticmethod
+    def _to_pixels(pixels: np.ndarray, x0: int, y0: int, crop_w: int, crop_h: int) -> np.ndarray:
+        # Depth is scaled like x, as FaceMesh normalizes z by the image width.
+        pixels[:, 0] *= crop_w
+        pixels[:, 0] += x0
+        pixels[:, 1] *= crop_h
+        pixels[:, 1] += y0
+        pixels[:, 2] *= crop_w
+        return pixels
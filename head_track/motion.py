@@ -0,0 +1,158 @@
+import time
+from typing import Any, Dict, Optional
+
+import cv2
+import numpy as np
+
+ACTIVE = "active"
+STILL = "still"
+IDLE = "idle"
+
+
+class MotionGate:
+    """
+    Decides per frame whether FaceMesh inference is worth running.
+
+    A motion score (mean absolute difference of a tiny grayscale thumbnail
+    against the previous frame) drives three states:
+      - active: motion above `motion_threshold`, infer every frame
+      - still:  face visible but no motion, infer every `still_stride` frames
+      - idle:   no face for `idle_after_sec`; the loop is throttled to
+                `idle_fps` and only motion (or a probe every
+                `idle_probe_sec`) triggers inference
+    Motion in any state switches straight back to active.
+
+    Also reports process CPU time per wall second and wake-up latency: the
+    time from the idle frame that showed motion to the next detected face.
+    """
+
+    def __init__(
+        self,
+        motion_threshold: float = 1.5,
+        still_stride: int = 4,
+        idle_after_sec: float = 5.0,
+        idle_fps: float = 2.0,
+        idle_probe_sec: float = 1.0,
+        thumb_size: tuple = (32, 24),
+    ) -> None:
+        self.motion_threshold = float(motion_threshold)
+        self.still_stride = max(1, int(still_stride))
+        self.idle_after_sec = float(idle_after_sec)
+        self.idle_fps = float(idle_fps)
+        self.idle_probe_sec = float(idle_probe_sec)
+        self._thumb_size = thumb_size
+
+        now = time.perf_counter()
+        self.state = ACTIVE
+        self.motion = 0.0
+        self._prev_thumb: Optional[np.ndarray] = None
+        self._last_face_at = now
+        self._last_infer_at = now
+        self._last_frame_at = now
+        self._frames_since_infer = 0
+        self._wake_started_at: Optional[float] = None
+
+        self.frames = 0
+        self.inferences = 0
+        self.skipped = 0
+        self.wakeups = 0
+        self.last_wake_latency: Optional[float] = None
+        self._wake_latency_total = 0.0
+        self._wakes_measured = 0
+
+        self._cpu_window_start = (now, time.process_time())
+        self._frames_in_window = 0
+        self._inferences_in_window = 0
+        self.cpu_per_sec = 0.0
+        self.inference_rate = 0.0
+        self.frame_rate = 0.0
+
+    def motion_score(self, frame: np.ndarray) -> float:
+        thumb = cv2.cvtColor(cv2.resize(frame, self._thumb_size, interpolation=cv2.INTER_AREA), cv2.COLOR_BGR2GRAY)
+        prev, self._prev_thumb = self._prev_thumb, thumb
+        if prev is None:
+            return float("inf")
+        return float(cv2.absdiff(thumb, prev).mean())
+
+    def throttle_delay(self) -> float:
+        """Seconds the caller should wait before reading the next frame."""
+        if self.state != IDLE or self.idle_fps <= 0:
+            return 0.0
+        return max(0.0, self._last_frame_at + 1.0 / self.idle_fps - time.perf_counter())
+
+    def should_infer(self, frame: np.ndarray) -> bool:
+        """Score `frame` for motion, update the state and decide on inference."""
+        now = time.perf_counter()
+        self._last_frame_at = now
+        self.frames += 1
+        self._frames_in_window += 1
+        self.motion = self.motion_score(frame)
+        moving = self.motion >= self.motion_threshold
+
+        if moving:
+            if self.state == IDLE:
+                self.wakeups += 1
+                self._wake_started_at = now
+            self.state = ACTIVE
+        elif self.state == ACTIVE and now - self._last_face_at < self.idle_after_sec:
+            self.state = STILL
+
+        if self.state == ACTIVE:
+            infer = True
+        elif self.state == STILL:
+            infer = self._frames_since_infer + 1 >= self.still_stride
+        else:
+            infer = now - self._last_infer_at >= self.idle_probe_sec
+
+        if infer:
+            self._frames_since_infer = 0
+            self._last_infer_at = now
+            self.inferences += 1
+            self._inferences_in_window += 1
+        else:
+            self._frames_since_infer += 1
+            self.skipped += 1
+        self._update_rates(now)
+        return infer
+
+    def report_face(self, found: bool) -> None:
+        """Record the outcome of an inference started after `should_infer`."""
+        now = time.perf_counter()
+        if found:
+            self._last_face_at = now
+            if self._wake_started_at is not None:
+                self.last_wake_latency = now - self._wake_started_at
+                self._wake_latency_total += self.last_wake_latency
+                self._wakes_measured += 1
+                self._wake_started_at = None
+        elif now - self._last_face_at >= self.idle_after_sec:
+            self.state = IDLE
+
+    def _update_rates(self, now: float) -> None:
+        start_wall, start_cpu = self._cpu_window_start
+        elapsed = now - start_wall
+        if elapsed < 1.0:
+            return
+        cpu = time.process_time()
+        self.cpu_per_sec = (cpu - start_cpu) / elapsed
+        self.frame_rate = self._frames_in_window / elapsed
+        self.inference_rate = self._inferences_in_window / elapsed
+        self._cpu_window_start = (now, cpu)
+        self._frames_in_window = 0
+        self._inferences_in_window = 0
+
+    def stats(self) -> Dict[str, Any]:
+        woken = self._wakes_measured
+        return {
+            "state": self.state,
+            "motion": self.motion,
+            "frames": self.frames,
+            "inferences": self.inferences,
+            "skipped": self.skipped,
+            "frame_rate": self.frame_rate,
+            "inference_rate": self.inference_rate,
+            "cpu_per_sec": self.cpu_per_sec,
+            "wakeups": self.wakeups,
+            "last_wake_latency_sec": self.last_wake_latency,
+            "mean_wake_latency_sec": self._wake_latency_total / woken if woken > 0 else None,
+        }
@@ -0,0 +1,166 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+from .face_model import canonical_model
+from .geometry import Vec3, forward_vector
+
+# FaceMesh landmarks on rigid parts of the face (nose, forehead, eye
+# corners, cheekbones, temples). Lips, eyelids, brows and the jaw move with
+# expressions and are left out.
+STABLE_LANDMARKS: List[int] = [
+    1, 4, 5, 6, 9, 10, 151, 168, 195, 197,
+    33, 133, 362, 263,
+    234, 454, 127, 356, 93, 323,
+    98, 327, 48, 278, 205, 425, 116, 345,
+]
+
+# Left, right, top, bottom landmarks that define the forward axis, as used by
+# the tracker's two-axis method.
+AXIS_LANDMARKS: List[int] = [234, 454, 10, 152]
+
+
+def load_obj_vertices(path: str) -> np.ndarray:
+    """
+    Return the (N, 3) vertices of a Wavefront .obj file, e.g. MediaPipe's
+    canonical_face_model.obj, converted from its y-up, z-towards-viewer
+    axes to FaceMesh image axes.
+    """
+    vertices = []
+    with open(path) as f:
+        for line in f:
+            if line.startswith("v "):
+                vertices.append([float(v) for v in line.split()[1:4]])
+    if not vertices:
+        raise RuntimeError(f"No vertices found in {path}")
+    return np.array(vertices) * (1.0, -1.0, -1.0)
+
+
+class PnPPoseEstimator:
+    """
+    Head direction from a rigid 3D face model fitted to many FaceMesh
+    landmarks with `cv2.solvePnP`.
+
+    The model is the shipped `face_model.CANONICAL_FACE_MODEL`, a fixed
+    symmetric face, so no pose error of the user's first frames is baked
+    in. Pass `model` ((N, 3), indexed by FaceMesh landmark id, e.g. from
+    `load_obj_vertices`) to use another one. Models use FaceMesh image
+    axes: x right, y down, z away from the camera.
+
+    The camera is a pinhole with focal length `focal_scale` times the frame
+    width and a centred principal point. The default is deliberately long,
+    to match the nearly orthographic geometry of FaceMesh landmarks (it gave
+    the lowest jitter of 5, 20 and 100). Use 1.0 with a metric model.
+
+    After the first solve each frame starts from the previous rotation and
+    translation (`useExtrinsicGuess`), so the iterative solver converges in a
+    few steps. The direction is the model's forward axis (built from the same
+    left/right/top/bottom landmarks as the two-axis method) rotated into the
+    camera frame, so angles follow the tracker's convention.
+    """
+
+    def __init__(
+        self,
+        indices: Sequence[int] = STABLE_LANDMARKS,
+        model: Optional[np.ndarray] = None,
+        max_reprojection_px: float = 8.0,
+        focal_scale: float = 5.0,
+    ) -> None:
+        self.indices = list(indices)
+        # Rows of `points` passed to update(): stable landmarks, then axis landmarks.
+        self.point_indices = self.indices + AXIS_LANDMARKS
+        self.max_reprojection_px = float(max_reprojection_px)
+        self.focal_scale = float(focal_scale)
+        if model is None:
+            points = canonical_model(self.point_indices)
+        else:
+            points = np.asarray(model, dtype=float)[self.point_indices]
+        self._set_model(points)
+
+        self._camera: Optional[np.ndarray] = None
+        self._camera_size: Optional[Tuple[int, int]] = None
+        self._dist = np.zeros(4)
+        self._rvec: Optional[np.ndarray] = None
+        self._tvec: Optional[np.ndarray] = None
+        self.solves = 0
+        self.warm_starts = 0
+        self.failures = 0
+        self.last_reprojection_px = 0.0
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "solves": self.solves,
+            "warm_starts": self.warm_starts,
+            "failures": self.failures,
+            "last_reprojection_px": self.last_reprojection_px,
+        }
+
+    def _set_model(self, points: np.ndarray) -> None:
+        # Only the stable rows are fitted; the axis rows (the chin among
+        # them) just define the forward direction.
+        count = len(self.indices)
+        centered = points - points[:count].mean(axis=0)
+        self._object_points = np.ascontiguousarray(centered[:count], dtype=np.float64)
+        left, right, top, bottom = centered[count:].tolist()
+        self._model_forward = np.array(forward_vector(left, right, top, bottom))
+
+    def _camera_matrix(self, frame_w: int, frame_h: int) -> np.ndarray:
+        if self._camera_size != (frame_w, frame_h):
+            # FaceMesh landmarks are close to a weak-perspective projection, so
+            # a long focal length (nearly orthographic) fits them best.
+            f = self.focal_scale * frame_w
+            self._camera = np.array([[f, 0.0, frame_w / 2.0], [0.0, f, frame_h / 2.0], [0.0, 0.0, 1.0]])
+            self._camera_size = (frame_w, frame_h)
+            self._rvec = self._tvec = None
+        return self._camera
+
+    def _initial_guess(self, image_points: np.ndarray, camera: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Facing the camera (no rotation: the model's own pose), at the
+        distance where the model's spread matches the face in the image.
+        """
+        f = camera[0, 0]
+        center = image_points.mean(axis=0)
+        model_spread = np.sqrt(np.mean(np.sum(self._object_points[:, :2] ** 2, axis=1)))
+        image_spread = np.sqrt(np.mean(np.sum((image_points - center) ** 2, axis=1))) + 1e-9
+        z = f * model_spread / image_spread
+        tvec = np.array([[(center[0] - camera[0, 2]) * z / f], [(center[1] - camera[1, 2]) * z / f], [z]])
+        return np.zeros((3, 1)), tvec
+
+    def update(self, points: np.ndarray, frame_w: int, frame_h: int) -> Optional[Vec3]:
+        """
+        Return the head direction for `points` ((K, 3) pixel landmarks in
+        `point_indices` order), or None if the fit failed.
+        """
+        image_points = np.ascontiguousarray(points[: len(self.indices), :2], dtype=np.float64)
+        camera = self._camera_matrix(frame_w, frame_h)
+        if self._rvec is not None:
+            self.warm_starts += 1
+        else:
+            self._rvec, self._tvec = self._initial_guess(image_points, camera)
+        try:
+            ok, rvec, tvec = cv2.solvePnP(
+                self._object_points, image_points, camera, self._dist,
+                rvec=self._rvec, tvec=self._tvec, useExtrinsicGuess=True, flags=cv2.SOLVEPNP_ITERATIVE,
+            )
+        except cv2.error:
+            ok = False
+        self.solves += 1
+        if not ok:
+            self.failures += 1
+            self._rvec = self._tvec = None
+            return None
+
+        projected, _ = cv2.projectPoints(self._object_points, rvec, tvec, camera, self._dist)
+        self.last_reprojection_px = float(np.sqrt(np.mean(np.sum((projected.reshape(-1, 2) - image_points) ** 2, axis=1))))
+        if self.last_reprojection_px > self.max_reprojection_px:
+            # Bad fit: do not warm-start the next frame from it.
+            self.failures += 1
+            self._rvec = self._tvec = None
+            return None
+        self._rvec, self._tvec = rvec, tvec
+
+        rotation, _ = cv2.Rodrigues(rvec)
+        fx, fy, fz = (rotation @ self._model_forward).tolist()
+        return fx, fy, fz
@@ -0,0 +1,82 @@
+from typing import NamedTuple, Optional, Tuple
+
+
+class PosePrediction(NamedTuple):
+    """Pose extrapolated to when the cursor will show it."""
+
+    yaw: float
+    pitch: float
+    pos: Optional[Tuple[int, int]]
+    horizon_sec: float
+    latency_sec: float
+
+
+class PosePredictor:
+    """
+    Extrapolates (yaw, pitch) ahead by a horizon with a constant-acceleration
+    model.
+
+    Velocity and acceleration are finite differences of successive samples
+    (timestamped at capture), each smoothed with an EMA weight `smoothing`
+    to keep landmark noise from being amplified. Predictions never look
+    further ahead than `max_horizon_sec` and never move more than
+    `max_delta_deg` from the last measured angle, so a jerk or a bad frame
+    cannot fling the cursor.
+    """
+
+    def __init__(
+        self,
+        max_horizon_sec: float = 0.1,
+        max_delta_deg: float = 5.0,
+        smoothing: float = 0.5,
+        use_acceleration: bool = True,
+    ) -> None:
+        self.max_horizon_sec = float(max_horizon_sec)
+        self.max_delta_deg = float(max_delta_deg)
+        self.smoothing = float(smoothing)
+        self.use_acceleration = bool(use_acceleration)
+        self.reset()
+
+    def reset(self) -> None:
+        self._t: Optional[float] = None
+        self._angles = (0.0, 0.0)
+        self._vel: Optional[Tuple[float, float]] = None
+        self._acc = (0.0, 0.0)
+
+    def update(self, yaw: float, pitch: float, t: float) -> None:
+        """Add a measured pose captured at time `t` (seconds)."""
+        if self._t is not None and t > self._t:
+            dt = t - self._t
+            vy = (yaw - self._angles[0]) / dt
+            vp = (pitch - self._angles[1]) / dt
+            a = self.smoothing
+            if self._vel is None:
+                self._vel = (vy, vp)
+            else:
+                old_y, old_p = self._vel
+                new_y = old_y + a * (vy - old_y)
+                new_p = old_p + a * (vp - old_p)
+                ay = (new_y - old_y) / dt
+                ap = (new_p - old_p) / dt
+                self._acc = (self._acc[0] + a * (ay - self._acc[0]), self._acc[1] + a * (ap - self._acc[1]))
+                self._vel = (new_y, new_p)
+        self._t = t
+        self._angles = (yaw, pitch)
+
+    def _clamp(self, delta: float) -> float:
+        limit = self.max_delta_deg
+        return -limit if delta < -limit else limit if delta > limit else delta
+
+    def predict(self, horizon_sec: float) -> Tuple[float, float]:
+        """Return (yaw, pitch) extrapolated `horizon_sec` past the last sample."""
+        yaw, pitch = self._angles
+        if self._vel is None:
+            return yaw, pitch
+        h = max(0.0, min(horizon_sec, self.max_horizon_sec))
+        vy, vp = self._vel
+        dy = vy * h
+        dp = vp * h
+        if self.use_acceleration:
+            dy += 0.5 * self._acc[0] * h * h
+            dp += 0.5 * self._acc[1] * h * h
+        return yaw + self._clamp(dy), pitch + self._clamp(dp)
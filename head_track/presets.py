@@ -0,0 +1,57 @@
+from typing import Dict, List, NamedTuple, Union
+
+AUTO_PRESET = "auto"
+
+
+class InferencePreset(NamedTuple):
+    """FaceMesh options, capture size and inference stride that go together."""
+
+    name: str
+    refine_landmarks: bool
+    min_detection_confidence: float
+    min_tracking_confidence: float
+    width: int
+    height: int
+    # FaceMesh runs every `flow_interval` frames; optical flow fills the gaps.
+    # An explicit HeadPoseTracker(flow_interval=...) overrides it.
+    flow_interval: int
+
+
+# Ordered from best quality to cheapest. Iris refinement only helps eye-based
+# features (wink detection reads eye contours, which exist without it). The
+# presets run FaceMesh on every frame: a flow stride gave no throughput gain
+# beyond run-to-run noise in benchmarks.tracker_throughput, so it is left to
+# an explicit flow_interval (see benchmarks.flow_tracking).
+PRESETS: Dict[str, InferencePreset] = {
+    p.name: p
+    for p in (
+        InferencePreset("quality", True, 0.5, 0.5, 1280, 720, 1),
+        InferencePreset("balanced", False, 0.5, 0.5, 640, 480, 1),
+        InferencePreset("fast", False, 0.5, 0.4, 640, 480, 1),
+        InferencePreset("low_power", False, 0.5, 0.4, 320, 240, 1),
+    )
+}
+
+
+def get_preset(preset: Union[str, InferencePreset]) -> InferencePreset:
+    if isinstance(preset, InferencePreset):
+        return preset
+    found = PRESETS.get(preset)
+    if found is None:
+        raise RuntimeError(f"Unknown preset {preset!r}. Available: {AUTO_PRESET}, {', '.join(PRESETS)}")
+    return found
+
+
+def choose_preset(fps_by_preset: Dict[str, float], target_fps: float, order: List[str] = None) -> InferencePreset:
+    """
+    Return the first preset in `order` (default: best quality first) whose
+    measured frame rate meets `target_fps`, or the fastest one measured if
+    none does.
+    """
+    order = [name for name in (order or list(PRESETS)) if name in fps_by_preset]
+    if not order:
+        raise RuntimeError("No preset timings to choose from")
+    for name in order:
+        if fps_by_preset[name] >= target_fps:
+            return PRESETS[name]
+    return PRESETS[max(order, key=lambda name: fps_by_preset[name])]
@@ -0,0 +1,147 @@
+import os
+from typing import BinaryIO, Iterator, Optional, Sequence, Tuple
+
+import numpy as np
+
+MAGIC = b"EYELMK\x00\x02"
+# Version 1 files have no per-frame latency.
+MAGIC_V1 = b"EYELMK\x00\x01"
+HEADER_BYTES = 64
+
+# magic, landmark count, frame width, frame height, then zero padding.
+_HEADER = np.dtype([
+    ("magic", "S8"),
+    ("landmark_count", "<u4"),
+    ("frame_width", "<u4"),
+    ("frame_height", "<u4"),
+    ("reserved", "V44"),
+])
+
+
+def record_dtype(landmark_count: int, with_latency: bool = True) -> np.dtype:
+    """
+    One fixed-size record per processed frame: capture time (monotonic
+    seconds), whether a face was found, the (yaw, pitch) the tracker
+    computed (NaN without a face), the pipeline latency measured live
+    (seconds from capture to the pose stage, NaN if unknown) and the
+    landmarks in pixels (NaN rows where none were measured).
+    """
+    fields = [("t", "<f8"), ("face", "u1"), ("angles", "<f4", (2,))]
+    if with_latency:
+        fields.append(("latency", "<f4"))
+    fields.append(("landmarks", "<f4", (landmark_count, 3)))
+    return np.dtype(fields)
+
+
+class LandmarkRecorder:
+    """
+    Appends one fixed-size record per frame to a binary file that
+    `LandmarkReplay` memory-maps: a 64-byte header, then records of
+    `record_dtype(landmark_count)`. Frames with fewer landmarks (e.g.
+    FaceMesh without iris refinement) are padded with NaN rows.
+
+    Records go through a buffered file, so `close()` (or leaving a `with`
+    block) must run for the tail to reach disk. A record cut short by a
+    crash is ignored on replay.
+    """
+
+    def __init__(self, path: str, frame_width: int, frame_height: int, landmark_count: int = 478) -> None:
+        self.path = path
+        self.landmark_count = int(landmark_count)
+        self._record = np.zeros(1, dtype=record_dtype(self.landmark_count))
+        self.frames = 0
+        header = np.zeros(1, dtype=_HEADER)
+        header["magic"] = MAGIC
+        header["landmark_count"] = self.landmark_count
+        header["frame_width"] = frame_width
+        header["frame_height"] = frame_height
+        self._file: Optional[BinaryIO] = open(path, "wb")
+        self._file.write(header.tobytes())
+
+    def __enter__(self) -> "LandmarkRecorder":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def append(
+        self,
+        t: float,
+        landmarks: Optional[np.ndarray],
+        angles: Optional[Tuple[float, float]],
+        latency: Optional[float] = None,
+    ) -> None:
+        """Write the record for one frame; `landmarks` is (N, 3) in pixels or None."""
+        if self._file is None:
+            raise RuntimeError("LandmarkRecorder is closed")
+        rec = self._record[0]
+        rec["t"] = t
+        rec["face"] = angles is not None
+        rec["angles"] = angles if angles is not None else (np.nan, np.nan)
+        rec["latency"] = latency if latency is not None else np.nan
+        out = rec["landmarks"]
+        if landmarks is None:
+            out[:] = np.nan
+        else:
+            count = min(len(landmarks), self.landmark_count)
+            out[:count] = landmarks[:count]
+            out[count:] = np.nan
+        self._file.write(self._record.tobytes())
+        self.frames += 1
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class LandmarkReplay:
+    """
+    Read-only memory map of a `LandmarkRecorder` file.
+
+    `t`, `face`, `angles`, `latency` and `landmarks` are views over all
+    records, so a session of any length opens instantly and is paged in as
+    it is read. Iterate to get `(t, landmarks, latency)` per frame
+    (landmarks None without a face, latency None if not recorded) for
+    `HeadPoseTracker.process_landmarks`, or take `key_points()` for the
+    batch geometry in `geometry.pose_batch`.
+    """
+
+    def __init__(self, path: str) -> None:
+        header = np.fromfile(path, dtype=_HEADER, count=1)
+        if len(header) != 1 or header["magic"][0] not in (MAGIC, MAGIC_V1):
+            raise RuntimeError(f"{path!r} is not a landmark recording")
+        self.path = path
+        self.landmark_count = int(header["landmark_count"][0])
+        self.frame_width = int(header["frame_width"][0])
+        self.frame_height = int(header["frame_height"][0])
+        with_latency = header["magic"][0] == MAGIC
+        dtype = record_dtype(self.landmark_count, with_latency)
+        count = (os.path.getsize(path) - HEADER_BYTES) // dtype.itemsize
+        if count > 0:
+            self.records = np.memmap(path, dtype=dtype, mode="r", offset=HEADER_BYTES, shape=(count,))
+        else:
+            self.records = np.zeros(0, dtype=dtype)
+        # Plain ndarray views of the map: indexing np.memmap objects is slow.
+        self.t = np.asarray(self.records["t"])
+        self.face = np.asarray(self.records["face"])
+        self.angles = np.asarray(self.records["angles"])
+        if with_latency:
+            self.latency = np.asarray(self.records["latency"])
+        else:
+            self.latency = np.full(len(self.records), np.nan, dtype=np.float32)
+        self.landmarks = np.asarray(self.records["landmarks"])
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __iter__(self) -> Iterator[Tuple[float, Optional[np.ndarray], Optional[float]]]:
+        landmarks = self.landmarks
+        rows = zip(self.t.tolist(), self.face.tolist(), self.latency.tolist())
+        for i, (t, face, latency) in enumerate(rows):
+            # NaN != NaN: frames without a recorded latency give None.
+            yield t, landmarks[i] if face else None, latency if latency == latency else None
+
+    def key_points(self, indices: Sequence[int]) -> np.ndarray:
+        """Return the (frames, len(indices), 3) landmarks at `indices`, copied out of the map."""
+        return self.landmarks[:, indices]
@@ -0,0 +1,32 @@
+from typing import Tuple
+
+import numpy as np
+
+# Crops never shrink below this size, even if the landmarks collapse.
+MIN_ROI_PX = 32
+
+
+def roi_from_landmarks(landmarks: np.ndarray, frame_w: int, frame_h: int, padding: float) -> Tuple[int, int, int, int]:
+    """
+    Return the square crop (x0, y0, x1, y1) around the landmarks' bounding box,
+    padded on each side by `padding` times the box size and clipped to the frame.
+    """
+    xs = landmarks[:, 0]
+    ys = landmarks[:, 1]
+    cx = 0.5 * (xs.min() + xs.max())
+    cy = 0.5 * (ys.min() + ys.max())
+    half = 0.5 * max(xs.max() - xs.min(), ys.max() - ys.min()) * (1.0 + 2.0 * padding)
+
+    half = max(half, 0.5 * MIN_ROI_PX)
+
+    x0 = max(0, int(cx - half))
+    y0 = max(0, int(cy - half))
+    x1 = min(frame_w, int(cx + half) + 1)
+    y1 = min(frame_h, int(cy + half) + 1)
+    return x0, y0, x1, y1
+
+
+def fit_size(width: int, height: int, longest: int) -> Tuple[int, int]:
+    """Return (w, h) scaled so the longest side is `longest` pixels."""
+    scale = longest / float(max(width, height))
+    return max(1, round(width * scale)), max(1, round(height * scale))
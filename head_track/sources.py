@@ -0,0 +1,274 @@
+import math
+import os
+import time
+from abc import abstractmethod
+from typing import List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from .capture import CameraSource, CaptureProfile, CaptureSettings, FrameSource
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp")
+
+
+class PlaybackSource(FrameSource):
+    """
+    Base for recorded or generated frames played back at `fps`.
+
+    With `realtime=True` `read()` waits for each frame's presentation time
+    (open time + index / fps), as a camera would deliver it. With
+    `realtime=False` frames come as fast as they are asked for, to measure
+    raw tracker throughput. Either way frame i is stamped open time +
+    i / fps on the monotonic clock, so filters and predictors see the
+    recording's timing whatever the playback speed. With `loop=True` the
+    frames repeat instead of ending.
+
+    Subclasses implement `_open` (returning the settings), `_next_frame`
+    (None at the end) and `_rewind`, plus `release`.
+    """
+
+    def __init__(self, fps: float, realtime: bool = True, loop: bool = False) -> None:
+        if fps <= 0:
+            raise ValueError("Playback fps must be positive")
+        self.fps = float(fps)
+        self.realtime = bool(realtime)
+        self.loop = bool(loop)
+        self.frames_read = 0
+        self._start_ms = 0.0
+
+    @abstractmethod
+    def _open(self) -> CaptureSettings:
+        pass
+
+    @abstractmethod
+    def _next_frame(self, out: Optional[np.ndarray]) -> Optional[np.ndarray]:
+        pass
+
+    @abstractmethod
+    def _rewind(self) -> None:
+        pass
+
+    def open(self) -> CaptureSettings:
+        settings = self._open()
+        self.frames_read = 0
+        self._start_ms = 1000.0 * time.monotonic()
+        return settings
+
+    def read(self, out: Optional[np.ndarray] = None) -> Tuple[bool, Optional[np.ndarray]]:
+        frame = self._next_frame(out)
+        if frame is None and self.loop and self.frames_read > 0:
+            self._rewind()
+            frame = self._next_frame(out)
+        if frame is None:
+            return False, None
+        self.frames_read += 1
+        if self.realtime:
+            delay = self.timestamp_ms() / 1000.0 - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+        return True, frame
+
+    def position_ms(self) -> Optional[float]:
+        if self.frames_read == 0:
+            return None
+        return 1000.0 * (self.frames_read - 1) / self.fps
+
+    def timestamp_ms(self) -> Optional[float]:
+        position = self.position_ms()
+        return None if position is None else self._start_ms + position
+
+
+class VideoFileSource(PlaybackSource):
+    """Frames of a video file, at its own frame rate unless `fps` is given."""
+
+    def __init__(self, path: str, fps: Optional[float] = None, realtime: bool = True, loop: bool = False) -> None:
+        super().__init__(fps or 30.0, realtime=realtime, loop=loop)
+        self.path = path
+        self._fixed_fps = fps is not None
+        self._cap: Optional[cv2.VideoCapture] = None
+
+    def _open(self) -> CaptureSettings:
+        self.release()
+        cap = cv2.VideoCapture(self.path)
+        if not cap.isOpened():
+            raise RuntimeError(f"Could not open video file {self.path!r}")
+        self._cap = cap
+        file_fps = cap.get(cv2.CAP_PROP_FPS)
+        if not self._fixed_fps and file_fps > 0:
+            self.fps = float(file_fps)
+        return CaptureSettings(
+            backend="file",
+            width=int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            height=int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            fps=self.fps,
+            fourcc="",
+            buffer_size=0,
+        )
+
+    def _next_frame(self, out: Optional[np.ndarray]) -> Optional[np.ndarray]:
+        ok, frame = self._cap.read(out)
+        return frame if ok else None
+
+    def _rewind(self) -> None:
+        self._cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+
+    def release(self) -> None:
+        if self._cap is not None:
+            self._cap.release()
+            self._cap = None
+
+
+class ImageDirectorySource(PlaybackSource):
+    """Image files of a directory in name order, played at `fps`."""
+
+    def __init__(self, path: str, fps: float = 30.0, realtime: bool = True, loop: bool = False) -> None:
+        super().__init__(fps, realtime=realtime, loop=loop)
+        self.path = path
+        self._files: List[str] = []
+        self._next = 0
+
+    def _open(self) -> CaptureSettings:
+        if not os.path.isdir(self.path):
+            raise RuntimeError(f"Image directory {self.path!r} does not exist")
+        self._files = sorted(
+            os.path.join(self.path, name)
+            for name in os.listdir(self.path)
+            if name.lower().endswith(IMAGE_EXTENSIONS)
+        )
+        if not self._files:
+            raise RuntimeError(f"No images found in {self.path!r}")
+        self._next = 0
+        first = self._load(self._files[0])
+        h, w = first.shape[:2]
+        return CaptureSettings(backend="images", width=w, height=h, fps=self.fps, fourcc="", buffer_size=0)
+
+    @staticmethod
+    def _load(path: str) -> np.ndarray:
+        image = cv2.imread(path, cv2.IMREAD_COLOR)
+        if image is None:
+            raise RuntimeError(f"Could not read image {path!r}")
+        return image
+
+    def _next_frame(self, out: Optional[np.ndarray]) -> Optional[np.ndarray]:
+        if self._next >= len(self._files):
+            return None
+        image = self._load(self._files[self._next])
+        self._next += 1
+        return image
+
+    def _rewind(self) -> None:
+        self._next = 0
+
+    def release(self) -> None:
+        self._files = []
+
+
+class SyntheticFaceSource(PlaybackSource):
+    """
+    A drawn face turning along a fixed path, for running the tracker
+    without a camera or recordings. FaceMesh finds it like a real face.
+
+    Frame i shows the head at `pose_at(i)`: yaw and pitch (degrees) follow
+    sine waves of `yaw_amplitude`/`pitch_amplitude` with periods of
+    `period_sec` and 1.5 times that, so every run sees the same frames.
+    Positive yaw turns the nose towards image right, positive pitch up. The
+    stream ends after `frames` frames (never when None).
+    """
+
+    def __init__(
+        self,
+        width: int = 640,
+        height: int = 480,
+        fps: float = 30.0,
+        frames: Optional[int] = None,
+        yaw_amplitude: float = 20.0,
+        pitch_amplitude: float = 10.0,
+        period_sec: float = 4.0,
+        realtime: bool = True,
+        loop: bool = False,
+    ) -> None:
+        super().__init__(fps, realtime=realtime, loop=loop)
+        self.width = int(width)
+        self.height = int(height)
+        self.frames = None if frames is None else int(frames)
+        self.yaw_amplitude = float(yaw_amplitude)
+        self.pitch_amplitude = float(pitch_amplitude)
+        self.period_sec = float(period_sec)
+        self._next = 0
+        # Copying a ready background is far cheaper than broadcasting a colour.
+        self._background = np.empty((self.height, self.width, 3), dtype=np.uint8)
+        self._background[:, :] = (90, 110, 130)
+
+    def pose_at(self, index: int) -> Tuple[float, float]:
+        """Return the (yaw, pitch) in degrees drawn in frame `index`."""
+        t = index / self.fps
+        yaw = self.yaw_amplitude * math.sin(2.0 * math.pi * t / self.period_sec)
+        pitch = self.pitch_amplitude * math.sin(2.0 * math.pi * t / (1.5 * self.period_sec))
+        return yaw, pitch
+
+    def _open(self) -> CaptureSettings:
+        self._next = 0
+        return CaptureSettings(backend="synthetic", width=self.width, height=self.height, fps=self.fps, fourcc="", buffer_size=0)
+
+    def _next_frame(self, out: Optional[np.ndarray]) -> Optional[np.ndarray]:
+        if self.frames is not None and self._next >= self.frames:
+            return None
+        frame = self.render(*self.pose_at(self._next), out=out)
+        self._next += 1
+        return frame
+
+    def _rewind(self) -> None:
+        self._next = 0
+
+    def release(self) -> None:
+        pass
+
+    def render(self, yaw: float, pitch: float, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Draw the face at `yaw`/`pitch` degrees into `out` (or a new frame)."""
+        shape = (self.height, self.width, 3)
+        if out is None or out.shape != shape or out.dtype != np.uint8:
+            out = np.empty(shape, dtype=np.uint8)
+        np.copyto(out, self._background)
+        s = self.height / 480.0
+        cx, cy = self.width / 2.0, self.height / 2.0
+        cos_y, sin_y = math.cos(math.radians(yaw)), math.sin(math.radians(yaw))
+        cos_p, sin_p = math.cos(math.radians(pitch)), math.sin(math.radians(pitch))
+
+        def project(x: float, y: float, z: float) -> Tuple[int, int]:
+            # Head coordinates (image axes, z away from the camera) rotated by
+            # yaw about y, then pitch about x, projected orthographically.
+            x1 = x * cos_y - z * sin_y
+            z1 = x * sin_y + z * cos_y
+            y1 = y * cos_p + z1 * sin_p
+            return int(round(cx + s * x1)), int(round(cy + s * y1))
+
+        def size(a: float, b: float) -> Tuple[int, int]:
+            return max(1, int(a * s)), max(1, int(b * s))
+
+        cv2.ellipse(out, project(0.0, 0.0, 0.0), size(95 * cos_y + 10, 125 * cos_p + 5), 0, 0, 360, (140, 170, 215), -1)
+        for ex in (-38.0, 38.0):
+            eye = project(ex, -20.0, -60.0)
+            cv2.ellipse(out, eye, size(18 * cos_y, 9), 0, 0, 360, (255, 255, 255), -1)
+            cv2.circle(out, eye, max(1, int(7 * s)), (60, 40, 30), -1)
+            cv2.ellipse(out, project(ex, -42.0, -60.0), size(22 * cos_y, 6), 0, 180, 360, (40, 50, 70), max(1, int(3 * s)))
+        nose = np.array([project(0.0, -15.0, -80.0), project(-12.0, 25.0, -90.0), project(12.0, 25.0, -90.0)], np.int32)
+        cv2.polylines(out, [nose], True, (100, 120, 170), max(1, int(3 * s)))
+        cv2.ellipse(out, project(0.0, 60.0, -70.0), size(30 * cos_y, 10), 0, 0, 180, (60, 60, 170), -1)
+        return cv2.GaussianBlur(out, (5, 5), 0, dst=out)
+
+
+def open_source(spec: str, realtime: bool = True, loop: bool = False) -> FrameSource:
+    """
+    Build a source from a command-line style `spec`: "synthetic", a
+    directory of images, a video file, or a camera index.
+    """
+    if spec == "synthetic":
+        return SyntheticFaceSource(realtime=realtime, loop=loop)
+    if os.path.isdir(spec):
+        return ImageDirectorySource(spec, realtime=realtime, loop=loop)
+    if os.path.isfile(spec):
+        return VideoFileSource(spec, realtime=realtime, loop=loop)
+    if spec.isdigit():
+        return CameraSource(CaptureProfile(device=int(spec)))
+    raise RuntimeError(f"Unknown frame source {spec!r}: use a camera index, video file, image directory or 'synthetic'")
@@ -0,0 +1,123 @@
+import time
+from collections import deque
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+from tracing import Tracer
+
+# Overlay text is rebuilt at most this often, so drawing it every frame does
+# not mean sorting every window every frame.
+OVERLAY_REFRESH_SEC = 0.5
+
+
+def _percentile(ordered: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile `q` (0..1) of an ascending sequence."""
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class StageTimer:
+    """
+    Wall time per pipeline stage for each frame, over the last `window` frames.
+
+    Call `start_frame()` when a frame begins, `lap(stage)` as each stage
+    finishes (the time since the previous mark is added to `stage`, so a
+    stage lapped twice in one frame is summed) and `end_frame()` when the
+    frame is done; the whole frame is recorded as "total". A lap costs one
+    `perf_counter` call and a dict update. Percentiles and the achieved
+    frame rate are computed only when `stats()` or `overlay_lines()` ask.
+
+    With a `tracer`, every lap and frame is also recorded as a trace span.
+    """
+
+    def __init__(self, window: int = 300, tracer: Optional[Tracer] = None) -> None:
+        self.window = max(2, int(window))
+        self.tracer = tracer
+        self._samples: Dict[str, deque[float]] = {}
+        self._current: Dict[str, float] = {}
+        self._frame_ends: deque[float] = deque(maxlen=self.window)
+        self._frame_start = 0.0
+        self._mark = 0.0
+        self.frames = 0
+        self._overlay: List[str] = []
+        self._overlay_time = 0.0
+
+    def start_frame(self) -> None:
+        self._frame_start = self._mark = time.perf_counter()
+        self._current.clear()
+
+    def lap(self, stage: str) -> None:
+        now = time.perf_counter()
+        self._current[stage] = self._current.get(stage, 0.0) + (now - self._mark)
+        if self.tracer is not None:
+            self.tracer.complete(stage, self._mark, now, "tracker")
+        self._mark = now
+
+    def end_frame(self) -> None:
+        now = time.perf_counter()
+        self._current["total"] = now - self._frame_start
+        if self.tracer is not None:
+            self.tracer.complete("next_position", self._frame_start, now, "tracker")
+        for stage, sec in self._current.items():
+            samples = self._samples.get(stage)
+            if samples is None:
+                samples = self._samples[stage] = deque(maxlen=self.window)
+            samples.append(sec)
+        self._frame_ends.append(now)
+        self.frames += 1
+
+    def fps(self) -> float:
+        """Frames completed per second over the window."""
+        ends = self._frame_ends
+        if len(ends) < 2 or ends[-1] <= ends[0]:
+            return 0.0
+        return (len(ends) - 1) / (ends[-1] - ends[0])
+
+    def stats(self) -> Dict[str, object]:
+        """
+        Return the achieved frame rate and, per stage, the sample count and
+        mean/p50/p95/p99 times in milliseconds over the window. A stage's
+        count is below the frame count when it did not run every frame
+        (e.g. inference on flow frames).
+        """
+        stages = {}
+        for stage, samples in self._samples.items():
+            ordered = sorted(samples)
+            stages[stage] = {
+                "count": len(ordered),
+                "mean_ms": 1000.0 * sum(ordered) / len(ordered),
+                "p50_ms": 1000.0 * _percentile(ordered, 0.50),
+                "p95_ms": 1000.0 * _percentile(ordered, 0.95),
+                "p99_ms": 1000.0 * _percentile(ordered, 0.99),
+            }
+        return {"frames": self.frames, "fps": self.fps(), "stages": stages}
+
+    def overlay_lines(self) -> List[str]:
+        """Short text lines summarising `stats()`, refreshed every `OVERLAY_REFRESH_SEC`."""
+        now = time.perf_counter()
+        if self._overlay and now - self._overlay_time < OVERLAY_REFRESH_SEC:
+            return self._overlay
+        stats = self.stats()
+        lines = [f"{stats['fps']:.1f} fps"]
+        for stage, s in stats["stages"].items():
+            lines.append(f"{stage:<10} p50 {s['p50_ms']:5.1f}  p95 {s['p95_ms']:5.1f}  p99 {s['p99_ms']:5.1f} ms")
+        self._overlay = lines
+        self._overlay_time = now
+        return lines
+
+    def reset(self) -> None:
+        self._samples.clear()
+        self._frame_ends.clear()
+        self.frames = 0
+        self._overlay = []
+
+
+def draw_overlay(frame: np.ndarray, lines: Sequence[str], origin: Tuple[int, int] = (10, 55), line_height: int = 18) -> None:
+    """Draw `lines` onto the BGR `frame` in place, top-left at `origin`."""
+    x, y = origin
+    for line in lines:
+        # Dark outline first so the text stays readable on any background.
+        cv2.putText(frame, line, (x, y), cv2.FONT_HERSHEY_PLAIN, 1.0, (0, 0, 0), 3, cv2.LINE_AA)
+        cv2.putText(frame, line, (x, y), cv2.FONT_HERSHEY_PLAIN, 1.0, (255, 255, 255), 1, cv2.LINE_AA)
+        y += line_height
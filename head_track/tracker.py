@@ -1,21 +1,166 @@
 import sys
-import math
-from collections import deque
-from typing import Optional, Tuple
+import time
+from typing import Any, Dict, Optional, Sequence, Tuple, Union
 
 import cv2
 import mediapipe as mp
 import numpy as np
 
+import tracing
+
+from .buffers import BufferPool
+from .capture import CameraSource, CaptureLatency, CaptureProfile, CaptureSettings, FrameGrabber, FrameSource
+from .dedup import FrameDeduplicator
+from .flow import FLOW_LANDMARKS, LandmarkFlow
+from .filters import DirectionFilter, create_filter
+from .geometry import direction_to_angles, forward_vector, map_to_screen
+from .motion import MotionGate
+from .landmarks import LandmarkArray
+from .pnp import PnPPoseEstimator
+from .prediction import PosePrediction, PosePredictor
+from .recording import LandmarkRecorder
+from .presets import AUTO_PRESET, PRESETS, InferencePreset, choose_preset, get_preset
+from .roi import fit_size, roi_from_landmarks
+from .timing import StageTimer
+from .worker import FaceMeshWorker
+
 
 class HeadPoseTracker:
     """
     Linux-only head pose tracker using MediaPipe FaceMesh.
 
     Provides a simple API to stream cursor positions mapped from head yaw/pitch.
+
+    Frames come from the `FrameSource` given to `start()`: a camera by
+    default, or a video file, image directory or synthetic face (see
+    `sources`), paced in real time or played as fast as the tracker runs.
+
+    With `threaded_capture=True` a background thread keeps reading the camera
+    into a `capture_slots`-deep ring buffer, so inference always runs on the
+    newest frame and stale frames are dropped instead of queueing up.
+
+    With `roi=True` FaceMesh only sees a crop around the previous frame's
+    face (padded by `roi_padding` of its size), optionally downscaled so its
+    longest side is `roi_size` pixels. Landmarks are mapped back to
+    full-frame coordinates; when the face is lost the full frame is searched.
+    It is off by default: FaceMesh already tracks its own region between
+    frames, so the crop mostly saves the resize of large frames.
+    `benchmarks/roi_inference` measured 1.0-1.2x at 640x480 and 1.1-1.4x
+    at 1080p, with angles up to about 1.5 degrees away from full-frame
+    inference.
+
+    With `flow_interval=N > 1` FaceMesh runs at most every N frames; in
+    between, `LandmarkFlow` follows textured points (eye corners, nose) with
+    Lucas-Kanade optical flow and moves the key landmarks by the rigid head
+    motion fitted to them, so the pose keeps turning on flow frames.
+    FaceMesh runs early when too few points survive the forward-backward
+    check or the rigid fit is off by more than `flow_max_error` pixels.
+
+    With `adaptive=True` a cheap frame-difference motion score lowers the
+    inference rate while the head is still (every `still_stride` frames) and,
+    once no face has been seen for `idle_after_sec`, throttles the loop to
+    `idle_fps` until motion reappears. Skipped frames return the last result.
+    See `MotionGate` and `power_stats()`.
+
+    With `skip_duplicates=True`, a frame the camera already delivered
+    (same capture timestamp, or same sub-sampled checksum when the backend
+    has no timestamps) returns the cached pose instead of being reprocessed.
+
+    With `reuse_buffers=True` the camera frame and the RGB/grayscale/crop
+    conversions are written into preallocated arrays that are recycled every
+    frame. The frame returned by `next_position` is then only valid until
+    the next call.
+
+    With `inference_process=True` FaceMesh runs in a separate process
+    (`FaceMeshWorker`): frames go through shared memory and only landmark
+    arrays come back, so inference does not hold this process's GIL while
+    the UI and cursor threads run. `next_position` behaves the same.
+
+    After each frame, `landmarks` holds that frame's FaceMesh landmarks as
+    one (N, 3) float32 array in pixels (None when FaceMesh did not run or
+    found no face). The array is reused every frame, so consumers such as
+    wink detection should index into it rather than keep it.
+
+    `smoothing` picks the filter applied to the head direction: a name from
+    `filters.FILTERS` ("moving_average" over `smooth_len` frames, "ema",
+    "one_euro", "kalman") built with `smoothing_options`, or a
+    `DirectionFilter` instance. All run in constant time per frame.
+
+    With `predict=True` each new pose is also extrapolated over the measured
+    pipeline latency (frame capture to end of processing, smoothed) plus
+    `predict_extra_sec` for the output stage, and published as
+    `tracker.prediction` next to the raw angles `next_position` returns.
+    Frames that reuse the last pose (skipped by `adaptive` or
+    `skip_duplicates`) set `prediction` to None, so callers steer with the
+    returned position. See `PosePredictor` for the model and its clamps.
+
+    `estimator="pnp"` replaces the two-axis cross product with a
+    `PnPPoseEstimator` fit of the canonical face model to ~30 stable
+    landmarks (options in `pnp_options`). The two-axis method is used
+    whenever a fit fails; the smoothing filter restarts when the estimator
+    changes. With flow enabled, the fitted points move with the head between
+    inferences.
+
+    `preset` picks a named `InferencePreset` from `presets.PRESETS`
+    ("quality", "balanced", "fast", "low_power"), which sets the FaceMesh
+    options, the inference stride (`flow_interval`, unless given here) and,
+    unless the capture profile asks for one, the camera resolution. With
+    `preset="auto"`, `start()` grabs a short warm-up clip, times every
+    preset on it and applies the best one that still reaches `target_fps`
+    (see `benchmark_presets()` and `preset_fps`). Without a preset FaceMesh
+    keeps iris refinement on and `flow_interval` defaults to 1.
+
+    With `record_path`, every processed frame's capture time, landmarks
+    (only the tracked points on flow frames), angles and pipeline latency
+    are appended to a `LandmarkRecorder` file from `start()` to `stop()`.
+    `process_landmarks` runs the pose stage alone, e.g. on a
+    `LandmarkReplay` of that file; given the recorded latencies, its
+    predictions repeat the live ones.
+
+    With `timing=True` each `next_position` call is split into stages
+    ("read", "convert", "inference", "landmarks", "flow", "pose", plus
+    "dedup"/"gate"/"throttle" when enabled) by a `StageTimer`;
+    `timing_stats()` returns their p50/p95/p99 over the last
+    `timing_window` frames and the achieved frame rate, and
+    `timing.draw_overlay(frame, tracker.timer.overlay_lines())` draws them.
+    If `tracing` was started before the tracker was created, the same
+    stages are also recorded as trace spans (and timing is on).
     """
 
-    def __init__(self, yaw_span: float = 20.0, pitch_span: float = 10.0, smooth_len: int = 8) -> None:
+    def __init__(
+        self,
+        yaw_span: float = 20.0,
+        pitch_span: float = 10.0,
+        smooth_len: int = 8,
+        threaded_capture: bool = False,
+        capture_slots: int = 1,
+        roi: bool = False,
+        roi_padding: float = 0.25,
+        roi_size: Optional[int] = None,
+        flow_interval: Optional[int] = None,
+        flow_max_error: float = 2.0,
+        adaptive: bool = False,
+        motion_threshold: float = 1.5,
+        still_stride: int = 4,
+        idle_after_sec: float = 5.0,
+        idle_fps: float = 2.0,
+        skip_duplicates: bool = False,
+        reuse_buffers: bool = False,
+        inference_process: bool = False,
+        smoothing: Union[str, DirectionFilter] = "moving_average",
+        smoothing_options: Optional[Dict[str, Any]] = None,
+        predict: bool = False,
+        predict_extra_sec: float = 0.0,
+        predict_max_sec: float = 0.1,
+        predict_max_deg: float = 5.0,
+        estimator: str = "axes",
+        pnp_options: Optional[Dict[str, Any]] = None,
+        preset: Optional[Union[str, InferencePreset]] = None,
+        target_fps: float = 30.0,
+        record_path: Optional[str] = None,
+        timing: bool = False,
+        timing_window: int = 300,
+    ) -> None:
         if not sys.platform.startswith("linux"):
             raise RuntimeError("HeadPoseTracker currently supports Linux only.")
 
@@ -23,17 +168,81 @@ class HeadPoseTracker:
         self.pitch_span = float(pitch_span)
         self.smooth_len = int(smooth_len)
 
-        self._mp_face_mesh = mp.solutions.face_mesh
-        self._face_mesh = self._mp_face_mesh.FaceMesh(
+        self._face_mesh_options = dict(
             static_image_mode=False,
             max_num_faces=1,
             refine_landmarks=True,
             min_detection_confidence=0.5,
             min_tracking_confidence=0.5,
         )
+        self.target_fps = float(target_fps)
+        self.preset: Optional[InferencePreset] = None
+        # Frames per second measured for each preset by benchmark_presets().
+        self.preset_fps: Dict[str, float] = {}
+        self._auto_preset = preset == AUTO_PRESET
+        if preset is not None and not self._auto_preset:
+            self.preset = get_preset(preset)
+            self._face_mesh_options.update(self._preset_mesh_options(self.preset))
+        self.inference_process = bool(inference_process)
+        self._worker: Optional[FaceMeshWorker] = None
+        self._mp_face_mesh = mp.solutions.face_mesh
+        self._face_mesh = None if self.inference_process else self._create_face_mesh()
+
+        self._source: Optional[FrameSource] = None
+        self.threaded_capture = bool(threaded_capture)
+        self.capture_slots = int(capture_slots)
+        self._grabber: Optional[FrameGrabber] = None
+        self._frames_read = 0
+        self.reuse_buffers = bool(reuse_buffers)
+        self._buffers = BufferPool(enabled=self.reuse_buffers)
+        self._frame_buf: Optional[np.ndarray] = None
+        # Flow keeps the previous grayscale frame, so alternate two buffers.
+        self._gray_slot = 0
+        self.capture_settings: Optional[CaptureSettings] = None
+        self._latency = CaptureLatency()
+        options = dict(smoothing_options or {})
+        if smoothing == "moving_average":
+            options.setdefault("window", self.smooth_len)
+        self._filter = create_filter(smoothing, **options)
+
+        self.roi = bool(roi)
+        self.roi_padding = float(roi_padding)
+        self.roi_size = None if roi_size is None else int(roi_size)
+        self._roi_box: Optional[Tuple[int, int, int, int]] = None
+        self.roi_fallbacks = 0
+        # FaceMesh keeps tracking state between frames, so crops get their own
+        # instance instead of confusing the full-frame one.
+        self._roi_face_mesh = self._create_face_mesh() if self.roi and not self.inference_process else None
+
+        self.flow_max_error = float(flow_max_error)
+        # An explicit stride wins over the preset's, also when "auto" picks one.
+        self._flow_interval_arg = flow_interval
+        self._set_flow_interval(self._preset_flow_interval())
+        self.inferences = 0
+        self.flow_frames = 0
+        self.flow_redetections = 0
+
+        self._gate = (
+            MotionGate(
+                motion_threshold=motion_threshold,
+                still_stride=still_stride,
+                idle_after_sec=idle_after_sec,
+                idle_fps=idle_fps,
+            )
+            if adaptive
+            else None
+        )
+        self._last_angles: Optional[Tuple[float, float]] = None
+
+        self._dedup = FrameDeduplicator() if skip_duplicates else None
+        self._last_capture_ts: Optional[float] = None
 
-        self._cap: Optional[cv2.VideoCapture] = None
-        self._ray_dirs: deque[np.ndarray] = deque(maxlen=self.smooth_len)
+        # Capture time (monotonic seconds) of the frame being processed.
+        self._frame_time: Optional[float] = None
+        self._predictor = PosePredictor(max_horizon_sec=predict_max_sec, max_delta_deg=predict_max_deg) if predict else None
+        self.predict_extra_sec = float(predict_extra_sec)
+        self.pipeline_latency_sec = 0.0
+        self.prediction: Optional[PosePrediction] = None
 
         self.calib_yaw: float = 0.0
         self.calib_pitch: float = 0.0
@@ -46,18 +255,362 @@ class HeadPoseTracker:
             "bottom": 152,
             "front": 1,
         }
+        if estimator not in ("axes", "pnp"):
+            raise RuntimeError(f"Unknown pose estimator {estimator!r}; use 'axes' or 'pnp'")
+        self._pnp = PnPPoseEstimator(**(pnp_options or {})) if estimator == "pnp" else None
+        self._used_pnp = self._pnp is not None
+        # Tracked points: the five axis landmarks, then any the estimator fits.
+        key_idx = [self._LMK[k] for k in ("left", "right", "top", "bottom", "front")]
+        if self._pnp is not None:
+            key_idx += self._pnp.point_indices
+        self._key_idx = np.array(key_idx)
+        self._key_buf = np.zeros((len(self._key_idx), 3), dtype=np.float32)
+        self._landmark_array = LandmarkArray()
+        self.landmarks: Optional[np.ndarray] = None
+
+        # Tracing (see the `tracing` package) reuses the stage laps as spans.
+        tracer = tracing.current()
+        self.timer: Optional[StageTimer] = StageTimer(timing_window, tracer=tracer) if timing or tracer is not None else None
+
+        self.record_path = record_path
+        self._recorder: Optional[LandmarkRecorder] = None
+        # Flow frames only know the tracked points; the other rows stay NaN.
+        self._record_points = np.full((self._landmark_array.pixels.shape[0], 3), np.nan, dtype=np.float32)
+
+    def _create_face_mesh(self):
+        return self._mp_face_mesh.FaceMesh(**self._face_mesh_options)
+
+    def _preset_flow_interval(self) -> int:
+        if self._flow_interval_arg is not None:
+            return self._flow_interval_arg
+        return self.preset.flow_interval if self.preset is not None else 1
+
+    def _set_flow_interval(self, flow_interval: int) -> None:
+        self.flow_interval = max(1, int(flow_interval))
+        self._flow = LandmarkFlow(max_error=self.flow_max_error) if self.flow_interval > 1 else None
+        self._frames_since_inference = 0
+
+    @staticmethod
+    def _preset_mesh_options(preset: InferencePreset) -> Dict[str, Any]:
+        return dict(
+            refine_landmarks=preset.refine_landmarks,
+            min_detection_confidence=preset.min_detection_confidence,
+            min_tracking_confidence=preset.min_tracking_confidence,
+        )
 
-    def start(self) -> None:
-        self._cap = cv2.VideoCapture(0)
-        if not self._cap.isOpened():
-            raise RuntimeError("Could not open webcam (index 0)")
+    def _close_inference(self) -> None:
+        """Close the FaceMesh instances and the worker process, if any."""
+        for face_mesh in (self._face_mesh, self._roi_face_mesh):
+            if face_mesh is not None:
+                face_mesh.close()
+        self._face_mesh = self._roi_face_mesh = None
+        if self._worker is not None:
+            self._worker.close()
+            self._worker = None
+
+    def apply_preset(self, preset: Union[str, InferencePreset]) -> InferencePreset:
+        """
+        Switch FaceMesh options and inference stride to `preset`, recreating
+        the FaceMesh instances (or the worker, on its next frame). The capture
+        resolution only changes on the next `start()`.
+        """
+        self.preset = get_preset(preset)
+        self._face_mesh_options.update(self._preset_mesh_options(self.preset))
+        self._close_inference()
+        if not self.inference_process:
+            self._face_mesh = self._create_face_mesh()
+            if self.roi:
+                self._roi_face_mesh = self._create_face_mesh()
+        self._roi_box = None
+        self._set_flow_interval(self._preset_flow_interval())
+        return self.preset
+
+    def benchmark_presets(self, frames: Sequence[np.ndarray], warmup: int = 5) -> Dict[str, float]:
+        """
+        Time every preset on `frames` (BGR, resized to each preset's
+        resolution) and return frames per second by preset name, also kept in
+        `preset_fps`. Each preset runs in a throwaway tracker with this one's
+        ROI and process settings; the first `warmup` frames are not timed.
+        """
+        if len(frames) <= warmup:
+            raise RuntimeError(f"Need more than {warmup} frames to benchmark presets")
+        self.preset_fps = {}
+        for name, preset in PRESETS.items():
+            resized = [cv2.resize(f, (preset.width, preset.height), interpolation=cv2.INTER_AREA) for f in frames]
+            probe = HeadPoseTracker(
+                roi=self.roi,
+                roi_padding=self.roi_padding,
+                roi_size=self.roi_size,
+                inference_process=self.inference_process,
+                flow_interval=self._flow_interval_arg,
+                preset=preset,
+            )
+            try:
+                for frame in resized[:warmup]:
+                    probe.process_frame(frame, preset.width, preset.height)
+                t0 = time.perf_counter()
+                for frame in resized[warmup:]:
+                    probe.process_frame(frame, preset.width, preset.height)
+                elapsed = time.perf_counter() - t0
+            finally:
+                probe._close_inference()
+            self.preset_fps[name] = (len(resized) - warmup) / max(elapsed, 1e-9)
+        return self.preset_fps
+
+    def _select_preset(self, source: FrameSource, warmup_frames: int = 30) -> InferencePreset:
+        """Record a warm-up clip from `source`, benchmark the presets on it and apply the best one."""
+        source.open()
+        frames = []
+        try:
+            while len(frames) < warmup_frames:
+                ok, frame = source.read()
+                if not ok:
+                    break
+                frames.append(frame)
+        finally:
+            source.release()
+        if not frames:
+            raise RuntimeError("Frame source returned no frames while choosing a preset")
+        return self.apply_preset(choose_preset(self.benchmark_presets(frames, warmup=min(5, len(frames) - 1)), self.target_fps))
+
+    def _ensure_worker(self, nbytes: int) -> FaceMeshWorker:
+        """Start the FaceMesh process, or restart it if frames outgrew its slots."""
+        if self._worker is not None and self._worker.capacity < nbytes:
+            self._worker.close()
+            self._worker = None
+        if self._worker is None:
+            self._worker = FaceMeshWorker(nbytes, face_mesh_options=self._face_mesh_options)
+        return self._worker
+
+    def start(self, source: Optional[Union[CaptureProfile, FrameSource]] = None) -> CaptureSettings:
+        """
+        Open `source` and return the settings it actually delivers. `source`
+        is a `FrameSource` (see `sources` for video files, image directories
+        and a synthetic face) or a `CaptureProfile` for a camera (default:
+        index 0 with driver defaults).
+
+        For a camera with a preset, the preset's resolution is requested
+        unless the profile sets one. With `preset="auto"` the preset is
+        chosen first (see `_select_preset`), from a camera clip at the
+        largest preset resolution or from the start of `source`.
+        """
+        if source is None or isinstance(source, CaptureProfile):
+            profile = source if source is not None else CaptureProfile()
+            if self._auto_preset and self.preset is None:
+                largest = max(PRESETS.values(), key=lambda p: p.width * p.height)
+                if profile.width is None and profile.height is None:
+                    self._select_preset(CameraSource(profile._replace(width=largest.width, height=largest.height)))
+                else:
+                    self._select_preset(CameraSource(profile))
+            if self.preset is not None and profile.width is None and profile.height is None:
+                profile = profile._replace(width=self.preset.width, height=self.preset.height)
+            source = CameraSource(profile)
+        elif self._auto_preset and self.preset is None:
+            self._select_preset(source)
+        self.capture_settings = source.open()
+        self._source = source
+        if self.record_path is not None:
+            self._recorder = LandmarkRecorder(self.record_path, self.capture_settings.width, self.capture_settings.height)
+        self._latency = CaptureLatency()
+        if self.inference_process:
+            settings = self.capture_settings
+            self._ensure_worker(settings.width * settings.height * 3)
+        if self.threaded_capture:
+            self._grabber = FrameGrabber(self._source, slots=self.capture_slots, reuse_buffers=self.reuse_buffers)
+            self._grabber.start()
+        return self.capture_settings
 
     def stop(self) -> None:
-        if self._cap is not None:
-            self._cap.release()
-            self._cap = None
+        if self._grabber is not None:
+            # The grabber releases the source once its thread is out of read().
+            self._grabber.stop(release_source=True)
+            self._grabber = None
+        elif self._source is not None:
+            self._source.release()
+        self._source = None
+        if self._worker is not None:
+            self._worker.close()
+            self._worker = None
+        if self._recorder is not None:
+            self._recorder.close()
+            self._recorder = None
         cv2.destroyAllWindows()
 
+    def capture_stats(self) -> Dict[str, int]:
+        """Return counters of frames captured, dropped and processed."""
+        if self._grabber is not None:
+            return self._grabber.stats()
+        return {"captured": self._frames_read, "dropped": 0, "processed": self._frames_read}
+
+    def capture_latency(self) -> Dict[str, Optional[float]]:
+        """
+        Return rolling capture-to-read latency (needs driver timestamps, e.g.
+        V4L2) and the time reads spent blocked waiting for a frame, in ms.
+        """
+        return self._latency.stats()
+
+    def _read_frame(self) -> Tuple[bool, Optional[np.ndarray]]:
+        t0 = time.perf_counter()
+        if self._grabber is not None:
+            ok, frame = self._grabber.read()
+            if ok:
+                stamp = self._grabber.last_capture_ms
+                self._latency.record(stamp if self._source.realtime else None, time.perf_counter() - t0)
+                self._frame_time = self._grabber.last_capture_ms / 1000.0
+            return ok, frame
+        ok, frame = self._source.read(self._frame_buf)
+        if ok:
+            if self.reuse_buffers:
+                self._frame_buf = frame
+            self._frames_read += 1
+            stamp = self._source.timestamp_ms()
+            # Played-back frames run ahead of the clock, so their age is no latency.
+            self._latency.record(stamp if self._source.realtime else None, time.perf_counter() - t0)
+            # Without a driver timestamp the frame is taken as captured when read returned.
+            self._frame_time = stamp / 1000.0 if stamp is not None else time.monotonic()
+            if self._dedup is not None:
+                self._last_capture_ts = self._source.position_ms()
+        return ok, frame
+
+    def _process(self, stream: str, image: np.ndarray, x0: int, y0: int, crop_w: int, crop_h: int) -> Optional[np.ndarray]:
+        """
+        Run FaceMesh for `stream` ("full" or "roi") on the BGR `image` (a
+        possibly resized crop whose top-left corner is (x0, y0) in the full
+        frame) and return landmarks in full-frame pixels.
+        """
+        timer = self.timer
+        if self.inference_process:
+            # Colour conversion happens in the worker, so it counts as inference.
+            normalized = self._ensure_worker(image.nbytes).process(image, stream)
+            if timer is not None:
+                timer.lap("inference")
+            if normalized is None:
+                return None
+            landmarks = self._landmark_array.from_normalized(normalized, x0, y0, crop_w, crop_h)
+            if timer is not None:
+                timer.lap("landmarks")
+            return landmarks
+
+        face_mesh = self._face_mesh if stream == "full" else self._roi_face_mesh
+        rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB, dst=self._buffers.get(stream + "_rgb", image.shape))
+        if timer is not None:
+            timer.lap("convert")
+        results = face_mesh.process(rgb)
+        if timer is not None:
+            timer.lap("inference")
+        if not results.multi_face_landmarks:
+            return None
+        landmarks = self._landmark_array.from_landmark_list(results.multi_face_landmarks[0], x0, y0, crop_w, crop_h)
+        if timer is not None:
+            timer.lap("landmarks")
+        return landmarks
+
+    def _detect_landmarks(self, frame: np.ndarray) -> Optional[np.ndarray]:
+        """Return the (N, 3) landmarks of the first face in pixel units, or None."""
+        h, w, _ = frame.shape
+
+        if self.roi and self._roi_box is not None:
+            x0, y0, x1, y1 = self._roi_box
+            crop = frame[y0:y1, x0:x1]
+            if self.roi_size is not None and max(x1 - x0, y1 - y0) > self.roi_size:
+                size = fit_size(x1 - x0, y1 - y0, self.roi_size)
+                crop = cv2.resize(crop, size, dst=self._buffers.get("roi", (size[1], size[0], 3)), interpolation=cv2.INTER_AREA)
+                if self.timer is not None:
+                    self.timer.lap("convert")
+            landmarks = self._process("roi", crop, x0, y0, x1 - x0, y1 - y0)
+            if landmarks is not None:
+                self._roi_box = roi_from_landmarks(landmarks, w, h, self.roi_padding)
+                return landmarks
+            # Face lost inside the crop: fall back to a full-frame search.
+            self._roi_box = None
+            self.roi_fallbacks += 1
+
+        landmarks = self._process("full", frame, 0, 0, w, h)
+        if landmarks is not None and self.roi:
+            self._roi_box = roi_from_landmarks(landmarks, w, h, self.roi_padding)
+        return landmarks
+
+    def _key_points(self, frame: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Return the tracked landmarks in pixels (left/right/top/bottom/front,
+        then the PnP points if used), from optical flow when possible and
+        from FaceMesh otherwise.
+        """
+        if self._flow is None:
+            landmarks = self._detect_landmarks(frame)
+            self.inferences += 1
+            self.landmarks = landmarks
+            return None if landmarks is None else np.take(landmarks, self._key_idx, axis=0, out=self._key_buf)
+
+        self._gray_slot ^= 1
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=self._buffers.get(f"gray{self._gray_slot}", frame.shape[:2]))
+        if self.timer is not None:
+            self.timer.lap("convert")
+        if self._flow.active and self._frames_since_inference < self.flow_interval - 1:
+            points = self._flow.track(gray)
+            if self.timer is not None:
+                self.timer.lap("flow")
+            if points is not None:
+                self._frames_since_inference += 1
+                self.flow_frames += 1
+                return points
+            self.flow_redetections += 1
+
+        landmarks = self._detect_landmarks(frame)
+        self.inferences += 1
+        self.landmarks = landmarks
+        self._frames_since_inference = 0
+        if landmarks is None:
+            self._flow.clear()
+            return None
+        points = np.take(landmarks, self._key_idx, axis=0, out=self._key_buf)
+        self._flow.reset(gray, landmarks[FLOW_LANDMARKS], points)
+        if self.timer is not None:
+            self.timer.lap("flow")
+        return points
+
+    def flow_stats(self) -> Dict[str, int]:
+        """Return counts of FaceMesh inferences, flow-tracked frames and early re-detections."""
+        return {
+            "inferences": self.inferences,
+            "flow_frames": self.flow_frames,
+            "redetections": self.flow_redetections,
+        }
+
+    def power_stats(self) -> Dict[str, object]:
+        """
+        Return the adaptive-rate state, motion score, frame/inference rates,
+        process CPU seconds per wall second and wake-up latency.
+        Empty unless the tracker was created with `adaptive=True`.
+        """
+        return self._gate.stats() if self._gate is not None else {}
+
+    def worker_stats(self) -> Dict[str, object]:
+        """Return FaceMesh worker round-trip counters; empty unless `inference_process=True`."""
+        return self._worker.stats() if self._worker is not None else {}
+
+    def estimator_stats(self) -> Dict[str, object]:
+        """Return PnP solve counters and fit error; empty unless `estimator="pnp"`."""
+        return self._pnp.stats() if self._pnp is not None else {}
+
+    def buffer_stats(self) -> Dict[str, int]:
+        """Return the number and size of pooled buffers and how often they were reused."""
+        return self._buffers.stats()
+
+    def timing_stats(self) -> Dict[str, object]:
+        """
+        Return the achieved frame rate and per-stage p50/p95/p99 times of
+        `next_position` (see `StageTimer.stats`); empty unless `timing=True`
+        or tracing was on when the tracker was created.
+        """
+        return self.timer.stats() if self.timer is not None else {}
+
+    def duplicate_stats(self) -> Dict[str, int]:
+        """Return how many frames were checked and how many inferences were skipped as repeats."""
+        if self._dedup is None:
+            return {"checked": 0, "skipped": 0}
+        return {"checked": self._dedup.checked, "skipped": self._dedup.repeats}
+
     def calibrate_center(self, yaw: float, pitch: float) -> None:
         """Set calibration offsets so current yaw/pitch map to screen center."""
         cx = 180.0
@@ -65,30 +618,9 @@ class HeadPoseTracker:
         self.calib_yaw = cx - yaw
         self.calib_pitch = cy - pitch
 
-    def _compute_angles(self, avg_dir: np.ndarray) -> Tuple[float, float]:
-        ref_fwd = np.array([0.0, 0.0, -1.0])
-        xz = np.array([avg_dir[0], 0.0, avg_dir[2]])
-        xz /= (np.linalg.norm(xz) + 1e-9)
-        yaw = math.degrees(math.acos(np.clip(np.dot(ref_fwd, xz), -1.0, 1.0)))
-        if avg_dir[0] < 0:
-            yaw = -yaw
-
-        yz = np.array([0.0, avg_dir[1], avg_dir[2]])
-        yz /= (np.linalg.norm(yz) + 1e-9)
-        pitch = math.degrees(math.acos(np.clip(np.dot(ref_fwd, yz), -1.0, 1.0)))
-        if avg_dir[1] > 0:
-            pitch = -pitch
-
-        if yaw < 0:
-            yaw = abs(yaw)
-        elif yaw < 180:
-            yaw = 360 - yaw
-        if pitch < 0:
-            pitch = 360 + pitch
-
-        yaw += self.calib_yaw
-        pitch += self.calib_pitch
-        return yaw, pitch
+    def _compute_angles(self, avg_dir: Tuple[float, float, float]) -> Tuple[float, float]:
+        yaw, pitch = direction_to_angles(*avg_dir)
+        return yaw + self.calib_yaw, pitch + self.calib_pitch
 
     def next_position(self, screen_w: int, screen_h: int) -> Tuple[Optional[Tuple[int, int]], np.ndarray, Optional[Tuple[float, float]]]:
         """
@@ -99,52 +631,163 @@ class HeadPoseTracker:
           - `frame` is the BGR image for optional display
           - `angles` is `(yaw, pitch)` in degrees or `None`
         """
-        if self._cap is None:
+        if self._source is None:
             raise RuntimeError("Tracker not started. Call start() first.")
-
-        ok, frame = self._cap.read()
+        if self.timer is None:
+            return self._next_position(screen_w, screen_h)
+        self.timer.start_frame()
+        result = self._next_position(screen_w, screen_h)
+        self.timer.end_frame()
+        return result
+
+    def _next_position(self, screen_w: int, screen_h: int) -> Tuple[Optional[Tuple[int, int]], np.ndarray, Optional[Tuple[float, float]]]:
+        timer = self.timer
+        if self._gate is not None:
+            delay = self._gate.throttle_delay()
+            if delay > 0:
+                time.sleep(delay)
+            if timer is not None:
+                timer.lap("throttle")
+
+        ok, frame = self._read_frame()
+        if timer is not None:
+            timer.lap("read")
         if not ok:
             return None, np.zeros((1, 1, 3), dtype=np.uint8), None
-
-        h, w, _ = frame.shape
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = self._face_mesh.process(rgb)
-
-        if not results.multi_face_landmarks:
-            return None, frame, None
-
-        lm = results.multi_face_landmarks[0].landmark
-
-        def lmk(i: int) -> np.ndarray:
-            p = lm[i]
-            return np.array([p.x * w, p.y * h, p.z * w], dtype=float)
-
-        left = lmk(self._LMK["left"])   
-        right = lmk(self._LMK["right"]) 
-        top = lmk(self._LMK["top"])     
-        bottom = lmk(self._LMK["bottom"]) 
-        front = lmk(self._LMK["front"])   
-
-        right_axis = right - left
-        right_axis /= (np.linalg.norm(right_axis) + 1e-9)
-
-        up_axis = top - bottom
-        up_axis /= (np.linalg.norm(up_axis) + 1e-9)
-
-        fwd = np.cross(right_axis, up_axis)
-        fwd /= (np.linalg.norm(fwd) + 1e-9)
-        fwd = -fwd
-
-        self._ray_dirs.append(fwd)
-        avg_dir = np.mean(self._ray_dirs, axis=0)
-        avg_dir /= (np.linalg.norm(avg_dir) + 1e-9)
+        if self._dedup is not None:
+            repeat = self._dedup.is_repeat(frame, self._last_capture_ts)
+            if timer is not None:
+                timer.lap("dedup")
+            if repeat:
+                self.landmarks = None
+                return self._cached_result(frame, screen_w, screen_h)
+        return self.process_frame(frame, screen_w, screen_h)
+
+    def process_frame(self, frame: np.ndarray, screen_w: int, screen_h: int) -> Tuple[Optional[Tuple[int, int]], np.ndarray, Optional[Tuple[float, float]]]:
+        """
+        Estimate yaw/pitch from an already captured BGR `frame` and map it to
+        screen coords. Returns `(pos, frame, angles)` like `next_position`.
+        """
+        self.landmarks = None
+        frame_time = self._frame_time if self._frame_time is not None else time.monotonic()
+        self._frame_time = None
+        if self._gate is not None:
+            infer = self._gate.should_infer(frame)
+            if self.timer is not None:
+                self.timer.lap("gate")
+            if not infer:
+                return self._cached_result(frame, screen_w, screen_h)
+
+        key_points = self._key_points(frame)
+        if self._gate is not None:
+            self._gate.report_face(key_points is not None)
+        h, w = frame.shape[:2]
+        latency = max(0.0, time.monotonic() - frame_time)
+        pos, angles = self._estimate_pose(key_points, frame_time, latency, w, h, screen_w, screen_h)
+        return pos, frame, angles
+
+    def process_landmarks(
+        self,
+        landmarks: Optional[np.ndarray],
+        frame_time: float,
+        frame_w: int,
+        frame_h: int,
+        screen_w: int,
+        screen_h: int,
+        latency_sec: Optional[float] = None,
+    ) -> Tuple[Optional[Tuple[int, int]], Optional[Tuple[float, float]]]:
+        """
+        Run only the pose stage (estimator, filter, angles, prediction) on
+        (N, 3) pixel `landmarks` captured at `frame_time` (monotonic
+        seconds) from a `frame_w` x `frame_h` frame, or None for no face.
+        Returns `(pos, angles)` like `next_position` without the frame.
+
+        `latency_sec` is the frame's capture-to-pose latency, e.g. the one
+        `LandmarkReplay` yields. Without it `pipeline_latency_sec` is left
+        as it is: the current clock says nothing about a replayed frame.
+        """
+        self.landmarks = landmarks
+        key_points = None if landmarks is None else np.take(landmarks, self._key_idx, axis=0, out=self._key_buf)
+        return self._estimate_pose(key_points, frame_time, latency_sec, frame_w, frame_h, screen_w, screen_h)
+
+    def _estimate_pose(
+        self,
+        key_points: Optional[np.ndarray],
+        frame_time: float,
+        latency: Optional[float],
+        frame_w: int,
+        frame_h: int,
+        screen_w: int,
+        screen_h: int,
+    ) -> Tuple[Optional[Tuple[int, int]], Optional[Tuple[float, float]]]:
+        if key_points is None:
+            self._last_angles = None
+            self.prediction = None
+            if self._predictor is not None:
+                self._predictor.reset()
+            if self._recorder is not None:
+                self._recorder.append(frame_time, None, None, latency)
+            return None, None
+
+        direction = None
+        if self._pnp is not None:
+            direction = self._pnp.update(key_points[5:], frame_w, frame_h)
+            # The two estimators disagree by their own biases, so averaging
+            # across a switch would make the output jump; start afresh.
+            used_pnp = direction is not None
+            if used_pnp != self._used_pnp:
+                self._filter.reset()
+                self._used_pnp = used_pnp
+        if direction is None:
+            left, right, top, bottom, _front = key_points[:5].tolist()
+            direction = forward_vector(left, right, top, bottom)
+        avg_dir = self._filter.update(direction, frame_time)
 
         yaw, pitch = self._compute_angles(avg_dir)
+        self._last_angles = (yaw, pitch)
+        if self._predictor is not None:
+            self._update_prediction(yaw, pitch, frame_time, latency, screen_w, screen_h)
+        if self._recorder is not None:
+            self._record(frame_time, key_points, (yaw, pitch), latency)
+        pos = self._map_to_screen(yaw, pitch, screen_w, screen_h)
+        if self.timer is not None:
+            self.timer.lap("pose")
+        return pos, (yaw, pitch)
+
+    def _record(self, frame_time: float, key_points: np.ndarray, angles: Tuple[float, float], latency: Optional[float]) -> None:
+        landmarks = self.landmarks
+        if landmarks is None:
+            landmarks = self._record_points
+            landmarks[self._key_idx] = key_points
+        self._recorder.append(frame_time, landmarks, angles, latency)
+
+    def _update_prediction(
+        self, yaw: float, pitch: float, frame_time: float, latency: Optional[float], screen_w: int, screen_h: int
+    ) -> None:
+        if latency is not None:
+            if self.pipeline_latency_sec == 0.0:
+                self.pipeline_latency_sec = latency
+            else:
+                self.pipeline_latency_sec += 0.2 * (latency - self.pipeline_latency_sec)
+        horizon = self.pipeline_latency_sec + self.predict_extra_sec
+        self._predictor.update(yaw, pitch, frame_time)
+        p_yaw, p_pitch = self._predictor.predict(horizon)
+        self.prediction = PosePrediction(
+            yaw=p_yaw,
+            pitch=p_pitch,
+            pos=self._map_to_screen(p_yaw, p_pitch, screen_w, screen_h),
+            horizon_sec=min(horizon, self._predictor.max_horizon_sec),
+            latency_sec=self.pipeline_latency_sec,
+        )
 
-        sx = int(((yaw - (180.0 - self.yaw_span)) / (2.0 * self.yaw_span)) * screen_w)
-        sy = int(((180.0 + self.pitch_span - pitch) / (2.0 * self.pitch_span)) * screen_h)
-
-        sx = max(0, min(screen_w - 1, sx))
-        sy = max(0, min(screen_h - 1, sy))
+    def _cached_result(self, frame: np.ndarray, screen_w: int, screen_h: int) -> Tuple[Optional[Tuple[int, int]], np.ndarray, Optional[Tuple[float, float]]]:
+        """Return the previous pose for `frame` without running inference."""
+        # The last extrapolation would keep steering past a head that has
+        # stopped (the gate skips still frames), so there is none to follow.
+        self.prediction = None
+        if self._last_angles is None:
+            return None, frame, None
+        return self._map_to_screen(*self._last_angles, screen_w, screen_h), frame, self._last_angles
 
-        return (sx, sy), frame, (yaw, pitch)
+    def _map_to_screen(self, yaw: float, pitch: float, screen_w: int, screen_h: int) -> Tuple[int, int]:
+        return map_to_screen(yaw, pitch, self.yaw_span, self.pitch_span, screen_w, screen_h)
@@ -0,0 +1,173 @@
+import multiprocessing
+import time
+from multiprocessing import shared_memory
+from typing import Any, Dict, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from .landmarks import normalized_landmarks
+
+WORKER_START_TIMEOUT_SEC = 30.0
+WORKER_RESULT_TIMEOUT_SEC = 5.0
+
+
+def _worker_main(conn, shm_name: str, slots: int, capacity: int, face_mesh_options: Dict[str, Any]) -> None:
+    """
+    Child process loop: wait for `(seq, slot, stream, shape)` requests, run
+    FaceMesh on the BGR image in that shared-memory slot and send back
+    `(seq, landmarks)` with (N, 3) float32 normalized landmarks, or None.
+    """
+    import mediapipe as mp
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    ring = np.ndarray((slots, capacity), dtype=np.uint8, buffer=shm.buf)
+    meshes: Dict[str, Any] = {}
+    rgb: Dict[str, np.ndarray] = {}
+    try:
+        conn.send("ready")
+        while True:
+            try:
+                msg = conn.recv()
+            except EOFError:
+                break
+            if msg is None:
+                break
+            seq, slot, stream, shape = msg
+            image = ring[slot, : int(np.prod(shape))].reshape(shape)
+
+            mesh = meshes.get(stream)
+            if mesh is None:
+                # One instance per stream: FaceMesh tracks between frames.
+                mesh = meshes[stream] = mp.solutions.face_mesh.FaceMesh(**face_mesh_options)
+            buf = rgb.get(stream)
+            if buf is not None and buf.shape != image.shape:
+                buf = None
+            rgb[stream] = cv2.cvtColor(image, cv2.COLOR_BGR2RGB, dst=buf)
+
+            results = mesh.process(rgb[stream])
+            landmarks = None
+            if results.multi_face_landmarks:
+                landmarks = normalized_landmarks(results.multi_face_landmarks[0])
+            conn.send((seq, landmarks))
+    finally:
+        for mesh in meshes.values():
+            mesh.close()
+        del ring
+        shm.close()
+
+
+class FaceMeshWorker:
+    """
+    Runs MediaPipe FaceMesh in a separate process.
+
+    Frames are copied into a `slots`-deep ring of shared-memory buffers, each
+    `capacity` bytes, and only the request header goes through the pipe; the
+    worker sends back normalized (N, 3) float32 landmark arrays. Inference
+    therefore neither holds this process's GIL nor blocks its other threads.
+
+    `submit()` and `collect()` allow up to `slots` requests in flight;
+    `process()` is the synchronous round trip. Each `stream` name gets its
+    own FaceMesh instance in the worker (e.g. full frames vs ROI crops).
+    """
+
+    def __init__(self, capacity: int, slots: int = 2, face_mesh_options: Optional[Dict[str, Any]] = None) -> None:
+        if slots < 1:
+            raise ValueError("FaceMeshWorker needs at least one slot")
+        self.capacity = int(capacity)
+        self.slots = int(slots)
+        self._shm = shared_memory.SharedMemory(create=True, size=self.slots * self.capacity)
+        self._ring = np.ndarray((self.slots, self.capacity), dtype=np.uint8, buffer=self._shm.buf)
+
+        # spawn, not fork: the parent may already run camera and Tk threads.
+        ctx = multiprocessing.get_context("spawn")
+        self._conn, child_conn = ctx.Pipe()
+        self._process = ctx.Process(
+            target=_worker_main,
+            args=(child_conn, self._shm.name, self.slots, self.capacity, dict(face_mesh_options or {})),
+            name="FaceMeshWorker",
+            daemon=True,
+        )
+        self._process.start()
+        child_conn.close()
+        if not self._conn.poll(WORKER_START_TIMEOUT_SEC) or self._conn.recv() != "ready":
+            self.close()
+            raise RuntimeError("FaceMesh worker process failed to start")
+
+        self._next_seq = 0
+        self._pending: Dict[int, float] = {}
+        self.completed = 0
+        self._round_trip_total = 0.0
+        self.last_round_trip: Optional[float] = None
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._pending)
+
+    def submit(self, image: np.ndarray, stream: str = "full") -> int:
+        """Copy a BGR `image` into the next free slot and queue it; returns its sequence number."""
+        if self._process is None:
+            raise RuntimeError("FaceMesh worker is closed")
+        if len(self._pending) >= self.slots:
+            raise RuntimeError("FaceMesh worker has no free slot; collect() a result first")
+        if image.nbytes > self.capacity:
+            raise RuntimeError(f"Image of {image.nbytes} bytes exceeds worker slot capacity {self.capacity}")
+        seq = self._next_seq
+        self._next_seq += 1
+        slot = seq % self.slots
+        self._ring[slot, : image.nbytes].reshape(image.shape)[...] = image
+        self._pending[seq] = time.perf_counter()
+        self._conn.send((seq, slot, stream, image.shape))
+        return seq
+
+    def collect(self, timeout: float = WORKER_RESULT_TIMEOUT_SEC) -> Tuple[int, Optional[np.ndarray]]:
+        """Wait for the oldest in-flight request and return `(seq, landmarks)`."""
+        if not self._pending:
+            raise RuntimeError("No FaceMesh request in flight")
+        if not self._conn.poll(timeout):
+            if not self._process.is_alive():
+                raise RuntimeError("FaceMesh worker process died")
+            raise RuntimeError("Timed out waiting for the FaceMesh worker")
+        try:
+            seq, landmarks = self._conn.recv()
+        except EOFError:
+            raise RuntimeError("FaceMesh worker process died")
+        self.last_round_trip = time.perf_counter() - self._pending.pop(seq)
+        self._round_trip_total += self.last_round_trip
+        self.completed += 1
+        return seq, landmarks
+
+    def process(self, image: np.ndarray, stream: str = "full") -> Optional[np.ndarray]:
+        """Run FaceMesh on `image` in the worker and return its normalized landmarks, or None."""
+        seq = self.submit(image, stream)
+        while True:
+            done, landmarks = self.collect()
+            if done == seq:
+                return landmarks
+
+    def stats(self) -> Dict[str, Any]:
+        done = self.completed
+        return {
+            "completed": done,
+            "in_flight": len(self._pending),
+            "last_round_trip_ms": None if self.last_round_trip is None else 1000.0 * self.last_round_trip,
+            "mean_round_trip_ms": 1000.0 * self._round_trip_total / done if done > 0 else None,
+        }
+
+    def close(self) -> None:
+        if self._process is not None:
+            try:
+                self._conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+            self._process.join(timeout=2.0)
+            if self._process.is_alive():
+                self._process.terminate()
+                self._process.join(timeout=1.0)
+            self._process = None
+            self._conn.close()
+        if self._shm is not None:
+            del self._ring
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
@@ -2,46 +2,43 @@
 Combined demo: control the mouse cursor with head pose + wink gestures.
 
 Requires webcam, OpenCV, MediaPipe, and the project's `cursor` and `head_track` modules.
-Press 'q' to quit, 'c' to calibrate (centers current head pose).
+Press 'q' to quit, 'c' to calibrate (centers current head pose), 't' to show
+per-stage timings.
 """
 
+import argparse
 import sys
 import threading
 import queue
 import time
 
 import cv2
-import mediapipe as mp
+import numpy as np
 
+import tracing
 from cursor import create_cursor
 from ui.settings import SettingsWindow
 from head_track import HeadPoseTracker
-
-
-def detect_wink(landmarks, left_eye_indices, right_eye_indices):
-    def eye_aspect_ratio(eye):
-        vertical_1 = ((eye[1][0] - eye[5][0])**2 + (eye[1][1] - eye[5][1])**2)**0.5
-        vertical_2 = ((eye[2][0] - eye[4][0])**2 + (eye[2][1] - eye[4][1])**2)**0.5
-        horizontal = ((eye[0][0] - eye[3][0])**2 + (eye[0][1] - eye[3][1])**2)**0.5
+from head_track.timing import draw_overlay
+
+
+def detect_wink(landmarks, frame_w, frame_h, left_eye_indices, right_eye_indices):
+    """
+    Return the eye aspect ratios (left, right) from an (N, 3) pixel landmark
+    array. Points are normalized by the frame size first so the ratios match
+    FaceMesh's normalized coordinates the thresholds were tuned on.
+    """
+    def eye_aspect_ratio(indices):
+        eye = landmarks[indices, :2] / (frame_w, frame_h)
+        vertical_1 = np.linalg.norm(eye[1] - eye[5])
+        vertical_2 = np.linalg.norm(eye[2] - eye[4])
+        horizontal = np.linalg.norm(eye[0] - eye[3])
         return (vertical_1 + vertical_2) / (2.0 * horizontal)
 
-    left_eye = [landmarks[i] for i in left_eye_indices]
-    right_eye = [landmarks[i] for i in right_eye_indices]
-
-    left_ear = eye_aspect_ratio(left_eye)
-    right_ear = eye_aspect_ratio(right_eye)
-
-    return left_ear, right_ear
+    return eye_aspect_ratio(left_eye_indices), eye_aspect_ratio(right_eye_indices)
 
 
 def run_tracking_loop(cur, tracker, stop_queue):
-    mp_face_mesh = mp.solutions.face_mesh
-    face_mesh = mp_face_mesh.FaceMesh(refine_landmarks=True)
-
-    minx, miny, maxx, maxy = cur.get_virtual_bounds()
-    screen_w = maxx - minx + 1
-    screen_h = maxy - miny + 1
-
     # Wink indices (MediaPipe face mesh)
     LEFT_EYE_INDICES = [362, 385, 387, 263, 373, 380]
     RIGHT_EYE_INDICES = [33, 160, 158, 133, 153, 144]
@@ -52,13 +49,19 @@ def run_tracking_loop(cur, tracker, stop_queue):
     CLICK_COOLDOWN = 0.6
 
     tracker.start()
-    print("Head+Wink Cursor demo running. Press 'q' to quit, 'c' to calibrate.")
+    print("Head+Wink Cursor demo running. Press 'q' to quit, 'c' to calibrate, 't' for timings.")
+    show_timing = False
 
     while True:
         if not stop_queue.empty():
             if stop_queue.get() == "QUIT":
                 break
 
+        # Cheap in-memory lookup; refreshed by the cursor on monitor hot-plug.
+        minx, miny, maxx, maxy = cur.cached_virtual_bounds()
+        screen_w = maxx - minx + 1
+        screen_h = maxy - miny + 1
+
         pos, frame, angles = tracker.next_position(screen_w, screen_h)
 
         # Move cursor towards head-derived position
@@ -68,31 +71,26 @@ def run_tracking_loop(cur, tracker, stop_queue):
             target_y = max(miny, min(maxy, raw_ty + miny))
             cur.step_towards(target_x, target_y)
 
-        # Detect winks from the same frame (if available)
-        if frame is not None and frame.size != 0:
-            rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            results = face_mesh.process(rgb)
-
-            if results.multi_face_landmarks:
-                for face_landmarks in results.multi_face_landmarks:
-                    landmarks = [(lm.x, lm.y) for lm in face_landmarks.landmark]
-                    left_ear, right_ear = detect_wink(landmarks, LEFT_EYE_INDICES, RIGHT_EYE_INDICES)
-
-                    now = time.time()
-                    if left_ear < 0.2 and right_ear > 0.3:
-                        if now - last_right_click > CLICK_COOLDOWN:
-                            cur.right_click()
-                            last_right_click = now
-                    elif right_ear < 0.2 and left_ear > 0.3:
-                        if now - last_left_click > CLICK_COOLDOWN:
-                            cur.left_click()
-                            last_left_click = now
+        # Detect winks from the landmarks the tracker found in this frame
+        if tracker.landmarks is not None:
+            frame_h, frame_w = frame.shape[:2]
+            left_ear, right_ear = detect_wink(tracker.landmarks, frame_w, frame_h, LEFT_EYE_INDICES, RIGHT_EYE_INDICES)
+
+            now = time.time()
+            if left_ear < 0.2 and right_ear > 0.3:
+                if now - last_right_click > CLICK_COOLDOWN:
+                    cur.right_click()
+                    last_right_click = now
+            elif right_ear < 0.2 and left_ear > 0.3:
+                if now - last_left_click > CLICK_COOLDOWN:
+                    cur.left_click()
+                    last_left_click = now
 
         # Overlay guidance text
         try:
             cv2.putText(
                 frame,
-                "Press 'c' to calibrate center, 'q' to quit. Wink to click.",
+                "Press 'c' to calibrate center, 't' for timings, 'q' to quit. Wink to click.",
                 (10, 30),
                 cv2.FONT_HERSHEY_SIMPLEX,
                 0.6,
@@ -101,30 +99,39 @@ def run_tracking_loop(cur, tracker, stop_queue):
             )
         except Exception:
             pass
-
+        if show_timing and tracker.timer is not None:
+            draw_overlay(frame, tracker.timer.overlay_lines())
         cv2.imshow("Head+Wink Cursor (Linux)", frame)
 
         key = cv2.waitKey(1) & 0xFF
         if key in (27, ord('q')):
             stop_queue.put("QUIT")
             break
+        if key == ord('t'):
+            show_timing = not show_timing
         if key == ord('c'):
             if angles is not None:
                 yaw, pitch = angles
                 tracker.calibrate_center(yaw, pitch)
 
     tracker.stop()
-    face_mesh.close()
     cv2.destroyAllWindows()
 
 
 def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    tracing.add_profile_argument(parser)
+    args = parser.parse_args()
+
     if not sys.platform.startswith("linux"):
         print("This demo currently supports Linux only.")
         return 1
 
+    # Started first so the tracker and cursor record from their first call.
+    if args.profile:
+        tracing.start(args.profile)
     cur = create_cursor()
-    tracker = HeadPoseTracker(yaw_span=20.0, pitch_span=10.0, smooth_len=8)
+    tracker = HeadPoseTracker(yaw_span=20.0, pitch_span=10.0, smooth_len=8, reuse_buffers=True, timing=True)
     msg_queue = queue.Queue()
 
     try:
@@ -134,18 +141,20 @@ def main():
         return 1
 
     def check_queue():
-        try:
-            msg = msg_queue.get_nowait()
-            if msg == "QUIT":
-                root.quit()
-                sys.exit(0)
-        except queue.Empty:
-            pass
-        root.after(100, check_queue)
+        with tracing.span("check_queue", cat="ui"):
+            try:
+                msg = msg_queue.get_nowait()
+                if msg == "QUIT":
+                    root.quit()
+                    sys.exit(0)
+            except queue.Empty:
+                pass
+            root.after(100, check_queue)
 
     t = threading.Thread(
         target=run_tracking_loop,
         args=(cur, tracker, msg_queue),
+        name="tracking",
         daemon=True,
     )
     t.start()
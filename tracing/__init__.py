@@ -0,0 +1,11 @@
+from .tracer import (
+    DEFAULT_TRACE_PATH,
+    Tracer,
+    add_profile_argument,
+    current,
+    enabled,
+    span,
+    start,
+    stop,
+    traced,
+)
@@ -0,0 +1,181 @@
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+DEFAULT_TRACE_PATH = "eyecursor-trace.json"
+# About 100 bytes per buffered event: an hour of a busy 30 fps session fits.
+DEFAULT_MAX_EVENTS = 2_000_000
+
+
+class Tracer:
+    """
+    Buffers spans from any thread and writes them as Chrome trace-event JSON
+    (open in chrome://tracing or https://ui.perfetto.dev).
+
+    Events are kept as tuples (name, category, start, duration, thread id,
+    args) in microseconds since the tracer started, and converted only when
+    written. Each thread is named after its `threading` name the first time
+    it records. Past `max_events`, new events are counted in `dropped`
+    instead of stored.
+    """
+
+    def __init__(self, max_events: int = DEFAULT_MAX_EVENTS) -> None:
+        self.max_events = int(max_events)
+        self._t0 = time.perf_counter()
+        self._pid = os.getpid()
+        self._events: List[Tuple[str, str, float, float, int, Optional[Dict[str, Any]]]] = []
+        self._threads: Dict[int, str] = {}
+        self._lock = threading.Lock()
+        self.dropped = 0
+
+    def complete(self, name: str, start: float, end: float, cat: str = "app", args: Optional[Dict[str, Any]] = None) -> None:
+        """Record a span from `start` to `end` (`time.perf_counter()` seconds)."""
+        if len(self._events) >= self.max_events:
+            self.dropped += 1
+            return
+        tid = threading.get_native_id()
+        if tid not in self._threads:
+            with self._lock:
+                self._threads[tid] = threading.current_thread().name
+        # list.append is atomic, so threads need no lock for the hot path.
+        self._events.append((name, cat, 1e6 * (start - self._t0), 1e6 * (end - start), tid, args))
+
+    def instant(self, name: str, cat: str = "app", args: Optional[Dict[str, Any]] = None) -> None:
+        """Record a zero-length event now."""
+        now = time.perf_counter()
+        self.complete(name, now, now, cat, args)
+
+    def trace_events(self) -> List[Dict[str, Any]]:
+        events: List[Dict[str, Any]] = [
+            {"ph": "M", "name": "process_name", "pid": self._pid, "tid": 0, "args": {"name": "EyeCursor"}}
+        ]
+        for tid, thread_name in list(self._threads.items()):
+            events.append({"ph": "M", "name": "thread_name", "pid": self._pid, "tid": tid, "args": {"name": thread_name}})
+        for name, cat, ts, dur, tid, args in list(self._events):
+            event = {"ph": "X", "name": name, "cat": cat, "ts": round(ts, 3), "dur": round(dur, 3), "pid": self._pid, "tid": tid}
+            if args:
+                event["args"] = args
+            events.append(event)
+        return events
+
+    def write(self, path: str) -> int:
+        """Write the trace to `path` and return the number of spans written."""
+        events = self.trace_events()
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        return sum(1 for e in events if e["ph"] == "X")
+
+
+class _Span:
+    __slots__ = ("_tracer", "_name", "_cat", "_args", "_start")
+
+    def __init__(self, tracer: Tracer, name: str, cat: str, args: Optional[Dict[str, Any]]) -> None:
+        self._tracer = tracer
+        self._name = name
+        self._cat = cat
+        self._args = args
+
+    def __enter__(self) -> "_Span":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._tracer.complete(self._name, self._start, time.perf_counter(), self._cat, self._args)
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+_tracer: Optional[Tracer] = None
+
+
+def enabled() -> bool:
+    return _tracer is not None
+
+
+def current() -> Optional[Tracer]:
+    """Return the active tracer, or None when tracing is off."""
+    return _tracer
+
+
+def start(path: Optional[str] = None, max_events: int = DEFAULT_MAX_EVENTS) -> Tracer:
+    """
+    Start collecting spans. With `path`, the trace is written there when
+    the interpreter exits (the apps leave through `sys.exit` from Tk).
+    """
+    global _tracer
+    _tracer = Tracer(max_events=max_events)
+    if path is not None:
+        atexit.register(_write_at_exit, _tracer, path)
+    return _tracer
+
+
+def stop() -> Optional[Tracer]:
+    """Stop collecting and return the tracer that was active, if any."""
+    global _tracer
+    tracer, _tracer = _tracer, None
+    return tracer
+
+
+def _write_at_exit(tracer: Tracer, path: str) -> None:
+    count = tracer.write(path)
+    dropped = f", {tracer.dropped} dropped" if tracer.dropped else ""
+    print(f"Trace: {count} spans written to {path}{dropped}")
+
+
+def span(name: str, cat: str = "app", **args: Any):
+    """
+    Context manager timing its block as one span. When tracing is off it
+    returns a shared no-op object, so the cost is one call and a check.
+    """
+    tracer = _tracer
+    if tracer is None:
+        return _NULL_SPAN
+    return _Span(tracer, name, cat, args or None)
+
+
+def traced(name: Optional[str] = None, cat: str = "app") -> Callable[[F], F]:
+    """Decorator recording every call of the function as a span (`name` defaults to its qualified name)."""
+
+    def decorate(fn: F) -> F:
+        label = name or fn.__qualname__
+
+        @functools.wraps(fn)
+        def wrapper(*a: Any, **kw: Any) -> Any:
+            tracer = _tracer
+            if tracer is None:
+                return fn(*a, **kw)
+            start_time = time.perf_counter()
+            try:
+                return fn(*a, **kw)
+            finally:
+                tracer.complete(label, start_time, time.perf_counter(), cat)
+
+        return wrapper
+
+    return decorate
+
+
+def add_profile_argument(parser) -> None:
+    """Add the shared `--profile [TRACE.json]` switch to an argparse parser."""
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const=DEFAULT_TRACE_PATH,
+        metavar="TRACE.json",
+        help=f"Record a Chrome trace of the tracker, cursor and UI threads (default file: {DEFAULT_TRACE_PATH})",
+    )